@@ -178,6 +178,9 @@ def load_data():
     #load in the spritesheets
     sprites.load_all()
 
+    # Finish off or throw away a save that was interrupted last time
+    game.recover_save_session()
+
     clan_list = game.read_clans()
     if clan_list:
         game.switches['clan_list'] = clan_list
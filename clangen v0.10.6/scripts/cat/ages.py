@@ -0,0 +1,42 @@
+from enum import IntEnum
+
+
+class Age(IntEnum):
+    """The age groups, in order, so checks like "younger than an adolescent" are one comparison:
+
+        cat.age_group < Age.ADOLESCENT
+
+    Cats still keep their age as a string in cat.age, since that's what's saved and what the event files use.
+    cat.age_group is None for a cat that doesn't have an age yet, so check for that before comparing.
+    """
+    NEWBORN = 0
+    KITTEN = 1
+    ADOLESCENT = 2
+    YOUNG_ADULT = 3
+    ADULT = 4
+    SENIOR_ADULT = 5
+    SENIOR = 6
+
+    @property
+    def text(self):
+        """The age as it's written in cat.age, like "young adult"."""
+        return self.name.lower().replace("_", " ")
+
+
+# cat.age: age group. "elder" is what sprites are sometimes asked for instead of "senior".
+AGE_GROUPS = {age.text: age for age in Age}
+AGE_GROUPS["elder"] = Age.SENIOR
+
+
+def build_age_table(cat_ages):
+    """
+    Works out the age for every number of moons that's in an age group, so finding a cat's age is one lookup.
+    :param cat_ages: the "cat_ages" part of game_config.json, age: [first moon, last moon]
+    :return: dict of moons: age, as the string that goes in cat.age
+    """
+    table = {}
+    for age in Age:
+        first, last = cat_ages[age.text]
+        for moons in range(first, last + 1):
+            table[moons] = age.text
+    return table
@@ -2,35 +2,58 @@ from __future__ import annotations
 from random import choice, randint, sample, random, choices, getrandbits, randrange
 from typing import Dict, List, Any
 import os.path
-import itertools
-import sys
+import threading
+from collections import OrderedDict
 
-from .history import History
+from .ages import AGE_GROUPS, Age, build_age_table
+from .history import History, history_store
 from .skills import CatSkills
 from ..housekeeping.datadir import get_save_dir
 from ..events_module.generate_events import GenerateEvents
 
 import ujson
 
-from .names import Name
+from .names import Name, name_index
+from .roster import CatIDAllocator
+from .sorting import sort_index
 from .pelts import Pelt
 from scripts.conditions import Illness, Injury, PermanentCondition, get_amount_cat_for_one_medic, \
-    medical_cats_condition_fulfilled
-import bisect
+    medical_cats_condition_fulfilled, condition_store
 
-from scripts.utility import get_med_cats, get_personality_compatibility, event_text_adjust, update_sprite, \
+from scripts.utility import get_med_cats, get_personality_compatibility, event_text_adjust, generate_sprite, \
     leader_ceremony_text_adjust
 from scripts.game_structure.game_essentials import game, screen
+from scripts.game_structure.state_lock import state_lock
+from scripts.game_structure.timeskip_profiler import timeskip_profiler
 from scripts.cat_relations.relationship import Relationship
 from scripts.game_structure import image_cache
+from scripts.game_structure.save_archive import read_save_file, save_file_exists
 from scripts.event_class import Single_Event
 from .thoughts import Thoughts
 from scripts.cat_relations.inheritance import Inheritance
 
 
 class Cat():
+    __slots__ = (
+        "ID", "_name", "_mentor", "_experience", "_moons", "_sprite", "_illnesses", "_injuries",
+        "_permanent_condition", "_status", "_dead", "_dead_for", "gender", "genderalign", "g_tag", "backstory", "age",
+        "skills", "personality", "pelt", "parent1", "parent2", "adoptive_parents", "former_mentor",
+        "patrol_with_mentor", "apprentice", "former_apprentices", "relationships", "mate", "previous_mates",
+        "pronouns", "placement", "example", "exiled", "outside", "thought", "birth_cooldown", "healed_condition",
+        "leader_death_heal", "also_got", "df", "experience_level", "no_kits", "no_mates", "no_retire",
+        "prevent_fading", "faded", "faded_offspring", "favourite", "in_camp", "specsuffix_hidden", "inheritance",
+        "generate_events", "clan", "trait", "skill", "specialty", "specialty2"
+    )
+
     dead_cats = []
     used_screen = screen
+    sprites_made = 0  # since the debug overlay last checked, see debugMode.update1
+    # cat ID -> (sprite key, sprite) for the max_kept_sprites most recently shown cats, the least recently shown
+    # first. Faded cats keep their own sprite instead. Example cats are drawn on another thread, so it's only
+    # used with sprites_lock held.
+    sprites_kept = OrderedDict()
+    sprites_lock = threading.Lock()
+    roster_snapshot = None  # see get_roster
     
     ages = [
         'newborn', 'kitten', 'adolescent', 'young adult', 'adult', 'senior adult',
@@ -45,6 +68,7 @@ class Cat():
         'senior adult': game.config["cat_ages"]["senior adult"],
         'senior': game.config["cat_ages"]["senior"]
     }
+    age_table = build_age_table(game.config["cat_ages"])  # moons: age, for every moons that's in an age group
 
     # This in is in reverse order: top of the list at the bottom
     rank_sort_order = [
@@ -60,6 +84,7 @@ class Cat():
         "deputy",
         "leader"
     ]
+    rank_sort_index = {status: i for i, status in enumerate(rank_sort_order)}
 
     gender_tags = {'female': 'F', 'male': 'M'}
 
@@ -104,7 +129,7 @@ class Cat():
 
     all_cats: Dict[str, Cat] = {}  # ID: object
     outside_cats: Dict[str, Cat] = {}  # cats outside the clan
-    id_iter = itertools.count()
+    id_allocator = CatIDAllocator()
 
     all_cats_list: List[Cat] = []
     ordered_cat_list: List[Cat] = []
@@ -131,7 +156,6 @@ class Cat():
                  ):
 
         # This must be at the top. It's a smaller list of things to init, which is only for faded cats
-        self.history = None
         if faded:
             self.ID = ID
             self.name = Name(status, prefix=prefix, suffix=suffix)
@@ -154,11 +178,9 @@ class Cat():
             if moons > 300:
                 # Out of range, always elder
                 self.age = 'senior'
-            else:
+            elif moons in self.age_table:
                 # In range
-                for key_age in self.age_moons.keys():
-                    if moons in range(self.age_moons[key_age][0], self.age_moons[key_age][1] + 1):
-                        self.age = key_age
+                self.age = self.age_table[moons]
 
             self.set_faded()  # Sets the faded sprite and faded tag (self.faded = True)
 
@@ -166,6 +188,14 @@ class Cat():
 
         self.generate_events = GenerateEvents()
 
+        # setting ID
+        if ID is None:
+            faded_cats = game.clan.faded_ids if game.clan else ()
+            self.ID = Cat.id_allocator.allocate(self.all_cats, faded_cats)
+        else:
+            self.ID = ID
+            Cat.id_allocator.reserve(ID)
+
         # Private attributes
         self._mentor = None  # plz
         self._experience = None
@@ -225,23 +255,6 @@ class Cat():
         self.specsuffix_hidden = specsuffix_hidden
         self.inheritance = None
 
-        self.history = None
-
-        # setting ID
-        if ID is None:
-            potential_id = str(next(Cat.id_iter))
-
-            if game.clan:
-                faded_cats = game.clan.faded_ids
-            else:
-                faded_cats = []
-
-            while potential_id in self.all_cats or potential_id in faded_cats:
-                potential_id = str(next(Cat.id_iter))
-            self.ID = potential_id
-        else:
-            self.ID = ID
-
         # age and status
         if status is None and moons is None:
             self.age = choice(self.ages)
@@ -252,11 +265,9 @@ class Cat():
                 self.age = 'senior'
             elif moons == 0:
                 self.age = 'newborn'
-            else:
+            elif moons in self.age_table:
                 # In range
-                for key_age in self.age_moons.keys():
-                    if moons in range(self.age_moons[key_age][0], self.age_moons[key_age][1] + 1):
-                        self.age = key_age
+                self.age = self.age_table[moons]
         else:
             if status == 'newborn':
                 self.age = 'newborn'
@@ -367,7 +378,7 @@ class Cat():
             self.name = Name(status, prefix, suffix, eyes=self.pelt.eye_colour, specsuffix_hidden=self.specsuffix_hidden,
                              load_existing_name = loading_cat)
 
-        # Private Sprite
+        # Private Sprite, only for faded cats (see sprite)
         self._sprite = None
 
         # SAVE CAT INTO ALL_CATS DICTIONARY IN CATS-CLASS
@@ -485,6 +496,7 @@ class Cat():
                 fetched_cat.update_mentor()
         self.update_mentor()
     
+    @timeskip_profiler.timed("grief")
     def grief(self, body: bool):
         """
         compiles grief moon event text
@@ -506,7 +518,6 @@ class Cat():
             if not isinstance(to_self, Relationship):
                 continue
             
-            family_relation = self.familial_grief(living_cat=cat)
             very_high_values = []
             high_values = []
             
@@ -535,6 +546,10 @@ class Cat():
             if to_self.trust > 50:
                 high_values.append("trust")
             
+            # Most cats don't feel strongly enough about the dead cat for any reaction.
+            if not (high_values or to_self.dislike > 50 or to_self.jealousy > 50):
+                continue
+            family_relation = self.familial_grief(living_cat=cat)
             
             major_chance = 0
             if very_high_values:
@@ -872,6 +887,8 @@ class Cat():
         )
 
     def load_history(self):
+        """Reads the cat's history file. Use cat.history instead, which only does this the first time it's
+            needed. Returns None if the file couldn't be read. """
         try:
             if game.switches['clan_name'] != '':
                 clanname = game.switches['clan_name']
@@ -879,13 +896,13 @@ class Cat():
                 clanname = game.switches['clan_list'][0]
         except IndexError:
             print('WARNING: History failed to load, no Clan in game.switches?')
-            return
+            return None
 
         history_directory = get_save_dir() + '/' + clanname + '/history/'
         cat_history_directory = history_directory + self.ID + '_history.json'
 
-        if not os.path.exists(cat_history_directory):
-            self.history = History(
+        if not save_file_exists(cat_history_directory):
+            return History(
                 beginning={},
                 mentor_influence={},
                 app_ceremony={},
@@ -895,48 +912,24 @@ class Cat():
                 scar_events=[],
                 murder={},
             )
-            return
         try:
-            with open(cat_history_directory, 'r') as read_file:
-                history_data = ujson.loads(read_file.read())
-                self.history = History(
-                    beginning=history_data["beginning"] if "beginning" in history_data else {},
-                    mentor_influence=history_data[
-                        'mentor_influence'] if "mentor_influence" in history_data else {},
-                    app_ceremony=history_data['app_ceremony'] if "app_ceremony" in history_data else {},
-                    lead_ceremony=history_data['lead_ceremony'] if "lead_ceremony" in history_data else None,
-                    possible_history=history_data['possible_history'] if "possible_history" in history_data else {},
-                    died_by=history_data['died_by'] if "died_by" in history_data else [],
-                    scar_events=history_data['scar_events'] if "scar_events" in history_data else [],
-                    murder=history_data['murder'] if "murder" in history_data else {},
-                )
+            history_data = ujson.loads(read_save_file(cat_history_directory))
+            return History(
+                beginning=history_data["beginning"] if "beginning" in history_data else {},
+                mentor_influence=history_data[
+                    'mentor_influence'] if "mentor_influence" in history_data else {},
+                app_ceremony=history_data['app_ceremony'] if "app_ceremony" in history_data else {},
+                lead_ceremony=history_data['lead_ceremony'] if "lead_ceremony" in history_data else None,
+                possible_history=history_data['possible_history'] if "possible_history" in history_data else {},
+                died_by=history_data['died_by'] if "died_by" in history_data else [],
+                scar_events=history_data['scar_events'] if "scar_events" in history_data else [],
+                murder=history_data['murder'] if "murder" in history_data else {},
+            )
         except:
-            self.history = None
             print(f'WARNING: There was an error reading the history file of cat #{self} or their history file was '
                   f'empty. Default history info was given. Close game without saving if you have save information '
                   f'you\'d like to preserve!')
-
-    def save_history(self, history_dir):
-        if not os.path.exists(history_dir):
-            os.makedirs(history_dir)
-
-        history_dict = History.make_dict(self)
-        try:
-            game.safe_save(history_dir + '/' + self.ID + '_history.json', history_dict)
-        except:
-            self.history = History(
-                beginning={},
-                mentor_influence={},
-                app_ceremony={},
-                lead_ceremony=None,
-                possible_history={},
-                died_by=[],
-                scar_events=[],
-                murder={},
-            )
-
-            print(f"WARNING: saving history of cat #{self.ID} didn't work")
-            
+            return None
 
     def generate_lead_ceremony(self):
         """
@@ -1367,6 +1360,7 @@ class Cat():
 
         if game.game_mode == "classic":
             return
+        condition_store.add_contact(self, relevant_relationship.cat_to)
         # handle contact with ill cat if
         if self.is_ill():
             relevant_relationship.cat_to.contact_with_ill_cat(self)
@@ -1896,60 +1890,18 @@ class Cat():
                 game.cur_events_list.append(Single_Event(text, "health", [self.ID, cat.ID]))
                 self.get_ill(illness_name)
 
-    def save_condition(self):
-        # save conditions for each cat
-        clanname = None
-        if game.switches['clan_name'] != '':
-            clanname = game.switches['clan_name']
-        elif len(game.switches['clan_name']) > 0:
-            clanname = game.switches['clan_list'][0]
-        elif game.clan is not None:
-            clanname = game.clan.name
-
-        condition_directory = get_save_dir() + '/' + clanname + '/conditions'
-        condition_file_path = condition_directory + '/' + self.ID + '_conditions.json'
-
-        if (not self.is_ill() and not self.is_injured() and not self.is_disabled()) or self.dead or self.outside:
-            if os.path.exists(condition_file_path):
-                os.remove(condition_file_path)
-            return
-
-        conditions = {}
-
-        if self.is_ill():
-            conditions["illnesses"] = self.illnesses
-
-        if self.is_injured():
-            conditions["injuries"] = self.injuries
-
-        if self.is_disabled():
-            conditions["permanent conditions"] = self.permanent_condition
-
-        game.safe_save(condition_file_path, conditions)
-
     def load_conditions(self):
-        if game.switches['clan_name'] != '':
-            clanname = game.switches['clan_name']
-        else:
-            clanname = game.switches['clan_list'][0]
-
-        condition_directory = get_save_dir() + '/' + clanname + '/conditions/'
-        condition_cat_directory = condition_directory + self.ID + '_conditions.json'
-        if not os.path.exists(condition_cat_directory):
+        """Takes the cat's conditions from the ones the condition store loaded for the Clan."""
+        conditions = condition_store.take(self.ID)
+        if not conditions:
             return
 
-        try:
-            with open(condition_cat_directory, 'r') as read_file:
-                rel_data = ujson.loads(read_file.read())
-                self.illnesses = rel_data.get("illnesses", {})
-                self.injuries = rel_data.get("injuries", {})
-                self.permanent_condition = rel_data.get("permanent conditions", {})
-
-            if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
-                self.pelt.paralyzed = True
+        self.illnesses = conditions.get("illnesses", {})
+        self.injuries = conditions.get("injuries", {})
+        self.permanent_condition = conditions.get("permanent conditions", {})
 
-        except Exception as e:
-            print(f"WARNING: There was an error reading the condition file of cat #{self}.\n", e)
+        if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
+            self.pelt.paralyzed = True
 
     # ---------------------------------------------------------------------------- #
     #                                    mentor                                    #
@@ -2058,13 +2010,10 @@ class Cat():
             There are no restrictions if the current cat already has a mate or not (this allows poly-mates).
         """
         
-        try:
-            first_cousin_mates = game.clan.clan_settings["first cousin mates"]
-        except:
-            if 'unittest' not in sys.modules:
-                raise
-                
-        
+        # The Clan's setting, if there is a Clan
+        if game.snapshot.first_cousin_mates is not None:
+            first_cousin_mates = game.snapshot.first_cousin_mates
+
         # just to be sure, check if it is not the same cat
         if self.ID == other_cat.ID:
             return False
@@ -2096,8 +2045,9 @@ class Cat():
                     return False
 
         # ff_mod edit: allows cats of any age/rank to be potential mates
-        age_restricted_ages = ["newborn", "kitten", "adolescent"]
-        if self.age in age_restricted_ages or other_cat.age in age_restricted_ages:
+        # age_group is None for a cat without an age, so it's checked with "in" rather than compared.
+        young_ages = (Age.NEWBORN, Age.KITTEN, Age.ADOLESCENT)
+        if self.age_group in young_ages or other_cat.age_group in young_ages:
             if self.age != other_cat.age:
                 return True
 
@@ -2238,6 +2188,10 @@ class Cat():
 
     def create_relationships_new_cat(self):
         """Create relationships for a new generated cat."""
+        # dead cats have no relationships
+        if self.dead:
+            return
+        new_relationships = {}
         for inter_cat in Cat.all_cats.values():
             # the inter_cat is the same as the current cat
             if inter_cat.ID == self.ID:
@@ -2246,99 +2200,92 @@ class Cat():
             if inter_cat.ID in self.relationships:
                 continue
             # if they dead (dead cats have no relationships)
-            if self.dead or inter_cat.dead:
+            if inter_cat.dead:
                 continue
             # if they are not outside of the Clan at the same time
-            if self.outside and not inter_cat.outside or not self.outside and inter_cat.outside:
+            if self.outside != inter_cat.outside:
                 continue
-            inter_cat.relationships[self.ID] = Relationship(inter_cat, self)
-            self.relationships[inter_cat.ID] = Relationship(self, inter_cat)
-
-    def init_all_relationships(self):
-        """Create Relationships to all current Clancats."""
-        for id in self.all_cats:
-            the_cat = self.all_cats.get(id)
-            if the_cat.ID is not self.ID:
-                mates = the_cat.ID in self.mate
-                are_parents = False
-                parents = False
-                siblings = False
-
-                if self.parent1 is not None and self.parent2 is not None and \
-                        the_cat.parent1 is not None and the_cat.parent2 is not None:
-                    are_parents = the_cat.ID in [self.parent1, self.parent2]
-                    parents = are_parents or self.ID in [
-                        the_cat.parent1, the_cat.parent2
-                    ]
-                    siblings = self.parent1 in [
-                        the_cat.parent1, the_cat.parent2
-                    ] or self.parent2 in [the_cat.parent1, the_cat.parent2]
-
-                related = parents or siblings
-
-                # set the different stats
-                romantic_love = 0
-                like = 0
-                dislike = 0
-                admiration = 0
-                comfortable = 0
-                jealousy = 0
-                trust = 0
-                if game.settings['random relation']:
-                    if game.clan:
-                        if the_cat == game.clan.instructor:
-                            pass
-                        elif randint(1, 20) == 1 and romantic_love < 1:
-                            dislike = randint(10, 25)
-                            jealousy = randint(5, 15)
-                            if randint(1, 30) == 1:
-                                trust = randint(1, 10)
-                        else:
-                            like = randint(0, 35)
-                            comfortable = randint(0, 25)
-                            trust = randint(0, 15)
-                            admiration = randint(0, 20)
-                            if randint(
-                                    1, 100 - like
-                            ) == 1 and self.moons > 11 and the_cat.moons > 11:
-                                romantic_love = randint(15, 30)
-                                comfortable = int(comfortable * 1.3)
-                                trust = int(trust * 1.2)
-                    else:
-                        if randint(1, 20) == 1 and romantic_love < 1:
-                            dislike = randint(10, 25)
-                            jealousy = randint(5, 15)
-                            if randint(1, 30) == 1:
-                                trust = randint(1, 10)
-                        else:
-                            like = randint(0, 35)
-                            comfortable = randint(0, 25)
-                            trust = randint(0, 15)
-                            admiration = randint(0, 20)
-                            if randint(
-                                    1, 100 - like
-                            ) == 1 and self.moons > 11 and the_cat.moons > 11:
-                                romantic_love = randint(15, 30)
-                                comfortable = int(comfortable * 1.3)
-                                trust = int(trust * 1.2)
-
-                if are_parents and like < 60:
-                    like = 60
-                if siblings and like < 30:
-                    like = 30
-
-                rel = Relationship(cat_from=self,
-                                   cat_to=the_cat,
-                                   mates=mates,
-                                   family=related,
-                                   romantic_love=romantic_love,
-                                   platonic_like=like,
-                                   dislike=dislike,
-                                   admiration=admiration,
-                                   comfortable=comfortable,
-                                   jealousy=jealousy,
-                                   trust=trust)
-                self.relationships[the_cat.ID] = rel
+            inter_cat.relationships[self.ID] = Relationship.new_unchecked(inter_cat, self)
+            new_relationships[inter_cat.ID] = Relationship.new_unchecked(self, inter_cat)
+        self.relationships.update(new_relationships)
+
+    @staticmethod
+    def get_children_index(cats):
+        """Returns {parent ID: set of IDs of their children}, for the cats that have both parents. Those are the
+            only ones init_all_relationships counts as family, so it can be made once and used for a lot of
+            cats. """
+        children_index = {}
+        for cat in cats:
+            if cat.parent1 is not None and cat.parent2 is not None:
+                children_index.setdefault(cat.parent1, set()).add(cat.ID)
+                children_index.setdefault(cat.parent2, set()).add(cat.ID)
+        return children_index
+
+    def init_all_relationships(self, children_index=None):
+        """Create Relationships to all current Clancats.
+            :param children_index: get_children_index of all the cats, if it's been made already"""
+        # Who's family is worked out once for all the cats: parents and siblings start off liking the cat
+        are_parents = set()
+        family = set()
+        siblings = set()
+        if self.parent1 is not None and self.parent2 is not None:
+            if children_index is None:
+                children_index = Cat.get_children_index(self.all_cats.values())
+            for parent_id in (self.parent1, self.parent2):
+                parent = self.all_cats.get(parent_id)
+                if parent is not None and parent.parent1 is not None and parent.parent2 is not None:
+                    are_parents.add(parent_id)
+                siblings.update(children_index.get(parent_id, ()))
+            siblings.discard(self.ID)
+            family = are_parents | siblings
+            family.update(children_index.get(self.ID, ()))
+        mates = set(self.mate)
+
+        random_relation = game.settings['random relation']
+        instructor = game.clan.instructor if game.clan else None
+        adult = self.moons > 11
+
+        new_relationships = {}
+        for the_cat in self.all_cats.values():
+            cat_id = the_cat.ID
+            if cat_id == self.ID:
+                continue
+
+            # set the different stats
+            romantic_love = 0
+            like = 0
+            dislike = 0
+            admiration = 0
+            comfortable = 0
+            jealousy = 0
+            trust = 0
+            # random() is a lot quicker than randint, and there are a few draws for every pair of cats.
+            # int(random() * n) is a whole number from 0 to n - 1, like randint(0, n - 1).
+            if random_relation and the_cat is not instructor:
+                if random() < 0.05:
+                    dislike = 10 + int(random() * 16)
+                    jealousy = 5 + int(random() * 11)
+                    if random() * 30 < 1:
+                        trust = 1 + int(random() * 10)
+                else:
+                    like = int(random() * 36)
+                    comfortable = int(random() * 26)
+                    trust = int(random() * 16)
+                    admiration = int(random() * 21)
+                    if random() * (100 - like) < 1 and adult and the_cat.moons > 11:
+                        romantic_love = 15 + int(random() * 16)
+                        comfortable = int(comfortable * 1.3)
+                        trust = int(trust * 1.2)
+
+            if cat_id in are_parents and like < 60:
+                like = 60
+            if cat_id in siblings and like < 30:
+                like = 30
+
+            new_relationships[cat_id] = Relationship.new_unchecked(self, the_cat, cat_id in mates, cat_id in family,
+                                                                   romantic_love, like, dislike, admiration,
+                                                                   comfortable, jealousy, trust)
+        self.relationships.update(new_relationships)
 
     def save_relationship_of_cat(self, relationship_dir):
         # save relationships for each cat
@@ -2373,33 +2320,33 @@ class Cat():
         relation_cat_directory = relation_directory + self.ID + '_relations.json'
 
         self.relationships = {}
-        if os.path.exists(relation_directory):
-            if not os.path.exists(relation_cat_directory):
+        if save_file_exists(relation_directory):
+            if not save_file_exists(relation_cat_directory):
                 self.init_all_relationships()
                 for cat in Cat.all_cats.values():
-                    cat.create_one_relationship(self)
+                    if cat.ID != self.ID and self.ID not in cat.relationships:
+                        cat.relationships[self.ID] = Relationship.new_unchecked(cat, self)
                 return
             try:
-                with open(relation_cat_directory, 'r') as read_file:
-                    rel_data = ujson.loads(read_file.read())
-                    for rel in rel_data:
-                        cat_to = self.all_cats.get(rel['cat_to_id'])
-                        if cat_to is None or rel['cat_to_id'] == self.ID:
-                            continue
-                        new_rel = Relationship(
-                            cat_from=self,
-                            cat_to=cat_to,
-                            mates=rel['mates'] if rel['mates'] else False,
-                            family=rel['family'] if rel['family'] else False,
-                            romantic_love=rel['romantic_love'] if rel['romantic_love'] else 0,
-                            platonic_like=rel['platonic_like'] if rel['platonic_like'] else 0,
-                            dislike=rel['dislike'] if rel['dislike'] else 0,
-                            admiration=rel['admiration'] if rel['admiration'] else 0,
-                            comfortable=rel['comfortable'] if rel['comfortable'] else 0,
-                            jealousy=rel['jealousy'] if rel['jealousy'] else 0,
-                            trust=rel['trust'] if rel['trust'] else 0,
-                            log=rel['log'])
-                        self.relationships[rel['cat_to_id']] = new_rel
+                rel_data = ujson.loads(read_save_file(relation_cat_directory))
+                for rel in rel_data:
+                    cat_to = self.all_cats.get(rel['cat_to_id'])
+                    if cat_to is None or rel['cat_to_id'] == self.ID:
+                        continue
+                    new_rel = Relationship(
+                        cat_from=self,
+                        cat_to=cat_to,
+                        mates=rel['mates'] if rel['mates'] else False,
+                        family=rel['family'] if rel['family'] else False,
+                        romantic_love=rel['romantic_love'] if rel['romantic_love'] else 0,
+                        platonic_like=rel['platonic_like'] if rel['platonic_like'] else 0,
+                        dislike=rel['dislike'] if rel['dislike'] else 0,
+                        admiration=rel['admiration'] if rel['admiration'] else 0,
+                        comfortable=rel['comfortable'] if rel['comfortable'] else 0,
+                        jealousy=rel['jealousy'] if rel['jealousy'] else 0,
+                        trust=rel['trust'] if rel['trust'] else 0,
+                        log=rel['log'])
+                    self.relationships[rel['cat_to_id']] = new_rel
             except:
                 print(f'WARNING: There was an error reading the relationship file of cat #{self}.')
 
@@ -2706,13 +2653,11 @@ class Cat():
             if game.clan == None: clan = game.switches['clan_list'][0]
             if game.clan != None: clan = game.clan.name
 
-            with open(get_save_dir() + '/' + clan + '/faded_cats/' + cat + ".json", 'r') as read_file:
-                cat_info = ujson.loads(read_file.read())
+            cat_info = ujson.loads(read_save_file(get_save_dir() + '/' + clan + '/faded_cats/' + cat + ".json"))
                                 # If loading cats is attempted before the Clan is loaded, we would need to use this.
         except AttributeError:  # NOPE, cats are always loaded before the Clan, so doesnt make sense to throw an error
-            with open(get_save_dir() + '/' + game.switches['clan_list'][0] + '/faded_cats/' + cat + ".json",
-                      'r') as read_file:
-                cat_info = ujson.loads(read_file.read())
+            cat_info = ujson.loads(read_save_file(
+                get_save_dir() + '/' + game.switches['clan_list'][0] + '/faded_cats/' + cat + ".json"))
         except:
             print("ERROR: in loading faded cat")
             return False
@@ -2737,81 +2682,109 @@ class Cat():
 
     @staticmethod
     def sort_cats(given_list=[]):
+        """Sorts the given list of cats by the current sort type, or all_cats_list if none is given. The sort keys
+            are cached in sort_index, and all_cats_list is copied from an order that's kept sorted. """
+        if game.sort_type not in sort_index.sort_types:
+            return
+        if state_lock.is_changing():
+            # sort_index and all_cats_list are being changed by the work thread, so the given list is sorted
+            # without the cached keys.
+            given_list.sort(key=lambda cat: cat.get_sort_key(game.sort_type))
+            return
         if not given_list:
             given_list = Cat.all_cats_list
-        if game.sort_type == "age":
-            given_list.sort(key=lambda x: Cat.get_adjusted_age(x))
-        elif game.sort_type == "reverse_age":
-            given_list.sort(key=lambda x: Cat.get_adjusted_age(x), reverse=True)
-        elif game.sort_type == "id":
-            given_list.sort(key=lambda x: int(x.ID))
-        elif game.sort_type == "reverse_id":
-            given_list.sort(key=lambda x: int(x.ID), reverse=True)
-        elif game.sort_type == "rank":
-            given_list.sort(key=lambda x: (Cat.rank_order(x), Cat.get_adjusted_age(x)), reverse=True)
-        elif game.sort_type == "exp":
-            given_list.sort(key=lambda x: x.experience, reverse=True)
-        elif game.sort_type == "death":
-            given_list.sort(key=lambda x: -1 * int(x.dead_for))
 
-        return
+        # If cats were taken out of all_cats_list without going through remove_cat, fall back on sorting it.
+        if given_list is Cat.all_cats_list and len(given_list) == len(sort_index.cats):
+            given_list[:] = sort_index.get_sorted(game.sort_type)
+        else:
+            sort_index.sort(given_list, game.sort_type)
 
     @staticmethod
     def insert_cat(c: Cat):
-        try:
-            if game.sort_type == "age":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: Cat.get_adjusted_age(x))
-            elif game.sort_type == "reverse_age":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: -1 * Cat.get_adjusted_age(x))
-            elif game.sort_type == "rank":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: (-1 * Cat.rank_order(x), -1 *
-                                                                   Cat.get_adjusted_age(x)))
-            elif game.sort_type == "exp":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: x.experience)
-            elif game.sort_type == "id":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: int(x.ID))
-            elif game.sort_type == "reverse_id":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: -1 * int(x.ID))
-            elif game.sort_type == "death":
-                bisect.insort(Cat.all_cats_list, c, key=lambda x: -1 * int(x.dead_for))
-        except (TypeError, NameError):
-            # If you are using python 3.8, key is not a supported parameter into insort. Therefore, we'll need to
-            # do the slower option of adding the cat, then resorting
+        position = sort_index.add(c, game.sort_type)
+        if position is None:
             Cat.all_cats_list.append(c)
-            Cat.sort_cats()
+        else:
+            Cat.all_cats_list.insert(position, c)
 
     @staticmethod
     def rank_order(cat: Cat):
-        if cat.status in Cat.rank_sort_order:
-            return Cat.rank_sort_order.index(cat.status)
-        else:
-            return 0
+        return Cat.rank_sort_index.get(cat.status, 0)
 
     @staticmethod
-    def get_adjusted_age(cat: Cat):
+    def get_adjusted_age(cat: Cat, sort_type=None):
         """Returns the moons + dead_for moons rather than the moons at death for dead cats, so dead cats are sorted by
         total age, rather than age at death"""
+        if sort_type is None:
+            sort_type = game.sort_type
         if cat.dead:
-            if game.config["sorting"]["sort_rank_by_death"]:
-                if game.sort_type == "rank":
+            settings = game.snapshot
+            if settings.sort_rank_by_death:
+                if sort_type == "rank":
                     return cat.dead_for
                 else:
-                    if game.config["sorting"]["sort_dead_by_total_age"]:
+                    if settings.sort_dead_by_total_age:
                         return cat.dead_for + cat.moons
                     else:
                         return cat.moons
             else:
-                if game.config["sorting"]["sort_dead_by_total_age"]:
+                if settings.sort_dead_by_total_age:
                     return cat.dead_for + cat.moons
                 else:
                     return cat.moons
         else:
             return cat.moons
+
+    def get_sort_key(self, sort_type):
+        """Returns what the cat is sorted by for the given sort type, lowest first. This is cached by sort_index, so
+            anything this uses needs to mark the cat as dirty when it changes."""
+        if sort_type == "age":
+            return Cat.get_adjusted_age(self, sort_type)
+        elif sort_type == "reverse_age":
+            return -Cat.get_adjusted_age(self, sort_type)
+        elif sort_type == "id":
+            return int(self.ID)
+        elif sort_type == "reverse_id":
+            return -int(self.ID)
+        elif sort_type == "rank":
+            return -Cat.rank_order(self), -Cat.get_adjusted_age(self, sort_type)
+        elif sort_type == "exp":
+            return -(self.experience or 0)
+        elif sort_type == "death":
+            return -int(self.dead_for)
         
     # ---------------------------------------------------------------------------- #
     #                                  properties                                  #
     # ---------------------------------------------------------------------------- #
 
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status: str):
+        self._status = status
+        sort_index.mark_dirty(self.ID)
+
+    @property
+    def dead(self):
+        return self._dead
+
+    @dead.setter
+    def dead(self, dead: bool):
+        self._dead = dead
+        sort_index.mark_dirty(self.ID)
+
+    @property
+    def dead_for(self):
+        return self._dead_for
+
+    @dead_for.setter
+    def dead_for(self, dead_for: int):
+        self._dead_for = dead_for
+        sort_index.mark_dirty(self.ID)
+
     @property
     def experience(self):
         return self._experience
@@ -2821,12 +2794,56 @@ class Cat():
         if exp > self.experience_levels_range["master"][1]:
             exp = self.experience_levels_range["master"][1]
         self._experience = int(exp)
+        sort_index.mark_dirty(self.ID)
 
         for x in self.experience_levels_range:
             if self.experience_levels_range[x][0] <= exp <= self.experience_levels_range[x][1]:
                 self.experience_level = x
                 break
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, new_name: Name):
+        """Ties the name to this cat, so the name search index knows when it changes."""
+        self._name = new_name
+        new_name.cat_id = self.ID
+        name_index.mark_dirty(self.ID)
+
+    @property
+    def illnesses(self):
+        return self._illnesses
+
+    @illnesses.setter
+    def illnesses(self, illnesses: dict):
+        self._illnesses = condition_store.make_dict(self, "illnesses", illnesses)
+
+    @property
+    def injuries(self):
+        return self._injuries
+
+    @injuries.setter
+    def injuries(self, injuries: dict):
+        self._injuries = condition_store.make_dict(self, "injuries", injuries)
+
+    @property
+    def permanent_condition(self):
+        return self._permanent_condition
+
+    @permanent_condition.setter
+    def permanent_condition(self, permanent_condition: dict):
+        self._permanent_condition = condition_store.make_dict(self, "permanent conditions", permanent_condition)
+
+    @property
+    def history(self):
+        return history_store.get(self)
+
+    @history.setter
+    def history(self, history):
+        history_store.set(self.ID, history)
+
     @property
     def moons(self):
         return self._moons
@@ -2834,34 +2851,106 @@ class Cat():
     @moons.setter
     def moons(self, value: int):
         self._moons = value
-        
-        updated_age = False
-        for key_age in self.age_moons.keys():
-            if self._moons in range(self.age_moons[key_age][0], self.age_moons[key_age][1] + 1):
-                updated_age = True
-                self.age = key_age
+        sort_index.mark_dirty(self.ID)
+
+        age = self.age_table.get(value)
+        if age is not None:
+            self.age = age
+            return
         try:
-            if not updated_age and self.age is not None:
+            if self.age is not None:
                 self.age = "senior"
         except AttributeError:
             print("ERROR: cat has no age attribute! Cat ID: " + self.ID)
+
+    @property
+    def age_group(self):
+        """The cat's age as an Age, for comparing ages. None if the cat doesn't have an age yet."""
+        return AGE_GROUPS.get(self.age)
         
+    def get_sprite_key(self):
+        """Everything the sprite depends on. The pelt counts every change to it in its version, the rest is
+            checked here. """
+        settings = game.snapshot
+        return (self.pelt.version, tuple(self.pelt.scars), self.age, self.dead, self.df, self.not_working(),
+                self.prevent_fading, settings.shaders, settings.fading)
+
     @property
     def sprite(self):
-        # Update the sprite
-        update_sprite(self)
-        return self._sprite
+        # Faded cats have a set sprite, that can't be made again.
+        if self.faded:
+            return self._sprite
+        # Only make the sprite again if something it depends on changed since it was last made.
+        sprite_key = self.get_sprite_key()
+        with Cat.sprites_lock:
+            kept = Cat.sprites_kept.get(self.ID)
+            if kept is not None and kept[0] == sprite_key:
+                Cat.sprites_kept.move_to_end(self.ID)
+                return kept[1]
+
+        # Made without the lock, it takes a while
+        sprite = generate_sprite(self)
+        with Cat.sprites_lock:
+            Cat.sprites_made += 1
+            Cat.sprites_kept[self.ID] = (sprite_key, sprite)
+            Cat.sprites_kept.move_to_end(self.ID)
+            while len(Cat.sprites_kept) > game.config["cat_sprites"]["max_kept_sprites"]:
+                Cat.sprites_kept.popitem(last=False)
+        return sprite
 
     @sprite.setter
     def sprite(self, new_sprite):
+        # Only faded cats have their sprite set. Setting it to None makes it again the next time it's asked for.
         self._sprite = new_sprite
+        Cat.forget_sprite(self.ID)
+
+    @staticmethod
+    def forget_sprite(cat_id):
+        """Lets go of the cat's kept sprite, for cats that are taken out of the game."""
+        with Cat.sprites_lock:
+            Cat.sprites_kept.pop(cat_id, None)
+
+    @staticmethod
+    def release_sprites():
+        """Lets go of every cat's sprite. The sprite is made again whenever it's asked for. Faded cats keep theirs,
+            since it can't be made again. Only the most recently shown sprites are kept anyway (see
+            max_kept_sprites), so this is only needed to free the memory right away. """
+        with Cat.sprites_lock:
+            Cat.sprites_kept.clear()
+
+    @staticmethod
+    def get_roster():
+        """Every cat in all_cats_list, as a tuple that's safe to go through on the UI thread. While a timeskip or
+            other work is changing the cats on another thread, this is the cats as they were before it started
+            (see state_lock), otherwise it's the cats as they are now. Only the list is a copy, the cats in it are
+            the ones the work is changing. """
+        # Read before checking the lock, since the copy is let go of as soon as the work is done.
+        snapshot = Cat.roster_snapshot
+        if snapshot is not None and state_lock.is_changing():
+            return snapshot
+        return tuple(Cat.all_cats_list)
+
+    @staticmethod
+    def get_roster_cats(cat_ids):
+        """The cats from get_roster with these IDs, like the Clan's clan_cats, in the same order. IDs of cats
+            that aren't in the roster are skipped. """
+        roster = {cat.ID: cat for cat in Cat.get_roster()}
+        return [roster[cat_id] for cat_id in list(cat_ids) if cat_id in roster]
+
+    @staticmethod
+    def take_roster_snapshot():
+        Cat.roster_snapshot = tuple(Cat.all_cats_list)
+
+    @staticmethod
+    def release_roster_snapshot():
+        Cat.roster_snapshot = None
         
     # ---------------------------------------------------------------------------- #
     #                                  other                                       #
     # ---------------------------------------------------------------------------- #
     
     def is_baby(self):
-        return self.age in ["kitten", "newborn"]
+        return self.age_group in (Age.NEWBORN, Age.KITTEN)
     
     def get_save_dict(self, faded=False):
         if faded:
@@ -2955,6 +3044,8 @@ class Cat():
 
 class Personality():
     """Hold personality information for a cat, and functions to deal with it """
+    __slots__ = ("_law", "_social", "_aggress", "_stable", "trait", "kit")
+
     facet_types = ["lawfulness", "sociability", "aggression", "stability"]
     facet_range = [0, 16]
     
@@ -3193,29 +3284,33 @@ class Personality():
             return None
 
 # Twelve example cats
-def create_example_cats():
+def make_example_cats():
+    """Makes the twelve cats to choose from when making a new Clan, and returns them as a list."""
     e = sample(range(12), 3)
     not_allowed = ['NOPAW', 'NOTAIL', 'HALFTAIL', 'NOEAR', 'BOTHBLIND', 'RIGHTBLIND', 'LEFTBLIND', 'BRIGHTHEART',
                    'NOLEFTEAR', 'NORIGHTEAR', 'MANLEG']
+    example_cats = []
     for a in range(12):
         if a in e:
-            game.choose_cats[a] = Cat(status='warrior', biome=None)
+            example_cat = Cat(status='warrior', biome=None)
         else:
-            game.choose_cats[a] = Cat(status=choice(
+            example_cat = Cat(status=choice(
                 ['kitten', 'apprentice', 'warrior', 'warrior', 'elder']), biome=None)
-        if game.choose_cats[a].moons >= 160:
-            game.choose_cats[a].moons = choice(range(120, 155))
-        elif game.choose_cats[a].moons == 0:
-            game.choose_cats[a].moons = choice([1, 2, 3, 4, 5])
-        for scar in game.choose_cats[a].pelt.scars:
+        if example_cat.moons >= 160:
+            example_cat.moons = choice(range(120, 155))
+        elif example_cat.moons == 0:
+            example_cat.moons = choice([1, 2, 3, 4, 5])
+        for scar in example_cat.pelt.scars:
             if scar in not_allowed:
-                game.choose_cats[a].pelt.scars.remove(scar)
-    
-        #update_sprite(game.choose_cats[a])
-    
+                example_cat.pelt.scars.remove(scar)
+        example_cats.append(example_cat)
+    return example_cats
+
 
 # CAT CLASS ITEMS
 cat_class = Cat(example=True)
+state_lock.before_write.append(Cat.take_roster_snapshot)
+state_lock.after_write.append(Cat.release_roster_snapshot)
 game.cat_class = cat_class
 
 # ---------------------------------------------------------------------------- #
@@ -0,0 +1,93 @@
+"""
+The cats to choose from when making a new Clan. Making twelve cats and drawing their sprites takes long enough to
+notice, so while the player is choosing, more batches are made in the background. A reroll takes the next batch
+that's ready and the pool fills up again behind it.
+
+Cats add themselves to Cat.all_cats and the indexes when they're made, so a batch is made, and taken out of the
+game again, with the state lock held for writing, like any other work off the UI thread (see state_lock). The
+pool still has to be stopped before anything else goes through all the cats (see MakeClanScreen.save_clan).
+"""
+import queue
+import threading
+
+from scripts.cat.cats import Cat, make_example_cats
+from scripts.cat.names import name_index
+from scripts.cat.sorting import sort_index
+from scripts.conditions import condition_store
+from scripts.game_structure.state_lock import state_lock
+
+
+class ExampleCatPool():
+
+    def __init__(self, size=2):
+        self.size = size  # how many batches to keep ready
+        self.batches = queue.Queue()
+        self.running = False
+        self.thread = None
+
+    def make_batch(self):
+        with state_lock.writing():
+            batch = make_example_cats()
+            for cat in batch:
+                # Asking for the sprite makes it, so it doesn't have to be made when the cats are shown.
+                _ = cat.sprite
+        return batch
+
+    def start(self):
+        """Starts filling up the pool in the background, if it isn't already."""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._fill, daemon=True)
+        self.thread.start()
+
+    def _fill(self):
+        while self.running and self.batches.qsize() < self.size:
+            batch = self.make_batch()
+            if not self.running:
+                remove_example_cats(batch)
+                return
+            self.batches.put(batch)
+
+    def take(self):
+        """Returns a batch of twelve cats with their sprites made. If there isn't one ready, this waits for the one
+            that's being made in the background, or makes one now if none is."""
+        batch = None
+        while batch is None and self.thread is not None and self.thread.is_alive():
+            # Only one batch can be made at a time anyway, so making another one here would just wait for the lock
+            # and then take as long again.
+            try:
+                batch = self.batches.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        if batch is None:
+            try:
+                batch = self.batches.get_nowait()
+            except queue.Empty:
+                batch = self.make_batch()
+        self.start()
+        return batch
+
+    def stop(self):
+        """Stops making cats and takes the ones that were made but never shown out of the game again."""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        while not self.batches.empty():
+            remove_example_cats(self.batches.get_nowait())
+
+
+def remove_example_cats(cats):
+    with state_lock.writing():
+        for cat in cats:
+            Cat.all_cats.pop(cat.ID, None)
+            if cat in Cat.all_cats_list:
+                Cat.all_cats_list.remove(cat)
+            name_index.remove(cat.ID)
+            sort_index.remove(cat.ID)
+            condition_store.remove(cat.ID)
+            Cat.forget_sprite(cat.ID)
+
+
+example_cat_pool = ExampleCatPool()
@@ -1,6 +1,10 @@
 import random
+from collections import OrderedDict
+
+import ujson
 
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.save_session import SaveSession
 from scripts.cat.skills import SkillPath
 
 
@@ -124,23 +128,26 @@ class History:
     def check_load(cat):
         """
         this checks if the cat's history has been loaded and loads it if False
+        cat.history loads itself from the history store when it's used, so this only makes sure it's in the cache
         :param cat: cat object
         :return:
         """
-        if not cat.history:
-            cat.load_history()
+        history_store.get(cat)
 
     @staticmethod
     def make_dict(cat):
+        return cat.history.to_dict()
+
+    def to_dict(self):
         history_dict = {
-            "beginning": cat.history.beginning,
-            "mentor_influence": cat.history.mentor_influence,
-            "app_ceremony": cat.history.app_ceremony,
-            "lead_ceremony": cat.history.lead_ceremony,
-            "possible_history": cat.history.possible_history,
-            "died_by": cat.history.died_by,
-            "scar_events": cat.history.scar_events,
-            "murder": cat.history.murder,
+            "beginning": self.beginning,
+            "mentor_influence": self.mentor_influence,
+            "app_ceremony": self.app_ceremony,
+            "lead_ceremony": self.lead_ceremony,
+            "possible_history": self.possible_history,
+            "died_by": self.died_by,
+            "scar_events": self.scar_events,
+            "murder": self.murder,
         }
         return history_dict
 
@@ -665,3 +672,105 @@ class History:
                 murder_history["revelation_text"] = murder_history["revelation_text"].replace('[victim]', str(victim.name))
                 murder_history["revelation_text"] = murder_history["revelation_text"].replace('[discoverer]', str(other_cat.name))
                 victim_history["revelation_text"] = victim_history["revelation_text"].replace('[discoverer]', str(other_cat.name))
+
+
+class HistoryStore():
+    """
+    Holds the histories of the cats. A cat's history is only read from their history file the first time it's used,
+    and only the most recently used histories are kept around. Histories that have been changed are never dropped
+    before they are saved, and saving only writes the ones that changed since they were loaded or last saved.
+    """
+
+    def __init__(self, max_cached=200):
+        self.max_cached = max_cached
+        # cat ID -> History, least recently used first
+        self.cache = OrderedDict()
+        # cat ID -> the history as it is in the cat's history file, as the json string it was saved as
+        self.saved = {}
+
+    @staticmethod
+    def _dump(history):
+        return ujson.dumps(history.to_dict(), indent=4)
+
+    def get(self, cat):
+        """
+        returns the cat's history, loading it if it isn't loaded yet
+        :param cat: cat object
+        """
+        history = self.cache.get(cat.ID)
+        if history is not None:
+            self.cache.move_to_end(cat.ID)
+            return history
+
+        history = cat.load_history()
+        if history is None:
+            # The file couldn't be read. Don't save over it unless something is actually added.
+            history = History()
+        self.cache[cat.ID] = history
+        self.saved[cat.ID] = self._dump(history)
+        self._drop_oldest()
+        return history
+
+    def set(self, cat_id, history):
+        """
+        replaces the cat's history. None drops it from the store, so it's loaded again the next time it's needed
+        """
+        if history is None:
+            self.cache.pop(cat_id, None)
+            self.saved.pop(cat_id, None)
+            return
+        self.cache[cat_id] = history
+        self.cache.move_to_end(cat_id)
+
+    def is_changed(self, cat_id):
+        history = self.cache.get(cat_id)
+        return history is not None and self._dump(history) != self.saved.get(cat_id)
+
+    def _drop_oldest(self):
+        """Drops the least recently used history, if there are too many and it can be dropped. If it has unsaved
+            changes, it's moved to the back instead, so this never costs more than one check. """
+        if len(self.cache) <= self.max_cached:
+            return
+        cat_id = next(iter(self.cache))
+        if self.is_changed(cat_id):
+            self.cache.move_to_end(cat_id)
+        else:
+            self.set(cat_id, None)
+
+    def save(self, history_dir):
+        """
+        saves every history that changed, then trims the store back down to size
+        :param history_dir: the Clan's history folder
+        """
+        written = {}
+        for cat_id, history in self.cache.items():
+            data = self._dump(history)
+            if data == self.saved.get(cat_id):
+                continue
+            try:
+                game.safe_save(history_dir + '/' + cat_id + '_history.json', data)
+                written[cat_id] = data
+            except Exception:
+                print(f"WARNING: saving history of cat #{cat_id} didn't work")
+
+        def mark_saved():
+            for cat_id, data in written.items():
+                if cat_id in self.cache:
+                    self.saved[cat_id] = data
+            # Everything is saved now, so anything can go.
+            while len(self.cache) > self.max_cached:
+                self.set(next(iter(self.cache)), None)
+
+        # In a save session, nothing is really saved until the session is.
+        if SaveSession.active is not None:
+            SaveSession.active.on_commit(mark_saved)
+        else:
+            mark_saved()
+
+    def clear(self):
+        self.cache.clear()
+        self.saved.clear()
+
+
+history_store = HistoryStore()
+game.history_store = history_store
@@ -8,6 +8,8 @@ from scripts.game_structure.game_essentials import game
 
 
 class Name():
+    __slots__ = ("_prefix", "_suffix", "_status", "_specsuffix_hidden", "_full_name", "cat_id")
+
     if os.path.exists('resources/dicts/names/names.json'):
         with open('resources/dicts/names/names.json') as read_file:
             names_dict = ujson.loads(read_file.read())
@@ -66,6 +68,10 @@ class Name():
                  specsuffix_hidden=False,
                  load_existing_name=False
                  ):
+        # ID of the cat this name belongs to. This is set by the cat, and used to keep the search index up to date.
+        self.cat_id = None
+        self._full_name = None
+
         self.status = status
         self.prefix = prefix
         self.suffix = suffix
@@ -173,7 +179,59 @@ class Name():
             else:
                 self.suffix = random.choice(self.names_dict["normal_suffixes"])
 
+    # ---------------------------------------------------------------------------- #
+    #                                  properties                                  #
+    # ---------------------------------------------------------------------------- #
+
+    # Anything that changes the full name clears the cached full name, and lets the search index know.
+
+    @property
+    def prefix(self):
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, new_prefix):
+        self._prefix = new_prefix
+        self._name_changed()
+
+    @property
+    def suffix(self):
+        return self._suffix
+
+    @suffix.setter
+    def suffix(self, new_suffix):
+        self._suffix = new_suffix
+        self._name_changed()
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, new_status):
+        self._status = new_status
+        self._name_changed()
+
+    @property
+    def specsuffix_hidden(self):
+        return self._specsuffix_hidden
+
+    @specsuffix_hidden.setter
+    def specsuffix_hidden(self, hidden):
+        self._specsuffix_hidden = hidden
+        self._name_changed()
+
+    def _name_changed(self):
+        self._full_name = None
+        if self.cat_id is not None:
+            name_index.mark_dirty(self.cat_id)
+
     def __repr__(self):
+        if self._full_name is None:
+            self._full_name = self._build_full_name()
+        return self._full_name
+
+    def _build_full_name(self):
         # Handles predefined suffixes (such as newborns being kit), then suffixes based on ages (fixes #2004, just trust me)
         if self.status in self.names_dict["special_suffixes"] and not self.specsuffix_hidden:
             return self.prefix + self.names_dict["special_suffixes"][self.status]
@@ -182,4 +240,86 @@ class Name():
         return self.prefix + self.suffix
 
 
+class NameSearchIndex():
+    """Search index over the full names of cats, used by the name search bars.
+
+    It holds the lowercase full name of every cat it has seen, and a trigram index over those names. Names are only
+    rebuilt when they change (a Name marks its cat as dirty when its prefix, suffix, status or special suffix
+    setting changes), so a search doesn't need to rebuild every cat's name on every keystroke. Searches are
+    still plain "is this text anywhere in the name" searches, same as before.
+    """
+
+    def __init__(self):
+        self.names = {}  # cat ID: lowercase full name
+        self.trigrams = {}  # trigram: set of cat IDs whose name contains it
+        self.dirty = set()  # IDs of indexed cats whose name has changed since they were indexed
+        self._last_search = None  # (search text, IDs that matched), for search-as-you-type
+
+    def mark_dirty(self, cat_id):
+        """Called when a cat's name changes. Cats that aren't indexed yet will be indexed when they are searched."""
+        if cat_id in self.names:
+            self.dirty.add(cat_id)
+            self._last_search = None
+
+    def remove(self, cat_id):
+        """Removes a cat from the index, for cats that are removed from the game."""
+        if cat_id not in self.names:
+            return
+        for trigram in self._get_trigrams(self.names.pop(cat_id)):
+            self.trigrams[trigram].discard(cat_id)
+        self.dirty.discard(cat_id)
+        self._last_search = None
+
+    def clear(self):
+        self.names.clear()
+        self.trigrams.clear()
+        self.dirty.clear()
+        self._last_search = None
+
+    def _index_cat(self, cat):
+        self.remove(cat.ID)
+        full_name = str(cat.name).lower()
+        self.names[cat.ID] = full_name
+        for trigram in self._get_trigrams(full_name):
+            self.trigrams.setdefault(trigram, set()).add(cat.ID)
+        self._last_search = None
+
+    def update(self, cats):
+        """Makes sure the given cats are indexed with their current names."""
+        for cat in cats:
+            if cat.ID not in self.names or cat.ID in self.dirty:
+                self._index_cat(cat)
+
+    def matching_ids(self, search_text):
+        """Returns the set of IDs of indexed cats whose name contains search_text. Only call this once update has
+            been run on the cats you are searching through. """
+        search_text = search_text.strip().lower()
+
+        # When the user is typing, each search contains the last one, so it can only match fewer cats.
+        if self._last_search and self._last_search[0] in search_text:
+            candidates = self._last_search[1]
+        elif len(search_text) >= 3:
+            trigram_sets = sorted((self.trigrams.get(t, set()) for t in self._get_trigrams(search_text)), key=len)
+            candidates = trigram_sets[0].intersection(*trigram_sets[1:])
+        else:
+            candidates = self.names.keys()
+
+        matches = {cat_id for cat_id in candidates if search_text in self.names[cat_id]}
+        self._last_search = (search_text, matches)
+        return matches
+
+    def search(self, items, search_text, get_cat=None):
+        """Returns the items whose cat's name contains search_text, in the same order as they were given.
+            get_cat can be used to search through things that hold a cat, like relationships. """
+        cats = [get_cat(i) for i in items] if get_cat else items
+        self.update(cats)
+        matches = self.matching_ids(search_text)
+        return [item for item, cat in zip(items, cats) if cat.ID in matches]
+
+    @staticmethod
+    def _get_trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+name_index = NameSearchIndex()
 names = Name()
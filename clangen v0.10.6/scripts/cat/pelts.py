@@ -8,7 +8,12 @@ from scripts.game_structure.game_essentials import game
     
 
 class Pelt():
-    
+    __slots__ = (
+        "name", "length", "colour", "white_patches", "eye_colour", "eye_colour2", "tortiebase", "pattern",
+        "tortiepattern", "tortiecolour", "vitiligo", "points", "accessory", "paralyzed", "opacity", "scars", "tint",
+        "white_patches_tint", "cat_sprites", "reverse", "skin", "version"
+    )
+
     sprites_names = {
         "SingleColour": 'single',
         'TwoColour': 'single',
@@ -162,6 +167,7 @@ class Pelt():
                  para_adult_sprite:int=None,
                  reverse:bool=False,
                  ) -> None:
+        self.version = 0
         self.name = name
         self.colour = colour
         self.white_patches = white_patches
@@ -197,6 +203,12 @@ class Pelt():
         self.reverse = reverse
         self.skin = skin
 
+    def __setattr__(self, name, value):
+        # Every change counts up the version, so cats know when their sprite needs to be made again.
+        object.__setattr__(self, name, value)
+        if name != "version":
+            object.__setattr__(self, "version", getattr(self, "version", 0) + 1)
+
     @staticmethod
     def generate_new_pelt(gender:str, parents:tuple=(), age:str="adult"):
         new_pelt = Pelt()
@@ -0,0 +1,92 @@
+class CatGroup():
+    """A list of cat IDs, like the Clan's clan_cats or faded_ids, that can also tell if an ID is in it without
+    going through the whole list. It works like a list that can't have the same ID twice: it keeps the order the
+    IDs were added in, so it's saved the same way as the lists it replaced.
+
+    The IDs are the keys of a dict, which keeps them in order and makes adding, removing and "in" checks O(1).
+    Indexing makes a list, so it's O(n), but nothing does that in a loop.
+    """
+
+    def __init__(self, ids=()):
+        self._ids = dict.fromkeys(ids)
+
+    def append(self, cat_id):
+        """Adds the ID at the end, if it's not in the group already."""
+        self._ids[cat_id] = None
+
+    def extend(self, ids):
+        for cat_id in ids:
+            self._ids[cat_id] = None
+
+    def remove(self, cat_id):
+        """Removes the ID. Raises ValueError if it isn't in the group, like list.remove."""
+        try:
+            del self._ids[cat_id]
+        except KeyError:
+            raise ValueError(f"{cat_id} is not in the group") from None
+
+    def discard(self, cat_id):
+        """Removes the ID if it's in the group."""
+        self._ids.pop(cat_id, None)
+
+    def clear(self):
+        self._ids.clear()
+
+    def copy(self):
+        return CatGroup(self._ids)
+
+    def __contains__(self, cat_id):
+        return cat_id in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __reversed__(self):
+        return reversed(list(self._ids))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        return list(self._ids)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, CatGroup):
+            other = list(other)
+        return list(self._ids) == other
+
+    def __repr__(self):
+        return f"CatGroup({list(self._ids)})"
+
+
+class CatIDAllocator():
+    """Hands out the IDs of new cats. IDs only ever go up, from the highest ID the Clan has used, which is saved
+    with the Clan, so a new cat never gets the ID of a cat that's faded or was removed. Cats that are made with
+    an ID they already have (loaded from the save) are passed to reserve, so their IDs are never given out again.
+    """
+
+    def __init__(self):
+        self.next_id = 0
+
+    def allocate(self, *taken):
+        """Returns a new ID as a string. IDs that are in any of taken (dicts, sets, CatGroups) are skipped, in
+            case a cat was made with an ID that was never reserved."""
+        while True:
+            cat_id = str(self.next_id)
+            self.next_id += 1
+            if not any(cat_id in group for group in taken):
+                return cat_id
+
+    def reserve(self, cat_id):
+        """Makes sure an ID that's in use is never handed out. IDs that aren't numbers can't clash, so they're
+            ignored."""
+        try:
+            cat_id = int(cat_id)
+        except (TypeError, ValueError):
+            return
+        if cat_id >= self.next_id:
+            self.next_id = cat_id + 1
+
+    def skip_to(self, next_id):
+        """Sets the next ID that's handed out, unless IDs past it are already in use."""
+        self.next_id = max(self.next_id, int(next_id))
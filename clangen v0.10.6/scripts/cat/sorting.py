@@ -0,0 +1,118 @@
+from bisect import bisect_left, insort
+
+
+class CatSortIndex():
+    """Keeps the cats in order for every sort type of the cat lists, so they don't need a full sort every time.
+
+    Every cat's sort key is worked out once per sort type (see Cat.get_sort_key) and cached. Keys only change
+    when a cat's status, moons, dead_for, experience or dead changes, and the cat marks itself as dirty when that
+    happens. Dirty cats are moved to their new place the next time an order is asked for, so getting a sorted list
+    is a copy of a list that's already sorted, and adding a cat is a binary search.
+
+    Entries are (key, position, cat ID), where position is the order the cats were added in. Cats with the same key
+    stay in the order they were added, like they did when the cat list was sorted in place.
+    """
+
+    sort_types = ("age", "reverse_age", "id", "reverse_id", "rank", "exp", "death")
+
+    # If more than this fraction of the cats are dirty, sorting the whole order again is quicker than moving them
+    # one by one. This happens every moon, when every cat's moons change.
+    rebuild_fraction = 0.125
+
+    def __init__(self):
+        self.cats = {}  # cat ID: cat, for every indexed cat
+        self.keys = {}  # cat ID: {sort type: entry}, only for the sort types that have been asked for
+        self.orders = {}  # sort type: sorted list of entries, only for the sort types that have been asked for
+        self.dirty = set()  # IDs of indexed cats whose keys may have changed
+        self.positions = {}  # cat ID: when the cat was added, for breaking ties
+        self.next_position = 0
+
+    def mark_dirty(self, cat_id):
+        """Called when something a cat is sorted by changes."""
+        if cat_id in self.cats:
+            self.dirty.add(cat_id)
+
+    def add(self, cat, sort_type=None):
+        """Adds a cat to the index. If sort_type is given, returns where the cat is in that order."""
+        if cat.ID in self.cats:
+            self.remove(cat.ID)
+        self.cats[cat.ID] = cat
+        self.keys[cat.ID] = {}
+        self.positions[cat.ID] = self.next_position
+        self.next_position += 1
+        for order_type, order in self.orders.items():
+            insort(order, self._get_entry(cat, order_type))
+
+        if sort_type in self.sort_types:
+            return bisect_left(self._get_order(sort_type), self._get_entry(cat, sort_type))
+        return None
+
+    def remove(self, cat_id):
+        """Removes a cat from the index, for cats that are removed from the game."""
+        if cat_id not in self.cats:
+            return
+        for sort_type, entry in self.keys.pop(cat_id).items():
+            if sort_type in self.orders:
+                order = self.orders[sort_type]
+                del order[bisect_left(order, entry)]
+        del self.cats[cat_id]
+        del self.positions[cat_id]
+        self.dirty.discard(cat_id)
+
+    def clear(self):
+        self.cats.clear()
+        self.keys.clear()
+        self.orders.clear()
+        self.dirty.clear()
+        self.positions.clear()
+        self.next_position = 0
+
+    def get_sorted(self, sort_type):
+        """Returns a list of every indexed cat, in order of sort_type."""
+        self.update()
+        return [self.cats[entry[-1]] for entry in self._get_order(sort_type)]
+
+    def sort(self, cats, sort_type):
+        """Sorts the given list of cats in place, using the cached keys. Cats that aren't indexed still get sorted,
+            their key just isn't kept, and they go after the indexed cats with the same key."""
+        self.update()
+        cats.sort(key=lambda cat: self._get_entry(cat, sort_type) if cat.ID in self.cats
+                  else (cat.get_sort_key(sort_type), float("inf")))
+
+    def update(self):
+        """Moves the dirty cats to their new place in every order."""
+        if not self.dirty:
+            return
+        dirty_cats = [self.cats[cat_id] for cat_id in self.dirty]
+        rebuild = len(dirty_cats) > len(self.cats) * self.rebuild_fraction
+
+        for cat in dirty_cats:
+            old_keys = self.keys[cat.ID]
+            self.keys[cat.ID] = {}
+            if rebuild:
+                continue
+            for sort_type, order in self.orders.items():
+                entry = old_keys[sort_type]
+                del order[bisect_left(order, entry)]
+                insort(order, self._get_entry(cat, sort_type))
+        self.dirty.clear()
+
+        if rebuild:
+            for sort_type, order in self.orders.items():
+                # Most of the order is still the right way round, which timsort is quick with.
+                order[:] = [self._get_entry(self.cats[entry[-1]], sort_type) for entry in order]
+                order.sort()
+
+    def _get_order(self, sort_type):
+        if sort_type not in self.orders:
+            self.orders[sort_type] = sorted(self._get_entry(cat, sort_type) for cat in self.cats.values())
+        return self.orders[sort_type]
+
+    def _get_entry(self, cat, sort_type):
+        cat_keys = self.keys[cat.ID]
+        if sort_type not in cat_keys:
+            cat_keys[sort_type] = (cat.get_sort_key(sort_type), self.positions[cat.ID], cat.ID)
+        return cat_keys[sort_type]
+
+
+sort_index = CatSortIndex()
@@ -20,11 +20,14 @@ from scripts.cat_relations.interaction import (
 # ---------------------------------------------------------------------------- #
 
 class Relationship():
-    used_interaction_ids = []
+    __slots__ = (
+        "cat_from", "cat_to", "mates", "mate", "family", "opposite_relationship", "interaction_str",
+        "triggered_event", "chosen_interaction", "log", "_romantic_love", "_platonic_like", "_dislike",
+        "_admiration", "_comfortable", "_jealousy", "_trust", "used_interaction_ids"
+    )
 
     def __init__(self, cat_from, cat_to, mates=False, family=False, romantic_love=0, platonic_like=0, dislike=0,
                  admiration=0, comfortable=0, jealousy=0, trust=0, log=None) -> None:
-        self.history = History()
         self.cat_from = cat_from
         self.cat_to = cat_to
         self.mates = mates
@@ -32,6 +35,7 @@ class Relationship():
         self.opposite_relationship = None  # link to opposite relationship will be created later
         self.interaction_str = ''
         self.triggered_event = False
+        self.used_interaction_ids = []
         if log:
             self.log = log
         else:
@@ -46,6 +50,30 @@ class Relationship():
         self.jealousy = jealousy
         self.trust = trust
 
+    @classmethod
+    def new_unchecked(cls, cat_from, cat_to, mates=False, family=False, romantic_love=0, platonic_like=0,
+                      dislike=0, admiration=0, comfortable=0, jealousy=0, trust=0):
+        """Makes a new relationship like Relationship() does, but without keeping the values between 0 and 100,
+            for making a lot of them at once with values that are known to be in range."""
+        relationship = cls.__new__(cls)
+        relationship.cat_from = cat_from
+        relationship.cat_to = cat_to
+        relationship.mates = mates
+        relationship.family = family
+        relationship.opposite_relationship = None
+        relationship.interaction_str = ''
+        relationship.triggered_event = False
+        relationship.used_interaction_ids = []
+        relationship.log = []
+        relationship._romantic_love = romantic_love
+        relationship._platonic_like = platonic_like
+        relationship._dislike = dislike
+        relationship._admiration = admiration
+        relationship._comfortable = comfortable
+        relationship._jealousy = jealousy
+        relationship._trust = trust
+        return relationship
+
     def link_relationship(self):
         """Add the other relationship object to this easily access and change the other side."""
         if self.cat_from.ID in self.cat_to.relationships:
@@ -121,7 +149,7 @@ class Relationship():
 
         # if the chosen_interaction is still in the TRIGGERED_SINGLE_INTERACTIONS, clean the list
         if chosen_interaction in self.used_interaction_ids:
-            self.used_interaction_ids = []
+            self.used_interaction_ids.clear()
 
         # add the chosen interaction id to the TRIGGERED_SINGLE_INTERACTIONS
         self.chosen_interaction = chosen_interaction
@@ -151,7 +179,7 @@ class Relationship():
                 
                 if possible_scar or possible_death:
                     for condition in injuries:
-                        self.history.add_possible_history(injured_cat, condition, scar_text=possible_scar, death_text=possible_death)
+                        History.add_possible_history(injured_cat, condition, scar_text=possible_scar, death_text=possible_death)
                 
         # get any possible interaction string out of this interaction
         interaction_str = choice(self.chosen_interaction.interactions)
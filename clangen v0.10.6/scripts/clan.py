@@ -22,10 +22,13 @@ import ujson
 import statistics
 
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.save_archive import read_save_file, save_file_exists
 from scripts.housekeeping.version import get_version_info, SAVE_VERSION_NUMBER
 from scripts.utility import update_sprite, get_current_season, quit  # pylint: disable=redefined-builtin
 from scripts.cat.cats import Cat, cat_class
-from scripts.cat.names import names
+from scripts.cat.names import names, name_index
+from scripts.cat.roster import CatGroup
+from scripts.cat.sorting import sort_index
 from scripts.clan_resources.freshkill import Freshkill_Pile, Nutrition
 from scripts.cat.sprites import sprites
 from sys import exit  # pylint: disable=redefined-builtin
@@ -53,10 +56,6 @@ class Clan():
     ]
 
     leader_lives = 0
-    clan_cats = []
-    starclan_cats = []
-    darkforest_cats = []
-    unknown_cats = []
     seasons = [
         'Newleaf',
         'Newleaf',
@@ -91,6 +90,12 @@ class Clan():
                  starting_season='Newleaf',
                  self_run_init_functions = True):
         self.history = History()
+        # IDs of the cats in each group, in the order they joined it
+        self.clan_cats = CatGroup()
+        self.starclan_cats = CatGroup()
+        self.darkforest_cats = CatGroup()
+        self.unknown_cats = CatGroup()
+        self.faded_ids = CatGroup()  # Stores ID's of faded cats, to ensure these IDs aren't reused.
         if name == "":
             return
         
@@ -158,9 +163,6 @@ class Clan():
             "enemy": None, 
             "duration": 0,
         }
-
-        self.faded_ids = [
-        ]  # Stores ID's of faded cats, to ensure these IDs aren't reused.
         if (self_run_init_functions):
             self.post_initialization_functions()
 
@@ -212,18 +214,20 @@ class Clan():
                 self.remove_cat(Cat.all_cats[i].ID)
 
         # give thoughts,actions and relationships to cats
+        children_index = Cat.get_children_index(Cat.all_cats.values())
         for cat_id in Cat.all_cats:
-            Cat.all_cats.get(cat_id).init_all_relationships()
+            Cat.all_cats.get(cat_id).init_all_relationships(children_index)
             Cat.all_cats.get(cat_id).backstory = 'clan_founder'
             if Cat.all_cats.get(cat_id).status == 'apprentice':
                 Cat.all_cats.get(cat_id).status_change('apprentice')
             Cat.all_cats.get(cat_id).thoughts()
 
-        game.save_cats()
-        number_other_clans = randint(3, 5)
-        for _ in range(number_other_clans):
-            self.all_clans.append(OtherClan())
-        self.save_clan()
+        with game.save_session():
+            game.save_cats()
+            number_other_clans = randint(3, 5)
+            for _ in range(number_other_clans):
+                self.all_clans.append(OtherClan())
+            self.save_clan()
         game.save_clanlist(self.name)
         game.switches['clan_list'] = game.read_clans()
         # if map_available:
@@ -248,7 +252,7 @@ class Clan():
 
     def add_cat(self, cat):  # cat is a 'Cat' object
         """ Adds cat into the list of clan cats"""
-        if cat.ID in Cat.all_cats and cat.ID not in self.clan_cats:
+        if cat.ID in Cat.all_cats:
             self.clan_cats.append(cat.ID)
 
     def add_to_starclan(self, cat):  # Same as add_cat
@@ -259,10 +263,8 @@ class Clan():
         if cat.ID in Cat.all_cats and cat.dead and cat.ID not in self.starclan_cats and cat.df is False:
             # The dead-value must be set to True before the cat can go to starclan
             self.starclan_cats.append(cat.ID)
-            if cat.ID in self.darkforest_cats:
-                self.darkforest_cats.remove(cat.ID)
-            if cat.ID in self.unknown_cats:
-                self.unknown_cats.remove(cat.ID)
+            self.darkforest_cats.discard(cat.ID)
+            self.unknown_cats.discard(cat.ID)
             if cat.ID in self.med_cat_list:
                 self.med_cat_list.remove(cat.ID)
                 self.med_cat_predecessors += 1
@@ -274,10 +276,8 @@ class Clan():
         """
         if cat.ID in Cat.all_cats and cat.dead and cat.df:
             self.darkforest_cats.append(cat.ID)
-            if cat.ID in self.starclan_cats:
-                self.starclan_cats.remove(cat.ID)
-            if cat.ID in self.unknown_cats:
-                self.unknown_cats.remove(cat.ID)
+            self.starclan_cats.discard(cat.ID)
+            self.unknown_cats.discard(cat.ID)
             if cat.ID in self.med_cat_list:
                 self.med_cat_list.remove(cat.ID)
                 self.med_cat_predecessors += 1
@@ -292,10 +292,8 @@ class Clan():
         """
         if cat.ID in Cat.all_cats and cat.dead and cat.outside:
             self.unknown_cats.append(cat.ID)
-            if cat.ID in self.starclan_cats:
-                self.starclan_cats.remove(cat.ID)
-            if cat.ID in self.darkforest_cats:
-                self.darkforest_cats.remove(cat.ID)
+            self.starclan_cats.discard(cat.ID)
+            self.darkforest_cats.discard(cat.ID)
             if cat.ID in self.med_cat_list:
                 self.med_cat_list.remove(cat.ID)
                 self.med_cat_predecessors += 1
@@ -329,15 +327,14 @@ class Clan():
 
         if ID in Cat.all_cats:
             Cat.all_cats.pop(ID)
+        name_index.remove(ID)
+        sort_index.remove(ID)
+        Cat.forget_sprite(ID)
         
-        if ID in self.clan_cats:
-            self.clan_cats.remove(ID)
-        if ID in self.starclan_cats:
-            self.starclan_cats.remove(ID)
-        if ID in self.unknown_cats:
-            self.unknown_cats.remove(ID)
-        if ID in self.darkforest_cats:
-            self.darkforest_cats.remove(ID)
+        self.clan_cats.discard(ID)
+        self.starclan_cats.discard(ID)
+        self.unknown_cats.discard(ID)
+        self.darkforest_cats.discard(ID)
 
     def __repr__(self):
         if self.name is not None:
@@ -458,6 +455,9 @@ class Clan():
 
         clan_data["faded_cats"] = ",".join([str(i) for i in self.faded_ids])
 
+        # So IDs of cats that faded or were removed are never handed out again
+        clan_data["next_cat_id"] = Cat.id_allocator.next_id
+
         # Patrolled cats
         clan_data["patrolled_cats"] = [str(i) for i in game.patrolled]
 
@@ -500,6 +500,7 @@ class Clan():
             # Else move on to the next item on the list
             self.clan_settings[setting_name] = self.setting_lists[setting_name][
                 list_index + 1]
+        game.refresh_snapshot()
 
     def save_clan_settings(self):
         game.safe_save(get_save_dir() + f'/{self.name}/clan_settings.json', self.clan_settings)
@@ -510,8 +511,8 @@ class Clan():
         """
 
         version_info = None
-        if os.path.exists(get_save_dir() + '/' + game.switches['clan_list'][0] +
-                          'clan.json'):
+        if save_file_exists(get_save_dir() + '/' + game.switches['clan_list'][0] +
+                            'clan.json'):
             version_info = self.load_clan_json()
         elif os.path.exists(get_save_dir() + '/' + game.switches['clan_list'][0] +
                             'clan.txt'):
@@ -697,10 +698,7 @@ class Clan():
 
         game.switches[
             'error_message'] = "There was an error loading the clan.json"
-        with open(get_save_dir() + '/' + game.switches['clan_list'][0] + 'clan.json',
-                  'r',
-                  encoding='utf-8') as read_file:  # pylint: disable=redefined-outer-name
-            clan_data = ujson.loads(read_file.read())
+        clan_data = ujson.loads(read_save_file(get_save_dir() + '/' + game.switches['clan_list'][0] + 'clan.json'))
 
         if clan_data["leader"]:
             leader = Cat.all_cats[clan_data["leader"]]
@@ -772,8 +770,10 @@ class Clan():
 
         if "faded_cats" in clan_data:
             if clan_data["faded_cats"].strip():  # Check for empty string
-                for cat in clan_data["faded_cats"].split(","):
-                    game.clan.faded_ids.append(cat)
+                game.clan.faded_ids.extend(clan_data["faded_cats"].split(","))
+
+        if "next_cat_id" in clan_data:
+            Cat.id_allocator.skip_to(clan_data["next_cat_id"])
 
         # Patrolled cats
         if "patrolled_cats" in clan_data:
@@ -809,6 +809,7 @@ class Clan():
         for key, value in _load_settings.items():
             if key in self.clan_settings:
                 self.clan_settings[key] = value
+        game.refresh_snapshot()
 
     def load_herbs(self, clan):
         """
@@ -81,7 +81,7 @@ class Freshkill_Pile():
             self.total_amount = game.prey_config["start_amount"]
         self.nutrition_info = {}
         self.living_cats = []
-        self.already_fed = []
+        self.already_fed = set()
         self.needed_prey = 0
 
     def add_freshkill(self, amount) -> None:
@@ -127,11 +127,9 @@ class Freshkill_Pile():
         relevant_queens = []
         # kits under 3 months are feed by the queen
         for queen_id, their_kits in queen_dict.items():
-            queen = Cat.fetch_cat(queen_id)
-            young_kits = [kit for kit in their_kits if kit.moons < 3]
-            if len(young_kits) > 0:
-                relevant_queens.append(queen)
-        pregnant_cats = [cat for cat in living_cats if "pregnant" in cat.injuries and cat.ID not in queen_dict.keys()]
+            if any(kit.moons < 3 for kit in their_kits):
+                relevant_queens.append(queen_id)
+        pregnant_cats = [cat for cat in living_cats if "pregnant" in cat.injuries and cat.ID not in queen_dict]
 
         # all normal status cats calculation
         needed_prey = sum([PREY_REQUIREMENT[cat.status] for cat in living_cats if cat.status not in ["newborn", "kitten"]])
@@ -166,9 +164,9 @@ class Freshkill_Pile():
                 event_list.append(f"Some prey expired, {amount} pieces were removed from the pile.")
         self.total_amount = sum(self.pile.values())
         value_diff = self.total_amount
-        self.already_fed = []
+        self.already_fed = set()
         self.feed_cats(living_cats)
-        self.already_fed = []
+        self.already_fed = set()
         value_diff -= sum(self.pile.values())
         event_list.append(f"{value_diff} pieces of prey were consumed.")
         self._update_needed_food(living_cats)
@@ -240,34 +238,27 @@ class Freshkill_Pile():
                 the list of cats which should be feed
         """
         relevant_group = []
-        queen_dict, kits = get_alive_clan_queens(living_cats)
-        fed_kits = []
-        relevant_queens = []
-        # kits under 3 months are feed by the queen
-        for queen_id, their_kits in queen_dict.items():
-            queen = Cat.fetch_cat(queen_id)
-            young_kits = [kit for kit in their_kits if kit.moons < 3]
-            if len(young_kits) > 0:
-                fed_kits.extend(young_kits)
-                relevant_queens.append(queen)
-        
-        pregnant_cats = [cat for cat in living_cats if "pregnant" in cat.injuries and cat.ID not in queen_dict.keys()]
+        queen_dict, fed_kits, relevant_queens, pregnant_cats = self.get_queens_and_kits(living_cats)
+        fed_kit_ids = {kit.ID for kit in fed_kits}
+        queen_or_pregnant_ids = {cat.ID for cat in relevant_queens + pregnant_cats}
+
+        # split the cats by status once, instead of going through all of them for every status
+        by_status = {}
+        for cat in living_cats:
+            by_status.setdefault(str(cat.status), []).append(cat)
 
         for feeding_status in FEEDING_ORDER:
-            if feeding_status == "newborn":
+            if feeding_status in ["newborn", "kitten"]:
                 relevant_group = [
-                    cat for cat in living_cats if cat.status == "newborn" and cat not in fed_kits
-                ]
-            elif feeding_status == "kitten":
-                relevant_group = [
-                    cat for cat in living_cats if cat.status == "kitten" and cat not in fed_kits
+                    cat for cat in by_status.get(feeding_status, []) if cat.ID not in fed_kit_ids
                 ]
             elif feeding_status == "queen/pregnant":
                 relevant_group = relevant_queens + pregnant_cats
             else:
-                relevant_group = [cat for cat in living_cats if str(cat.status) == feeding_status]
                 # remove all cats, which are also queens / pregnant
-                relevant_group = [cat for cat in relevant_group if cat not in relevant_queens and cat not in pregnant_cats]
+                relevant_group = [
+                    cat for cat in by_status.get(feeding_status, []) if cat.ID not in queen_or_pregnant_ids
+                ]
 
             if len(relevant_group) == 0:
                 continue
@@ -305,17 +296,9 @@ class Freshkill_Pile():
             return
         
         # first get special groups, which need to be looked out for, when feeding
-        queen_dict, kits = get_alive_clan_queens(living_cats)
-        fed_kits = []
-        relevant_queens = []
-        # kits under 3 months are feed by the queen
-        for queen_id, their_kits in queen_dict.items():
-            queen = Cat.fetch_cat(queen_id)
-            young_kits = [kit for kit in their_kits if kit.moons < 3]
-            if len(young_kits) > 0:
-                fed_kits.extend(young_kits)
-                relevant_queens.append(queen)
-        pregnant_cats = [cat for cat in living_cats if "pregnant" in cat.injuries and cat.ID not in queen_dict.keys()]
+        queen_dict, fed_kits, relevant_queens, pregnant_cats = self.get_queens_and_kits(living_cats)
+        fed_kit_ids = {kit.ID for kit in fed_kits}
+        pregnant_ids = {cat.ID for cat in pregnant_cats}
 
         # first split nutrition information into low nutrition and satisfied
         ration_prey = game.clan.clan_settings["ration prey"] if game.clan else False
@@ -337,16 +320,19 @@ class Freshkill_Pile():
         # use living_cats to fetch cat for testing
         fetch_cat = living_cats[0]
 
+        # feeding only changes nutrition, not how much food the Clan needs, so this only has to be worked out once
+        food_needed = self.amount_food_needed()
+
         # first feed the cats with the lowest nutrition
         for cat_id, v in sorted_nutrition.items():
             cat = Cat.all_cats[cat_id]
             status = str(cat.status)
             # check if this is a kit, if so check if they are fed by the mother
-            if status in ["newborn", "kitten"] and cat in fed_kits:
+            if status in ["newborn", "kitten"] and cat.ID in fed_kit_ids:
                 continue
 
             # check for queens / pregnant
-            if cat.ID in queen_dict.keys() or cat in pregnant_cats:
+            if cat.ID in queen_dict or cat.ID in pregnant_ids:
                 status = "queen/pregnant"
             feeding_amount = PREY_REQUIREMENT[status]
             needed_amount = feeding_amount
@@ -360,9 +346,9 @@ class Freshkill_Pile():
                 if ration_prey and status == "warrior":
                     feeding_amount = feeding_amount/2
 
-            if self.amount_food_needed() < self.total_amount * 1.2 and self.nutrition_info[cat.ID].percentage < 100:
+            if food_needed < self.total_amount * 1.2 and self.nutrition_info[cat.ID].percentage < 100:
                 feeding_amount += 1
-            elif self.amount_food_needed() < self.total_amount and self.nutrition_info[cat.ID].percentage < 100:
+            elif food_needed < self.total_amount and self.nutrition_info[cat.ID].percentage < 100:
                 feeding_amount += 0.5
             self.feed_cat(cat, feeding_amount, needed_amount)
 
@@ -391,17 +377,20 @@ class Freshkill_Pile():
             living_cats : list
                 the list of cats which should be feed
         """
-        best_hunter = []
-        for search_rank in range(1,4):
-            for cat in living_cats.copy():
-                if not cat.skills:
-                    continue
-                if cat.skills.primary and cat.skills.primary.path == SkillPath.HUNTER and cat.skills.primary.tier == search_rank:
-                    best_hunter.insert(0,cat)
-                    living_cats.remove(cat)
-                elif cat.skills.secondary and cat.skills.secondary.path == SkillPath.HUNTER and cat.skills.secondary.tier == search_rank:
-                    best_hunter.insert(0,cat)
-                    living_cats.remove(cat)
+        # a cat with two hunter skills counts with the lower tier one
+        def hunter_rank(cat):
+            if not cat.skills:
+                return None
+            tiers = [skill.tier for skill in (cat.skills.primary, cat.skills.secondary)
+                     if skill and skill.path == SkillPath.HUNTER]
+            return min(tiers) if tiers else None
+
+        ranks = {cat.ID: hunter_rank(cat) for cat in living_cats}
+        hunters = [cat for cat in living_cats if ranks[cat.ID] in (1, 2, 3)]
+        # the highest tier hunter is fed first, ties in reverse list order
+        best_hunter = sorted(reversed(hunters), key=lambda x: ranks[x.ID], reverse=True)
+        # the hunters are taken out of the given list
+        living_cats[:] = [cat for cat in living_cats if ranks[cat.ID] not in (1, 2, 3)]
 
         self.feed_group(best_hunter, not_moon_feeding)
         self.tactic_status(living_cats, not_moon_feeding)
@@ -424,6 +413,33 @@ class Freshkill_Pile():
     #                               helper functions                               #
     # ---------------------------------------------------------------------------- #
 
+    def get_queens_and_kits(self, living_cats: List[Cat]):
+        """
+        Sorts out the groups which need special handling when feeding.
+
+            Returns
+            -------
+            queen_dict : dict
+                the queen IDs and their kits, from get_alive_clan_queens
+            fed_kits : list
+                the kits under 3 moons, which are fed by their queen
+            relevant_queens : list
+                the queens which are feeding kits
+            pregnant_cats : list
+                the pregnant cats, which aren't queens already
+        """
+        queen_dict, kits = get_alive_clan_queens(living_cats)
+        fed_kits = []
+        relevant_queens = []
+        # kits under 3 months are feed by the queen
+        for queen_id, their_kits in queen_dict.items():
+            young_kits = [kit for kit in their_kits if kit.moons < 3]
+            if len(young_kits) > 0:
+                fed_kits.extend(young_kits)
+                relevant_queens.append(Cat.fetch_cat(queen_id))
+        pregnant_cats = [cat for cat in living_cats if "pregnant" in cat.injuries and cat.ID not in queen_dict]
+        return queen_dict, fed_kits, relevant_queens, pregnant_cats
+
     def feed_group(self, group: list, not_moon_feeding = False, queens = False, fed_kits = None) -> None:
         """
         Handle the feeding giving cats.
@@ -441,13 +457,17 @@ class Freshkill_Pile():
         # first split nutrition information into low nutrition and satisfied
         ration_prey = game.clan.clan_settings["ration prey"] if game.clan else False
 
+        # feeding only changes nutrition, not how much food the Clan needs, so this only has to be worked out once
+        food_needed = self.amount_food_needed()
+        fed_kit_ids = {kit.ID for kit in fed_kits} if fed_kits else set()
+
         # first feed the cats with the lowest nutrition
         for cat in group:
-            if cat in self.already_fed:
+            if cat.ID in self.already_fed:
                 continue
             status = str(cat.status)
             # check if this is a kit, if so check if they are fed by the mother
-            if status in ["newborn", "kitten"] and fed_kits and cat in fed_kits:
+            if status in ["newborn", "kitten"] and cat.ID in fed_kit_ids:
                 continue
 
             # check for queens / pregnant
@@ -465,13 +485,13 @@ class Freshkill_Pile():
                 if ration_prey and status == "warrior":
                     feeding_amount = feeding_amount/2
 
-            if self.total_amount * 2 > self.amount_food_needed() and self.nutrition_info[cat.ID].percentage < 100:
+            if self.total_amount * 2 > food_needed and self.nutrition_info[cat.ID].percentage < 100:
                 feeding_amount += 2
-            if self.total_amount * 1.8 > self.amount_food_needed() and self.nutrition_info[cat.ID].percentage < 100:
+            if self.total_amount * 1.8 > food_needed and self.nutrition_info[cat.ID].percentage < 100:
                 feeding_amount += 1.5
-            elif self.total_amount * 1.2 > self.amount_food_needed() and self.nutrition_info[cat.ID].percentage < 100:
+            elif self.total_amount * 1.2 > food_needed and self.nutrition_info[cat.ID].percentage < 100:
                 feeding_amount += 1
-            elif self.total_amount > self.amount_food_needed() and self.nutrition_info[cat.ID].percentage < 100:
+            elif self.total_amount > food_needed and self.nutrition_info[cat.ID].percentage < 100:
                 feeding_amount += 0.5
 
             if not_moon_feeding:
@@ -497,7 +517,7 @@ class Freshkill_Pile():
         order = ["expires_in_1", "expires_in_2", "expires_in_3", "expires_in_4"]
         for key in order:
             remaining_amount = self.take_from_pile(key, remaining_amount)
-        self.already_fed.append(cat)
+        self.already_fed.add(cat.ID)
 
         if remaining_amount > 0 and amount_difference == 0:
             self.nutrition_info[cat.ID].current_score -= remaining_amount
@@ -581,21 +601,24 @@ class Freshkill_Pile():
                     self.nutrition_info[cat.ID].max_score = required_max
                     self.nutrition_info[cat.ID].current_score = current_score / previous_max * required_max
             else:
-                self.add_cat_to_nutrition(cat)
+                self.add_cat_to_nutrition(cat, queen_dict)
 
-    def add_cat_to_nutrition(self, cat: Cat) -> None:
+    def add_cat_to_nutrition(self, cat: Cat, queen_dict: dict = None) -> None:
         """
             Parameters
             ----------
             cat : Cat
                 the cat, which should be added to the nutrition info
+            queen_dict : dict
+                the result of get_alive_clan_queens, if it's already known
         """
         nutrition = Nutrition()
         factor = 3
         if str(cat.status) in ["newborn", "kitten", "elder"]:
             factor = 2
         
-        queen_dict, kits = get_alive_clan_queens(self.living_cats)
+        if queen_dict is None:
+            queen_dict, kits = get_alive_clan_queens(self.living_cats)
         prey_status = str(cat.status)
         if cat.ID in queen_dict.keys() or "pregnant" in cat.injuries:
             prey_status = "queen/pregnant"
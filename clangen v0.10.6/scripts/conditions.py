@@ -8,7 +8,14 @@ TODO: Docs
 
   # pylint: enable=line-too-long
 
+import os
+from copy import deepcopy
+
+import ujson
+
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.save_session import SaveSession
+from scripts.game_structure.save_archive import read_save_file, save_file_exists
 from scripts.cat.skills import SkillPath
 
 
@@ -276,3 +283,211 @@ class PermanentCondition:
         TODO: DOCS
         """
         self._current_mortality = value
+
+
+# ---------------------------------------------------------------------------- #
+#                                Condition Store                               #
+# ---------------------------------------------------------------------------- #
+
+
+class ConditionDict(dict):
+    """
+    A cat's illnesses, injuries or permanent conditions. Works like a normal dict, but lets the condition
+    store know whenever the cat gains their first condition of this kind or loses their last one.
+    """
+
+    __slots__ = ("cat", "index")
+
+    def __init__(self, cat, index, conditions=None):
+        super().__init__(conditions or {})
+        self.cat = cat
+        self.index = index
+        # A cat that's still being made doesn't have an ID yet, but they don't have any conditions either.
+        if self or hasattr(cat, "ID"):
+            self._update_index()
+
+    def _update_index(self):
+        if self:
+            self.index[self.cat.ID] = None
+        else:
+            self.index.pop(self.cat.ID, None)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._update_index()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._update_index()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._update_index()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._update_index()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._update_index()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._update_index()
+
+    def clear(self):
+        super().clear()
+        self._update_index()
+
+    # Copies are plain dicts, they don't belong to the cat.
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self), memo)
+
+
+class ConditionStore():
+    """
+    Every cat's conditions, saved together in the Clan's conditions.json instead of a file per cat. It also
+    keeps a live index of which cats are ill, injured or disabled, so finding them doesn't mean going through
+    the whole Clan.
+    """
+
+    FILE_NAME = "conditions.json"
+    KINDS = ("illnesses", "injuries", "permanent conditions")
+
+    def __init__(self):
+        # kind -> IDs of the cats that have a condition of that kind. They're dicts used as ordered sets,
+        # so cats are always found in the order they got their conditions.
+        self.index = {kind: {} for kind in ConditionStore.KINDS}
+        # cat ID -> conditions, as they were read from the save. Each cat takes theirs when they're loaded.
+        self.loaded = {}
+        # The conditions file, as the json string it was last saved or loaded as
+        self.saved = None
+        # cat ID -> IDs of the cats they interacted with this moon. Only kept for interactions with a sick cat,
+        # since those are the only ones that matter for outbreaks.
+        self.contacts = {}
+
+    def make_dict(self, cat, kind, conditions=None):
+        return ConditionDict(cat, self.index[kind], conditions)
+
+    def load(self, clan_dir):
+        """
+        reads the conditions of the whole Clan. Saves from before conditions.json had a file per cat in
+        their conditions folder, which are read instead.
+        :param clan_dir: the Clan's save folder
+        """
+        self.clear()
+        file_path = clan_dir + '/' + ConditionStore.FILE_NAME
+        try:
+            if save_file_exists(file_path):
+                self.saved = read_save_file(file_path)
+                self.loaded = ujson.loads(self.saved)
+            elif os.path.isdir(clan_dir + '/conditions'):
+                self.loaded = self._load_old_conditions(clan_dir + '/conditions')
+        except Exception as e:
+            print("WARNING: There was an error reading the conditions file.\n", e)
+
+    @staticmethod
+    def _load_old_conditions(condition_directory):
+        conditions = {}
+        for file_name in os.listdir(condition_directory):
+            if not file_name.endswith('_conditions.json'):
+                continue
+            try:
+                with open(condition_directory + '/' + file_name, 'r') as read_file:
+                    conditions[file_name[:-len('_conditions.json')]] = ujson.loads(read_file.read())
+            except Exception as e:
+                print(f"WARNING: There was an error reading the condition file {file_name}.\n", e)
+        return conditions
+
+    def take(self, cat_id):
+        """returns the loaded conditions of the cat, or None if they have none"""
+        return self.loaded.pop(cat_id, None)
+
+    def get_cats(self, *kinds):
+        """
+        returns the living cats in the Clan that have any condition of the given kinds
+        :param kinds: any of "illnesses", "injuries" and "permanent conditions". All three if none are given.
+        """
+        all_cats = game.cat_class.all_cats
+        cat_ids = {}
+        for kind in kinds or ConditionStore.KINDS:
+            cat_ids.update(self.index[kind])
+
+        cats = []
+        for cat_id in cat_ids:
+            cat = all_cats.get(cat_id)
+            if cat and not cat.dead and not cat.outside:
+                cats.append(cat)
+        return cats
+
+    def add_contact(self, cat, other_cat):
+        """notes down that the two cats interacted, if either of them is ill"""
+        if not cat.illnesses and not other_cat.illnesses:
+            return
+        self.contacts.setdefault(cat.ID, set()).add(other_cat.ID)
+        self.contacts.setdefault(other_cat.ID, set()).add(cat.ID)
+
+    def get_contacts(self, cat_id):
+        return self.contacts.get(cat_id, set())
+
+    def remove(self, cat_id):
+        """takes a cat that's taken out of the game out of the index and the contacts"""
+        for cat_ids in self.index.values():
+            cat_ids.pop(cat_id, None)
+        self.loaded.pop(cat_id, None)
+        for other_id in self.contacts.pop(cat_id, ()):
+            self.contacts.get(other_id, set()).discard(cat_id)
+
+    def to_dict(self):
+        conditions = {}
+        for cat in self.get_cats():
+            cat_conditions = {}
+            if cat.illnesses:
+                cat_conditions["illnesses"] = cat.illnesses
+            if cat.injuries:
+                cat_conditions["injuries"] = cat.injuries
+            if cat.permanent_condition:
+                cat_conditions["permanent conditions"] = cat.permanent_condition
+            conditions[cat.ID] = cat_conditions
+        return conditions
+
+    def save(self, clan_dir):
+        """
+        saves the conditions of the whole Clan, if anything changed since they were last saved
+        :param clan_dir: the Clan's save folder
+        """
+        data = ujson.dumps(self.to_dict(), indent=4)
+        if data == self.saved:
+            return
+        game.safe_save(clan_dir + '/' + ConditionStore.FILE_NAME, data)
+
+        # The old condition files aren't needed anymore.
+        condition_directory = clan_dir + '/conditions'
+        if os.path.isdir(condition_directory):
+            for file_name in os.listdir(condition_directory):
+                game.safe_remove(condition_directory + '/' + file_name)
+
+        def mark_saved():
+            self.saved = data
+
+        # In a save session, nothing is really saved until the session is.
+        if SaveSession.active is not None:
+            SaveSession.active.on_commit(mark_saved)
+        else:
+            mark_saved()
+
+    def clear(self):
+        self.loaded = {}
+        self.saved = None
+        self.contacts = {}
+
+
+condition_store = ConditionStore()
+game.condition_store = condition_store
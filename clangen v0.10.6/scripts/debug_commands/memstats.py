@@ -0,0 +1,66 @@
+import sys
+from typing import List
+
+import pygame
+
+from scripts.cat.cats import Cat
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+
+
+def get_size(obj, seen: set) -> int:
+    """Adds up the size of obj and everything it holds, skipping anything in seen. Other cats aren't followed,
+        so relationships only count themselves and not the cat they're with. """
+    if id(obj) in seen or isinstance(obj, (Cat, type)):
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pygame.Surface):
+        return sys.getsizeof(obj) + obj.get_width() * obj.get_height() * obj.get_bytesize()
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += get_size(key, seen) + get_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += get_size(item, seen)
+    else:
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                size += get_size(getattr(obj, slot), seen)
+        if hasattr(obj, "__dict__"):
+            size += get_size(obj.__dict__, seen)
+    return size
+
+
+def get_cat_size(cats) -> int:
+    """returns the bytes used by the cats, counting anything they share only once"""
+    seen = set()
+    size = 0
+    for cat in cats:
+        size += sys.getsizeof(cat)
+        for slot in Cat.__slots__:
+            if hasattr(cat, slot):
+                size += get_size(getattr(cat, slot), seen)
+    return size
+
+
+class MemStatsCommand(Command):
+    name = "memstats"
+    description = "Show how much memory the cats use, before and after letting go of their sprites"
+
+    def callback(self, args: List[str]):
+        cats = list(Cat.all_cats.values())
+        if not cats:
+            add_output_line_to_log("There are no cats loaded")
+            return
+
+        before = get_cat_size(cats)
+        Cat.release_sprites()
+        after = get_cat_size(cats)
+
+        add_output_line_to_log(f"{len(cats)} cats")
+        add_output_line_to_log(f"Before: {before // len(cats)} bytes per cat, {before // 1024} KB total")
+        add_output_line_to_log(f"After releasing sprites: {after // len(cats)} bytes per cat, "
+                               f"{after // 1024} KB total")
@@ -0,0 +1,129 @@
+import os
+import time
+from typing import List
+
+import ujson
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure import save_archive
+from scripts.game_structure.save_archive import ARCHIVED_FILES, ARCHIVED_FOLDERS, get_archive, get_save_stats, \
+    list_save_dir, pack_clan, read_save_file, unpack_clan
+from scripts.game_structure.save_database import SaveDatabase
+from scripts.housekeeping.datadir import get_save_dir
+
+
+def time_save():
+    """Saves the Clan the way the save button does, returning how long it took in seconds."""
+    start = time.perf_counter()
+    with game.save_session():
+        game.save_cats()
+        game.clan.save_clan()
+        game.clan.save_pregnancy(game.clan)
+        game.save_events()
+    return time.perf_counter() - start
+
+
+def time_load(clan_name):
+    """Reads and parses every save file that can be archived, returning how long it took in seconds."""
+    clan_dir = os.path.join(get_save_dir(), clan_name)
+    paths = [os.path.join(get_save_dir(), clan_name + "clan.json")]
+    paths.extend(os.path.join(clan_dir, name) for name in ARCHIVED_FILES[1:])
+    for folder in ARCHIVED_FOLDERS:
+        paths.extend(os.path.join(clan_dir, folder, file_name)
+                     for file_name in list_save_dir(os.path.join(clan_dir, folder)))
+
+    start = time.perf_counter()
+    for path in paths:
+        try:
+            ujson.loads(read_save_file(path))
+        except FileNotFoundError:
+            pass
+    return time.perf_counter() - start
+
+
+def get_clan_name():
+    if not game.clan:
+        add_output_line_to_log("There is no Clan loaded")
+        return None
+    return game.clan.name
+
+
+class PackCommand(Command):
+    name = "pack"
+    description = "Move the save files of the current Clan into a single archive, or a database"
+    usage = "[archive|database]"
+
+    def callback(self, args: List[str]):
+        clan_name = get_clan_name()
+        if not clan_name:
+            return
+        count = pack_clan(clan_name, args[0] if args else "archive")
+        add_output_line_to_log(f"Packed {count} files" if count else "Nothing to pack")
+
+
+class UnpackCommand(Command):
+    name = "unpack"
+    description = "Turn the current Clan's archive or database back into normal save files"
+
+    def callback(self, args: List[str]):
+        clan_name = get_clan_name()
+        if not clan_name:
+            return
+        count = unpack_clan(clan_name)
+        add_output_line_to_log(f"Unpacked {count} files" if count else "The Clan doesn't have an archive")
+
+
+class BenchmarkCommand(Command):
+    name = "benchmark"
+    description = "Compare saving, loading and disk use of the current Clan as files, an archive and a database"
+    aliases = ["bench"]
+
+    def callback(self, args: List[str]):
+        clan_name = get_clan_name()
+        if not clan_name:
+            return
+        clan_dir = os.path.join(get_save_dir(), clan_name)
+        archive = get_archive(clan_dir)
+        old_format = "files" if archive is None else "database" if isinstance(archive, SaveDatabase) else "archive"
+
+        new_save_format = save_archive.new_save_format
+        save_archive.new_save_format = "files"
+        try:
+            results = []
+            for save_format in ("files", "archive", "database"):
+                unpack_clan(clan_name)
+                if save_format != "files":
+                    pack_clan(clan_name, save_format)
+                results.append((save_format,) + self.measure(clan_name))
+            unpack_clan(clan_name)
+            if old_format != "files":
+                pack_clan(clan_name, old_format)
+        finally:
+            save_archive.new_save_format = new_save_format
+
+        for kind, save_time, load_time, file_count, size in results:
+            add_output_line_to_log(f"{kind}: save {save_time * 1000:.0f} ms, load {load_time * 1000:.0f} ms, "
+                                   f"{file_count} files, {size // 1024} KB")
+
+    @staticmethod
+    def measure(clan_name):
+        save_time = time_save()
+        load_time = time_load(clan_name)
+        return (save_time, load_time) + get_save_stats(clan_name)
+
+
+class SaveArchiveCommand(Command):
+    name = "savearchive"
+    description = "Convert the current Clan's save between files and a single archive"
+    aliases = ["archive"]
+
+    subCommands = [
+        PackCommand(),
+        UnpackCommand(),
+        BenchmarkCommand()
+    ]
+
+    def callback(self, args: List[str]):
+        add_output_line_to_log("Please specify a subcommand")
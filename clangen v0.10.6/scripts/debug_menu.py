@@ -9,6 +9,7 @@ from typing import List
 from scripts.game_structure.game_essentials import MANAGER, game
 
 from scripts.utility import get_text_box_theme
+from scripts.cat.cats import Cat
 from scripts.debug_commands import commandList
 from scripts.debug_commands.utils import setDebugClass
 
@@ -145,12 +146,15 @@ class debugMode:
             if self.fps_display.visible == 0:
                 self.fps_display.show()
 
-            self.fps_display.set_text(f"{round(clock.get_fps(), 2)} fps")
+            self.fps_display.set_text(f"{round(clock.get_fps(), 2)} fps, {Cat.sprites_made} sprites made")
         else:
             if self.fps_display.visible == 1:
                 self.fps_display.hide()
                 self.fps_display.set_text("(0, 0)")
 
+        # Sprites are counted per frame
+        Cat.sprites_made = 0
+
         # Showbounds
 
         # visual_debug_mode
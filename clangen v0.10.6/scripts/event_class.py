@@ -10,6 +10,7 @@ TODO: Docs
 # pylint: enable=line-too-long
 class Single_Event():
     """A class to hold info regarding a single event """
+    __slots__ = ("text", "types", "cats_involved")
 
     def __init__(self, text, types=None, cats_involved=None):
         """ text: The event text.
@@ -25,10 +25,13 @@ from scripts.events_module.relation_events import Relation_Events
 from scripts.events_module.condition_events import Condition_Events
 from scripts.events_module.death_events import Death_Events
 from scripts.events_module.freshkill_pile_events import Freshkill_Events
+from scripts.events_module.outbreak_events import Outbreak_Events
 #from scripts.events_module.disaster_events import DisasterEvents
 from scripts.events_module.outsider_events import OutsiderEvents
 from scripts.event_class import Single_Event
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.event_history import event_history
+from scripts.game_structure.timeskip_profiler import timeskip_profiler
 from scripts.utility import get_alive_kits, get_med_cats, ceremony_text_adjust, \
     get_current_season, adjust_list_text, ongoing_event_text_adjust, event_text_adjust
 from scripts.events_module.generate_events import GenerateEvents
@@ -54,6 +57,14 @@ class Events:
         """
         TODO: DOCS
         """
+        timeskip_profiler.start()
+        try:
+            self.handle_one_moon()
+        finally:
+            timeskip_profiler.finish()
+
+    def handle_one_moon(self):
+        event_history.add_moon(game.clan.age, game.cur_events_list)
         game.cur_events_list = []
         game.herb_events_list = []
         game.freshkill_events_list = []
@@ -111,6 +122,9 @@ class Events:
             else:
                 self.one_moon_outside_cat(cat)
 
+        # Sick cats spread their illnesses, now that every cat has had their moon
+        Outbreak_Events.handle_outbreaks()
+
         # keeping this commented out till disasters are more polished
         # self.disaster_events.handle_disasters()
 
@@ -231,10 +245,11 @@ class Events:
         # autosave
         if game.clan.clan_settings.get('autosave') and game.clan.age % 5 == 0:
             try:
-                game.save_cats()
-                game.clan.save_clan()
-                game.clan.save_pregnancy(game.clan)
-                game.save_events()
+                with game.save_session():
+                    game.save_cats()
+                    game.clan.save_clan()
+                    game.clan.save_pregnancy(game.clan)
+                    game.save_events()
             except:
                 SaveError(traceback.format_exc())
 
@@ -651,12 +666,13 @@ class Events:
         """
         TODO: DOCS
         """
-        if game.clan.clan_settings["fading"] and not cat.prevent_fading \
+        settings = game.snapshot
+        if settings.fading and not cat.prevent_fading \
                 and cat.ID != game.clan.instructor.ID and not cat.faded:
 
-            age_to_fade = game.config["fading"]["age_to_fade"]
-            opacity_at_fade = game.config["fading"]["opacity_at_fade"]
-            fading_speed = game.config["fading"]["visual_fading_speed"]
+            age_to_fade = settings.age_to_fade
+            opacity_at_fade = settings.opacity_at_fade
+            fading_speed = settings.visual_fading_speed
             # Handle opacity
             cat.pelt.opacity = int((100 - opacity_at_fade) *
                               (1 -
@@ -772,7 +788,6 @@ class Events:
             game.switches['skip_conditions'].clear()
             if cat.dead:
                 return
-            self.handle_outbreaks(cat)
 
         # newborns don't do much
         if cat.status == 'newborn':
@@ -1694,7 +1709,7 @@ class Events:
         relationships = cat.relationships.values()
         targets = []
 
-        if cat.age in ["kitten", "newborn"]:
+        if cat.is_baby():
             return
         
         # if this cat is unstable and aggressive, we lower the random murder chance
@@ -1917,103 +1932,6 @@ class Events:
         # FIXME: Not sure what this is intended to do; 'cat_class' has no 'other_cats' attribute.
         # cat_class.other_cats[cat.ID] = cat
 
-    def handle_outbreaks(self, cat):
-        """Try to infect some cats."""
-        # check if the cat is ill, if game mode is classic,
-        # or if Clan has sufficient med cats in expanded mode
-        if not cat.is_ill() or game.clan.game_mode == 'classic':
-            return
-
-        # check how many kitties are already ill
-        already_sick = list(
-            filter(
-                lambda kitty:
-                (not kitty.dead and not kitty.outside and kitty.is_ill()),
-                Cat.all_cats.values()))
-        already_sick_count = len(already_sick)
-
-        # round up the living kitties
-        alive_cats = list(
-            filter(
-                lambda kitty:
-                (not kitty.dead and not kitty.outside and not kitty.is_ill()),
-                Cat.all_cats.values()))
-        alive_count = len(alive_cats)
-
-        # if large amount of the population is already sick, stop spreading
-        if already_sick_count >= alive_count * .25:
-            return
-
-        meds = get_med_cats(Cat)
-
-        for illness in cat.illnesses:
-            # check if illness can infect other cats
-            if cat.illnesses[illness]["infectiousness"] == 0:
-                continue
-            chance = cat.illnesses[illness]["infectiousness"]
-            chance += len(meds) * 7
-            if not int(random.random() * chance):  # 1/chance to infect
-                # fleas are the only condition allowed to spread outside of cold seasons
-                if game.clan.current_season not in ["Leaf-bare", "Leaf-fall"
-                                                    ] and illness != 'fleas':
-                    continue
-                if illness == 'kittencough':
-                    # adjust alive cats list to only include kittens
-                    alive_cats = list(
-                        filter(
-                            lambda kitty:
-                            (kitty.status in ['kitten', 'newborn'] and not kitty.dead and
-                             not kitty.outside), Cat.all_cats.values()))
-                    alive_count = len(alive_cats)
-
-                max_infected = int(alive_count / 2)  # 1/2 of alive cats
-                # If there are less than two cat to infect,
-                # you are allowed to infect all the cats
-                if max_infected < 2:
-                    max_infected = alive_count
-                # If, event with all the cats, there is less
-                # than two cats to infect, cancel outbreak.
-                if max_infected < 2:
-                    return
-
-                weights = []
-                population = []
-                for n in range(2, max_infected + 1):
-                    population.append(n)
-                    weight = 1 / (0.75 * n
-                                  )  # Lower chance for more infected cats
-                    weights.append(weight)
-                infected_count = random.choices(
-                    population, weights=weights)[0]  # the infected..
-
-                infected_names = []
-                involved_cats = []
-                infected_cats = random.sample(alive_cats, infected_count)
-                for sick_meowmeow in infected_cats:
-                    infected_names.append(str(sick_meowmeow.name))
-                    involved_cats.append(sick_meowmeow.ID)
-                    sick_meowmeow.get_ill(
-                        illness, event_triggered=True)  # SPREAD THE GERMS >:)
-
-                illness_name = str(illness).capitalize()
-                if illness == 'kittencough':
-                    event = f'{illness_name} has spread around the nursery. ' \
-                            f'{", ".join(infected_names[:-1])}, and ' \
-                            f'{infected_names[-1]} have been infected.'
-                elif illness == 'fleas':
-                    event = f'Fleas have been hopping from pelt to pelt and now ' \
-                            f'{", ".join(infected_names[:-1])}, ' \
-                            f'and {infected_names[-1]} are all infested.'
-                else:
-                    event = f'{illness_name} has spread around the camp. ' \
-                            f'{", ".join(infected_names[:-1])}, and ' \
-                            f'{infected_names[-1]} have been infected.'
-
-                game.cur_events_list.append(
-                    Single_Event(event, "health", involved_cats))
-                # game.health_events_list.append(event)
-                break
-
     def coming_out(self, cat):
         """turnin' the kitties trans..."""
         if cat.genderalign == cat.gender:
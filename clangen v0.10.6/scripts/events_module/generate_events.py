@@ -3,6 +3,7 @@
 import random
 
 import ujson
+from scripts.cat.ages import Age
 from scripts.game_structure.game_essentials import game
 
 resource_directory = "resources/dicts/events/"
@@ -14,6 +15,13 @@ resource_directory = "resources/dicts/events/"
 
 class GenerateEvents:
     loaded_events = {}
+
+    # (family relation, relationship value, trait, body status): death reactions, with "general" as the trait for
+    # the ones any cat can have. Each file is read the first time it's needed, and kept.
+    death_reactions = {}
+    loaded_death_reactions = set()  # (family relation, relationship value) of the files that have been read
+    # Every reaction a cat could have, by the arguments of possible_death_reactions
+    possible_death_reaction_lists = {}
     
     INJURY_DISTRIBUTION = None
     with open(f"resources/dicts/conditions/event_injuries_distribution.json", 'r') as read_file:
@@ -400,7 +408,7 @@ class GenerateEvents:
                     continue
                 if "other_cat_elder" in event.tags and other_cat.status != "elder":
                     continue
-                if "other_cat_adult" in event.tags and other_cat.age in ["senior", "kitten", "newborn"]:
+                if "other_cat_adult" in event.tags and other_cat.age_group in (Age.NEWBORN, Age.KITTEN, Age.SENIOR):
                     continue
                 if "other_cat_kit" in event.tags and other_cat.status not in ['newborn', 'kitten']:
                     continue
@@ -592,25 +600,40 @@ class GenerateEvents:
                 )
                 return event
 
+    @staticmethod
+    def load_death_reactions(family_relation, rel_value):
+        if (family_relation, rel_value) in GenerateEvents.loaded_death_reactions:
+            return
+        GenerateEvents.loaded_death_reactions.add((family_relation, rel_value))
+
+        events = GenerateEvents.get_death_reaction_dicts(family_relation, rel_value)
+        if not events:
+            return
+        for trait, reactions in events.items():
+            for body_status, texts in reactions.items():
+                GenerateEvents.death_reactions[(family_relation, rel_value, trait, body_status)] = texts
+
     @staticmethod
     def possible_death_reactions(family_relation, rel_value, trait, body_status):
-        possible_events = []
-        # grab general events first, since they'll always exist
-        events = GenerateEvents.get_death_reaction_dicts("general", rel_value)
-        possible_events.extend(events["general"][body_status])
-        if trait in events:
-            possible_events.extend(events[trait][body_status])
+        key = (family_relation, rel_value, trait, body_status)
+        if key in GenerateEvents.possible_death_reaction_lists:
+            return GenerateEvents.possible_death_reaction_lists[key]
 
-        # grab family events if they're needed. Family events should not be romantic. 
+        # general events first, since they'll always exist. Family events are added if they're needed, but
+        # family events should not be romantic.
+        relations = ["general"]
         if family_relation != 'general' and rel_value != "romantic":
-            events = GenerateEvents.get_death_reaction_dicts(family_relation, rel_value)
-            possible_events.extend(events["general"][body_status])
-            if trait in events:
-                possible_events.extend(events[trait][body_status])
-
-        # print(possible_events)
+            relations.append(family_relation)
 
-        return possible_events
+        possible_events = []
+        for relation in relations:
+            GenerateEvents.load_death_reactions(relation, rel_value)
+            possible_events.extend(GenerateEvents.death_reactions.get((relation, rel_value, "general", body_status), ()))
+            if trait != "general":
+                possible_events.extend(GenerateEvents.death_reactions.get((relation, rel_value, trait, body_status), ()))
+
+        GenerateEvents.possible_death_reaction_lists[key] = tuple(possible_events)
+        return GenerateEvents.possible_death_reaction_lists[key]
 
 
 class ShortEvent:
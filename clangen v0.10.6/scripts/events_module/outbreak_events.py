@@ -0,0 +1,152 @@
+import random
+from heapq import nlargest
+
+from scripts.cat.cats import Cat
+from scripts.conditions import condition_store
+from scripts.event_class import Single_Event
+from scripts.game_structure.game_essentials import game
+from scripts.utility import get_med_cats
+
+
+# ---------------------------------------------------------------------------- #
+#                            Outbreak Event Class                              #
+# ---------------------------------------------------------------------------- #
+
+class Outbreak_Events():
+    """Illnesses spreading through the Clan. Runs once a moon, after every cat has had their moon."""
+
+    @staticmethod
+    def handle_outbreaks():
+        """Gives every sick cat a chance to spread their illness. Only the sick cats are looked at, the rest of
+            the Clan is only gone through if an illness actually spreads."""
+        sick_cats = condition_store.get_cats("illnesses")
+        if game.clan.game_mode == 'classic' or not sick_cats:
+            condition_store.contacts.clear()
+            return
+
+        config = game.config["outbreaks"]
+        med_modifier = len(get_med_cats(Cat)) * config["med_cat_modifier"]
+        sick_count = len(sick_cats)
+        dens = None
+
+        for cat in sick_cats:
+            illness = Outbreak_Events.roll_outbreak(cat, med_modifier)
+            if not illness:
+                continue
+
+            if dens is None:
+                dens = Outbreak_Events.get_healthy_cats_by_den()
+            healthy_count = sum(len(den_cats) for den_cats in dens.values())
+            # if large amount of the population is already sick, stop spreading
+            if sick_count >= healthy_count * config["max_sick_fraction"]:
+                break
+
+            infected_cats = Outbreak_Events.choose_infected_cats(cat, illness, dens)
+            if not infected_cats:
+                continue
+
+            for sick_meowmeow in infected_cats:
+                sick_meowmeow.get_ill(illness, event_triggered=True)  # SPREAD THE GERMS >:)
+                for den_cats in dens.values():
+                    den_cats.pop(sick_meowmeow.ID, None)
+            sick_count += len(infected_cats)
+
+            game.cur_events_list.append(Outbreak_Events.get_outbreak_event(illness, infected_cats))
+
+        condition_store.contacts.clear()
+
+    @staticmethod
+    def get_den(cat):
+        return game.config["outbreaks"]["dens"].get(cat.status, "warrior den")
+
+    @staticmethod
+    def get_healthy_cats_by_den():
+        """returns a dict of den -> {cat ID: cat} with every living cat in the Clan that isn't sick"""
+        dens = {}
+        for cat in Cat.all_cats.values():
+            if cat.dead or cat.outside or cat.illnesses:
+                continue
+            dens.setdefault(Outbreak_Events.get_den(cat), {})[cat.ID] = cat
+        return dens
+
+    @staticmethod
+    def roll_outbreak(cat, med_modifier):
+        """returns the illness the cat spreads this moon, or None if they don't spread any"""
+        config = game.config["outbreaks"]
+        for illness in cat.illnesses:
+            # check if illness can infect other cats
+            if cat.illnesses[illness]["infectiousness"] == 0:
+                continue
+            chance = cat.illnesses[illness]["infectiousness"] + med_modifier
+            if not int(random.random() * chance):  # 1/chance to infect
+                # some illnesses can only spread in cold seasons
+                if game.clan.current_season not in config["spreading_seasons"] and \
+                        illness not in config["spreads_in_any_season"]:
+                    continue
+                return illness
+        return None
+
+    @staticmethod
+    def choose_infected_cats(cat, illness, dens):
+        """
+        picks the cats that catch the illness from the sick cat. Cats that share a den with them or
+        interacted with them this moon are likelier to be picked.
+        :param cat: the sick cat
+        :param illness: the illness that's spreading
+        :param dens: the healthy cats, as given by get_healthy_cats_by_den
+        """
+        config = game.config["outbreaks"]
+        allowed_dens = config["illness_dens"].get(illness)
+        cat_den = Outbreak_Events.get_den(cat)
+        contacts = condition_store.get_contacts(cat.ID)
+
+        candidates = []
+        weights = []
+        for den, den_cats in dens.items():
+            if allowed_dens and den not in allowed_dens:
+                continue
+            den_weight = config["same_den_weight"] if den == cat_den else config["other_den_weight"]
+            for cat_id, den_cat in den_cats.items():
+                candidates.append(den_cat)
+                weights.append(config["contact_weight"] if cat_id in contacts else den_weight)
+
+        max_infected = int(len(candidates) * config["max_infected_fraction"])
+        # If there are less than two cat to infect,
+        # you are allowed to infect all the cats
+        if max_infected < 2:
+            max_infected = len(candidates)
+        # If, event with all the cats, there is less
+        # than two cats to infect, cancel outbreak.
+        if max_infected < 2:
+            return []
+
+        population = list(range(2, max_infected + 1))
+        # Lower chance for more infected cats
+        count_weights = [1 / (0.75 * n) for n in population]
+        infected_count = random.choices(population, weights=count_weights)[0]  # the infected..
+
+        # Weighted sample without replacement: every cat draws a key, and the highest keys are infected.
+        keyed = [(random.random() ** (1 / weight), i) for i, weight in enumerate(weights) if weight > 0]
+        if len(keyed) < 2:
+            return []
+        return [candidates[i] for _, i in nlargest(infected_count, keyed)]
+
+    @staticmethod
+    def get_outbreak_event(illness, infected_cats):
+        infected_names = [str(infected_cat.name) for infected_cat in infected_cats]
+        involved_cats = [infected_cat.ID for infected_cat in infected_cats]
+
+        illness_name = str(illness).capitalize()
+        if illness == 'kittencough':
+            event = f'{illness_name} has spread around the nursery. ' \
+                    f'{", ".join(infected_names[:-1])}, and ' \
+                    f'{infected_names[-1]} have been infected.'
+        elif illness == 'fleas':
+            event = f'Fleas have been hopping from pelt to pelt and now ' \
+                    f'{", ".join(infected_names[:-1])}, ' \
+                    f'and {infected_names[-1]} are all infested.'
+        else:
+            event = f'{illness_name} has spread around the camp. ' \
+                    f'{", ".join(infected_names[:-1])}, and ' \
+                    f'{infected_names[-1]} have been infected.'
+        return Single_Event(event, "health", involved_cats)
@@ -0,0 +1,156 @@
+import random
+
+
+class CampLayout():
+    """Works out where each cat sits on the camp screen.
+
+        Every den place in the layout can hold two cats, the second one a little offset from the first. The free
+        places of each den are worked out once per layout. Cats pick a den by their status (see den_weights), and
+        get a free place in it. Once every place is taken, the rest of the cats are spread out on a grid around the
+        den they picked, so big Clans don't end up piled on top of each other.
+
+        Everything is picked with a random generator seeded by the Clan and moon, and the result is kept until the
+        moon, the layout or the cats in camp change, so cats stay put when switching screens. """
+
+    dens = ["nursery place", "leader place", "elder place", "medicine place", "apprentice place",
+            "clearing place", "warrior place"]
+
+    # Weights for each den, in the same order as dens.
+    den_weights = {
+        "apprentice": [1, 50, 1, 1, 100, 100, 1],
+        "mediator apprentice": [1, 50, 1, 1, 100, 100, 1],
+        "deputy": [1, 50, 1, 1, 1, 50, 1],
+        "elder": [1, 1, 2000, 1, 1, 1, 1],
+        "kitten": [60, 8, 1, 1, 1, 1, 1],
+        "medicine cat apprentice": [20, 20, 20, 400, 1, 1, 1],
+        "medicine cat": [20, 20, 20, 400, 1, 1, 1],
+        "warrior": [1, 1, 1, 1, 1, 60, 60],
+        "mediator": [1, 1, 1, 1, 1, 60, 60],
+        "leader": [1, 200, 1, 1, 1, 1, 1],
+    }
+    # For newborns, when they are allowed out of the nursery.
+    roaming_weights = [1, 100, 1, 1, 1, 100, 50]
+
+    offset = 15  # how far the second cat in a place is moved
+    grid_size = 40  # size of the grid cells that cats are spread out on, once the dens are full
+    max_grid_distance = 6  # how many cells away from their den a cat can be spread out
+    max_position = (1500, 1180)  # so spread out cats stay on screen and above the buttons
+
+    def __init__(self):
+        self.den_places = {}  # layout name: {den: [(position, tag), ...]}
+        self.cache_key = None
+        self.placements = {}  # cat ID: position
+
+    def get_den_places(self, layout_name, layout):
+        """Returns every place in each den of the layout, with each place in there twice: once for each cat that
+            can sit there. """
+        if layout_name not in self.den_places:
+            self.den_places[layout_name] = {
+                den: [(tuple(pos), tag) for pos, tag in layout[den]] * 2 for den in self.dens
+            }
+        return self.den_places[layout_name]
+
+    def place_cats(self, cats, layout_name, layout, seed, newborns_roam=False):
+        """
+        Gives each of the cats a placement, and returns them as a dict of cat ID: position.
+        :param cats: the cats in camp, in the order they pick their places
+        :param layout_name: name of the layout in placements.json, used to keep its den places
+        :param layout: the layout itself
+        :param seed: the same seed always gives the same placements, if nothing else changed
+        :param newborns_roam: if newborns get a place, rather than hiding in the nursery
+        """
+        cache_key = (layout_name, seed, newborns_roam, tuple((cat.ID, cat.status) for cat in cats))
+        if cache_key != self.cache_key:
+            self.placements = self._choose_placements(cats, self.get_den_places(layout_name, layout), seed,
+                                                      newborns_roam)
+            self.cache_key = cache_key
+
+        for cat in cats:
+            if cat.ID in self.placements:
+                cat.placement = self.placements[cat.ID]
+        return self.placements
+
+    def _choose_placements(self, cats, den_places, seed, newborns_roam):
+        rng = random.Random(seed)
+
+        # Shuffle each den once, so taking a free place is just popping the last one.
+        free_places = {}
+        for den in self.dens:
+            free_places[den] = den_places[den].copy()
+            rng.shuffle(free_places[den])
+        # Places in the dens that are already taken once, so the second cat there is offset.
+        taken = set()
+        taken_cells = set()
+        overflow = []
+
+        placements = {}
+        for cat in cats:
+            if cat.status in self.den_weights:
+                weights = self.den_weights[cat.status]
+            elif newborns_roam:
+                weights = self.roaming_weights
+            else:
+                continue
+
+            open_dens = [i for i, den in enumerate(self.dens) if free_places[den]]
+            if not open_dens:
+                overflow.append((cat, rng.choices(self.dens, weights=weights)[0]))
+                continue
+            den = self.dens[rng.choices(open_dens, weights=[weights[i] for i in open_dens])[0]]
+
+            pos, tag = free_places[den].pop()
+            if (pos, tag) in taken:
+                pos = self._offset(pos, tag, rng, bool(rng.getrandbits(2)))
+            else:
+                taken.add((pos, tag))
+            placements[cat.ID] = pos
+            taken_cells.add(self._get_cell(pos))
+
+        for cat, den in overflow:
+            placements[cat.ID] = self._spread_out(den_places[den], taken_cells, rng)
+
+        return placements
+
+    def _offset(self, pos, tag, rng, shift_x):
+        # Offset based on the "tag". If "y" is in the tag, the cat will be offset down. If "x" is in the tag,
+        # the cat is shifted left or right, always if there's no "y", and if shift_x is True otherwise.
+        x, y = pos
+        if "x" in tag and ("y" not in tag or shift_x):
+            x += self.offset * rng.choice([-1, 1])
+        if "y" in tag:
+            y += self.offset
+        return x, y
+
+    def _get_cell(self, pos):
+        return pos[0] // self.grid_size, pos[1] // self.grid_size
+
+    def _spread_out(self, places, taken_cells, rng):
+        """Finds the closest free grid cell to a random place in the den. If they are all taken, the cat is put on
+            the place, offset like a second cat would be."""
+        pos, tag = rng.choice(places)
+        start_x, start_y = self._get_cell(pos)
+        for distance in range(1, self.max_grid_distance + 1):
+            ring = [(start_x + dx, start_y + dy)
+                    for dx in range(-distance, distance + 1)
+                    for dy in range(-distance, distance + 1)
+                    if max(abs(dx), abs(dy)) == distance]
+            free_cells = [cell for cell in ring
+                          if cell not in taken_cells and self._on_screen(cell, start_x, start_y, pos)]
+            if free_cells:
+                cell = rng.choice(free_cells)
+                taken_cells.add(cell)
+                return self._cell_position(cell, start_x, start_y, pos)
+
+        return self._offset(pos, tag, rng, bool(rng.getrandbits(1)))
+
+    def _cell_position(self, cell, start_x, start_y, pos):
+        # Keep the same spot within the cell as the den place, so cats don't line up on the grid.
+        return (pos[0] + (cell[0] - start_x) * self.grid_size,
+                pos[1] + (cell[1] - start_y) * self.grid_size)
+
+    def _on_screen(self, cell, start_x, start_y, pos):
+        x, y = self._cell_position(cell, start_x, start_y, pos)
+        return 0 <= x <= self.max_position[0] and 0 <= y <= self.max_position[1]
+
+
+camp_layout = CampLayout()
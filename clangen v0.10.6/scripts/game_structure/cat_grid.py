@@ -0,0 +1,177 @@
+import pygame
+import pygame_gui
+
+from scripts.game_structure import image_cache
+from scripts.game_structure.image_button import UISpriteButton
+from scripts.game_structure.game_essentials import game, MANAGER
+from scripts.utility import scale, shorten_text_to_fit
+
+
+class UICatGrid():
+    """A page of cat sprite buttons with a name under each of them.
+
+        The widgets are created once, when the grid is made, and are then recycled: showing a new page of cats
+        only rebinds the sprite, cat and name of each slot, and hides the slots that aren't needed. Slots that
+        already show the right cat are left alone, so re-filtering a list that doesn't change the visible page
+        costs next to nothing.
+
+        All positions are given in the unscaled 1600x1400 layout, like everywhere else. The sprite and name
+        rects are relative to the top-left corner of each cell. """
+
+    def __init__(self,
+                 cell_origin,
+                 cell_step,
+                 columns,
+                 rows,
+                 sprite_rect=((0, 0), (100, 100)),
+                 name_rect=((-100, 100), (300, 60)),
+                 name_length=220,
+                 name_font_size=30,
+                 text_theme="#text_box_30_horizcenter",
+                 name_element=pygame_gui.elements.UILabel,
+                 fav_markers=False,
+                 manager=MANAGER):
+
+        self.cell_origin = cell_origin
+        self.cell_step = cell_step
+        self.columns = columns
+        self.rows = rows
+        self.sprite_rect = sprite_rect
+        self.name_rect = name_rect
+        self.name_length = name_length
+        self.name_font_size = name_font_size
+        self.text_theme = text_theme
+        self.name_element = name_element
+        self.manager = manager
+        self.show_fav = False
+
+        self.fav_marker_image = None
+        if fav_markers:
+            self.fav_marker_image = pygame.transform.scale(
+                image_cache.load_image("resources/images/fav_marker.png").convert_alpha(),
+                scale(pygame.Rect(sprite_rect)).size)
+            if game.settings["dark mode"]:
+                self.fav_marker_image.set_alpha(150)
+
+        blank = pygame.Surface(scale(pygame.Rect(sprite_rect)).size, pygame.SRCALPHA)
+
+        self.slots = []
+        for i in range(self.page_size):
+            x = cell_origin[0] + (i % columns) * cell_step[0]
+            y = cell_origin[1] + (i // columns) * cell_step[1]
+            slot = {"cat": None, "fav": False, "name_text": None, "fav_marker": None}
+
+            # The marker has to be created first, so it is drawn under the cat.
+            if self.fav_marker_image:
+                slot["fav_marker"] = pygame_gui.elements.UIImage(
+                    scale(pygame.Rect((x + sprite_rect[0][0], y + sprite_rect[0][1]), sprite_rect[1])),
+                    self.fav_marker_image, visible=0, manager=manager)
+                slot["fav_marker"].disable()
+
+            slot["sprite"] = UISpriteButton(
+                scale(pygame.Rect((x + sprite_rect[0][0], y + sprite_rect[0][1]), sprite_rect[1])),
+                blank, visible=0, starting_height=0, manager=manager)
+            slot["name"] = self._create_name(x, y)
+
+            self.slots.append(slot)
+
+    @property
+    def page_size(self):
+        return self.columns * self.rows
+
+    def _create_name(self, x, y):
+        rect = scale(pygame.Rect((x + self.name_rect[0][0], y + self.name_rect[0][1]), self.name_rect[1]))
+        # Text boxes and labels take their first two arguments in opposite orders.
+        if issubclass(self.name_element, pygame_gui.elements.UITextBox):
+            name = self.name_element("", rect, object_id=self.text_theme, manager=self.manager)
+        else:
+            name = self.name_element(rect, "", object_id=self.text_theme, manager=self.manager)
+        name.hide()
+        return name
+
+    def set_text_theme(self, text_theme):
+        """Changes the theme of the names. pygame_gui elements can't swap their theme, so the name elements are
+            remade, but only when the theme actually changes."""
+        if text_theme == self.text_theme:
+            return
+
+        self.text_theme = text_theme
+        for i, slot in enumerate(self.slots):
+            slot["name"].kill()
+            slot["name"] = self._create_name(self.cell_origin[0] + (i % self.columns) * self.cell_step[0],
+                                             self.cell_origin[1] + (i // self.columns) * self.cell_step[1])
+            slot["name_text"] = None
+            if slot["cat"]:
+                self._bind_name(slot, slot["cat"])
+
+    def set_cats(self, cats, show_fav=False):
+        """Shows the given cats, in order. Any cats past the page size are ignored, and left over slots are
+            hidden. """
+        self.show_fav = show_fav
+        for i, slot in enumerate(self.slots):
+            cat = cats[i] if i < len(cats) else None
+            if cat is None:
+                self._clear_slot(slot)
+                continue
+
+            fav = bool(show_fav and cat.favourite and slot["fav_marker"])
+            if slot["cat"] is cat and slot["fav"] == fav:
+                continue
+
+            if slot["cat"] is not cat:
+                slot["sprite"].set_image(pygame.transform.scale(cat.sprite, slot["sprite"].image.relative_rect.size))
+                slot["sprite"].button.set_id(cat.ID)
+                slot["sprite"].button.cat_object = cat
+                slot["sprite"].show()
+                self._bind_name(slot, cat)
+
+            if fav:
+                slot["fav_marker"].show()
+            elif slot["fav_marker"]:
+                slot["fav_marker"].hide()
+
+            slot["cat"] = cat
+            slot["fav"] = fav
+
+    def _bind_name(self, slot, cat):
+        short_name = shorten_text_to_fit(str(cat.name), self.name_length, self.name_font_size)
+        if short_name != slot["name_text"]:
+            slot["name"].set_text(short_name)
+            slot["name_text"] = short_name
+        slot["name"].show()
+
+    @staticmethod
+    def _clear_slot(slot):
+        if slot["cat"] is None:
+            return
+        slot["sprite"].hide()
+        slot["name"].hide()
+        if slot["fav_marker"]:
+            slot["fav_marker"].hide()
+        slot["cat"] = None
+        slot["fav"] = False
+
+    def refresh(self):
+        """Forces every visible slot to be rebound, for when the cats themselves have changed. """
+        cats = [slot["cat"] for slot in self.slots if slot["cat"]]
+        for slot in self.slots:
+            self._clear_slot(slot)
+        self.set_cats(cats, self.show_fav)
+
+    def get_cat(self, ui_element):
+        """Returns the cat shown by the sprite button that is ui_element, or None if it isn't one of ours. """
+        for slot in self.slots:
+            if slot["cat"] and slot["sprite"] == ui_element:
+                return slot["cat"]
+        return None
+
+    def __contains__(self, ui_element):
+        return self.get_cat(ui_element) is not None
+
+    def kill(self):
+        for slot in self.slots:
+            slot["sprite"].kill()
+            slot["name"].kill()
+            if slot["fav_marker"]:
+                slot["fav_marker"].kill()
+        self.slots = []
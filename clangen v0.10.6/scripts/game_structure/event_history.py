@@ -0,0 +1,205 @@
+"""
+A moon by moon history of every event, so that old moons aren't lost when the next timeskip clears
+game.cur_events_list.
+
+Each finished moon is a save file of its own, event_history/<moon>.json in the Clan's save folder, holding a json
+list of that moon's events:
+    [{"text": "...", "types": ["health"], "cats_involved": ["23"]}, ...]
+They're saved through the save session like the rest of the save, so they go in the Clan's archive or database
+if it has one, and are never out of step with the rest of the save. A moon's file is written by the first save
+after the moon is finished and never again, so saving only costs as much as the new moons.
+
+Loading a Clan only lists the moons. The event types and cats each moon has are read from the moon files the first
+time they're asked for, and kept up to date from then on. The events themselves are read when a moon or a cat is
+asked for, so the size of the history doesn't matter for memory use.
+"""
+import os
+
+import ujson
+
+from scripts.event_class import Single_Event
+from scripts.game_structure.save_archive import list_save_dir, read_save_file
+from scripts.game_structure.save_session import SaveSession
+
+
+class EventHistory():
+    """Keeps track of the event history of the loaded Clan. """
+
+    FOLDER = "event_history"
+    # One log for the whole history, with an index next to it, as it was saved before there was a file per moon.
+    # It's moved into moon files by the next save.
+    OLD_LOG_FILE = "event_history.log"
+    OLD_INDEX_FILE = "event_history_index.json"
+
+    def __init__(self):
+        self.clan_dir = None
+        # The moons that have a saved file
+        self.moons = set()
+        # event type -> set of moons, and cat ID -> set of moons. None until they're first needed.
+        self.types = None
+        self.cats = None
+        # Finished moons that haven't been saved yet, as (moon, list of event dicts)
+        self.pending = []
+        # Save files to remove on the next save: moon files of an older Clan of the same name, or of moons the
+        # rest of the save never got to, and the old log.
+        self.stale = []
+
+    def moon_path(self, moon):
+        return os.path.join(self.clan_dir, EventHistory.FOLDER, f"{moon}.json")
+
+    def _clear(self):
+        self.moons = set()
+        self.types = None
+        self.cats = None
+        self.pending = []
+        self.stale = []
+
+    def _list_moon_files(self):
+        """Returns (moon, path) for every moon file in the Clan's save. """
+        moon_files = []
+        for file_name in list_save_dir(os.path.join(self.clan_dir, EventHistory.FOLDER)):
+            moon, extension = os.path.splitext(file_name)
+            if extension == ".json" and moon.isdigit():
+                moon_files.append((int(moon), self.moon_path(moon)))
+        return moon_files
+
+    def new_clan(self, clan_dir):
+        """Starts an empty history for a freshly made Clan. Anything left in the folder from an older Clan of the
+            same name is removed on the next save. """
+        self.clan_dir = clan_dir
+        self._clear()
+        self.stale = [path for _, path in self._list_moon_files()]
+        for file_name in (EventHistory.OLD_LOG_FILE, EventHistory.OLD_INDEX_FILE):
+            if os.path.exists(os.path.join(clan_dir, file_name)):
+                self.stale.append(os.path.join(clan_dir, file_name))
+
+    def load(self, clan_dir, current_moon):
+        """Finds the moons of the Clan saved in clan_dir. current_moon is the age of the loaded Clan: any moons
+            from that one on don't belong to this save, and are removed on the next save. """
+        self.clan_dir = clan_dir
+        self._clear()
+        for moon, path in self._list_moon_files():
+            if moon < current_moon:
+                self.moons.add(moon)
+            else:
+                self.stale.append(path)
+
+        if os.path.exists(os.path.join(clan_dir, EventHistory.OLD_LOG_FILE)):
+            self._load_old_log(current_moon)
+
+    def _load_old_log(self, current_moon):
+        """Reads the old single log into pending moons, so the next save writes them as moon files. """
+        log_path = os.path.join(self.clan_dir, EventHistory.OLD_LOG_FILE)
+        moons = {}
+        with open(log_path, 'rb') as read_file:
+            for line in read_file:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unfinished record")
+                    record = ujson.loads(line)
+                except ValueError:
+                    # The end of a save that never finished
+                    break
+                moon = record.pop("moon")
+                if moon < current_moon and moon not in self.moons:
+                    moons.setdefault(moon, []).append(record)
+
+        self.pending.extend(sorted(moons.items()))
+        self.stale.append(log_path)
+        index_path = os.path.join(self.clan_dir, EventHistory.OLD_INDEX_FILE)
+        if os.path.exists(index_path):
+            self.stale.append(index_path)
+
+    def _read_moon(self, moon):
+        return ujson.loads(read_save_file(self.moon_path(moon)))
+
+    def _build_index(self):
+        if self.types is not None:
+            return
+        self.types = {}
+        self.cats = {}
+        for moon in self.moons:
+            self._index_moon(moon, self._read_moon(moon))
+
+    def _index_moon(self, moon, records):
+        for record in records:
+            for event_type in record.get("types", []):
+                self.types.setdefault(event_type, set()).add(moon)
+            for cat_id in record.get("cats_involved", []):
+                self.cats.setdefault(str(cat_id), set()).add(moon)
+
+    def add_moon(self, moon, events):
+        """Adds the events of a finished moon. They're kept in memory until the next save. """
+        if self.clan_dir is None:
+            return
+        records = [event.to_dict() for event in events if isinstance(event.text, str)]
+        self.pending = [(m, r) for m, r in self.pending if m != moon]
+        if moon not in self.moons:
+            self.pending.append((moon, records))
+
+    def save(self):
+        """Stages a file for every pending moon in the open save session, and the removal of stale files. The
+            moons only count as saved once the session is. """
+        if self.clan_dir is None:
+            return
+        if not self.pending and not self.stale:
+            return
+        if SaveSession.active is None:
+            raise RuntimeError("The event history can only be saved in a save session, see game.save_session")
+
+        written = list(self.pending)
+        removed = list(self.stale)
+        for path in removed:
+            SaveSession.active.remove(path)
+        for moon, records in written:
+            SaveSession.active.write(self.moon_path(moon), ujson.dumps(records))
+
+        def mark_saved():
+            for moon, records in written:
+                self.moons.add(moon)
+                if self.types is not None:
+                    self._index_moon(moon, records)
+            self.pending = [pending for pending in self.pending if pending not in written]
+            self.stale = [path for path in self.stale if path not in removed]
+
+        SaveSession.active.on_commit(mark_saved)
+
+    def get_moons(self, event_type=None):
+        """Returns a sorted list of the moons that have history. If event_type is given, only moons where
+            an event of that type happened are returned. """
+        if event_type is None:
+            moons = set(self.moons)
+            moons.update(moon for moon, records in self.pending if records)
+        else:
+            self._build_index()
+            moons = set(self.types.get(event_type, ()))
+            moons.update(moon for moon, records in self.pending
+                         if any(event_type in record["types"] for record in records))
+        return sorted(moons)
+
+    def get_moon(self, moon):
+        """Returns the events of the given moon as a list of Single_Event. """
+        for pending_moon, records in self.pending:
+            if pending_moon == moon:
+                return [Single_Event.from_dict(record) for record in records]
+
+        if moon not in self.moons:
+            return []
+        return [Single_Event.from_dict(record) for record in self._read_moon(moon)]
+
+    def get_cat_events(self, cat_id):
+        """Returns every event the cat was involved in, oldest first, as a list of (moon, Single_Event). """
+        cat_id = str(cat_id)
+        self._build_index()
+        moons = {moon: None for moon in self.cats.get(cat_id, ())}
+        moons.update((moon, records) for moon, records in self.pending)
+
+        events = []
+        for moon in sorted(moons):
+            records = moons[moon] if moons[moon] is not None else self._read_moon(moon)
+            events.extend((moon, Single_Event.from_dict(record)) for record in records
+                          if cat_id in [str(i) for i in record["cats_involved"]])
+        return events
+
+
+event_history = EventHistory()
@@ -5,9 +5,16 @@ from scripts.housekeeping.datadir import get_save_dir, get_temp_dir
 
 import ujson
 import os
+from contextlib import contextmanager
 from shutil import move as shutil_move
 from ast import literal_eval
 from scripts.event_class import Single_Event
+from scripts.game_structure.event_history import event_history
+from scripts.game_structure import image_cache, save_archive
+from scripts.game_structure.save_archive import find_member, list_save_dir, read_save_file, uses_archive
+from scripts.game_structure.save_session import SaveSession
+from scripts.game_structure.settings_snapshot import SettingsSnapshot
+from scripts.game_structure.state_lock import state_lock
 
 pygame.init()
 
@@ -149,7 +156,8 @@ class Game():
         "showcoords": False,
         "showbounds": False,
         "visualdebugmode": False,
-        "showfps": False
+        "showfps": False,
+        "profiletimeskip": False
     }
 
     # Init Settings
@@ -172,10 +180,13 @@ class Game():
     #End init settings
 
     settings_changed = False
+    _snapshot = None  # see the snapshot property
 
     # CLAN
     clan = None
     cat_class = None
+    history_store = None
+    condition_store = None
     config = {}
     prey_config = {}
 
@@ -199,8 +210,30 @@ class Game():
             self.config['fun']['newborns_can_roam'] = True
             self.config['fun']['newborns_can_patrol'] = True
 
+        image_cache.set_memory_budget(self.config["image_cache"]["memory_budget_mb"] * 1024 * 1024)
+        save_archive.new_save_format = self.config["save_load"]["save_format"]
+
+    @property
+    def snapshot(self) -> SettingsSnapshot:
+        """The settings hot code reads, as plain attributes, see settings_snapshot."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.clan is not self.clan:
+            snapshot = self.refresh_snapshot()
+        return snapshot
+
+    @snapshot.setter
+    def snapshot(self, snapshot: SettingsSnapshot):
+        self._snapshot = snapshot
+
+    def refresh_snapshot(self):
+        """Call this after changing a setting that's in the snapshot."""
+        self._snapshot = SettingsSnapshot.from_game(self)
+        return self._snapshot
+
     def update_game(self):
-        if self.current_screen != self.switches['cur_screen']:
+        # A new screen builds its pages from the cats, so it waits for work on another thread to stop changing
+        # them (see state_lock).
+        if self.current_screen != self.switches['cur_screen'] and not state_lock.is_changing():
             self.current_screen = self.switches['cur_screen']
             self.switch_screens = True
         self.clicked = False
@@ -212,7 +245,9 @@ class Game():
             in json format. If check_integrity is true, it will read back the file
             to check that the correct data has been written to the file. 
             If not, it will simply write the data to the file with no other
-            checks. """
+            checks. 
+            If a save session is open, the file is staged instead, and is
+            checked and written for real when the session is closed. """
 
         # If write_data is not a string,
         if type(write_data) is not str:
@@ -220,6 +255,17 @@ class Game():
         else:
             _data = write_data
 
+        if SaveSession.active is not None:
+            SaveSession.active.write(path, _data)
+            return
+
+        # Files in an archive can only be saved by writing a new archive, which is what a session does.
+        member = find_member(path)
+        if member and uses_archive(member[0]):
+            with Game.save_session():
+                SaveSession.active.write(path, _data)
+            return
+
         dir_name, file_name = os.path.split(path)
 
         if check_integrity:
@@ -262,6 +308,36 @@ class Game():
                 write_file.flush()
                 os.fsync(write_file.fileno())
 
+    @staticmethod
+    def safe_remove(path: str):
+        """ Deletes a save file. If a save session is open, it will only
+            be deleted if the session is saved successfully. """
+        member = find_member(path)
+        if SaveSession.active is None and member and uses_archive(member[0]):
+            with Game.save_session():
+                SaveSession.active.remove(path)
+        elif SaveSession.active is not None:
+            SaveSession.active.remove(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    @staticmethod
+    @contextmanager
+    def save_session():
+        """ Opens a save session, to be used in a with statement. Every file
+            saved with safe_save inside it is saved all at once at the end, or
+            not at all if something goes wrong. If a timeskip is running on
+            another thread, it waits for it to finish first, so a save is never
+            half before and half after a moon. """
+        with state_lock.reading(), SaveSession(get_temp_dir() + "/save_session") as session:
+            yield session
+
+    @staticmethod
+    def recover_save_session():
+        """ Finishes or throws away a save that was interrupted by the game
+            closing. Has to be run before any save is loaded. """
+        return SaveSession.recover(get_temp_dir() + "/save_session")
+
     def read_clans(self):
         '''with open(get_save_dir() + '/clanlist.txt', 'r') as read_file:
             clan_list = read_file.read()
@@ -359,6 +435,7 @@ class Game():
         for key, value in settings_data.items():
             if key in self.settings:
                 self.settings[key] = value
+        self.refresh_snapshot()
 
         self.switches['language'] = self.settings['language']
         if self.settings['language'] != 'english':
@@ -388,6 +465,7 @@ class Game():
             # Else move on to the next item on the list
             self.settings[setting_name] = self.setting_lists[setting_name][
                 list_index + 1]
+        self.refresh_snapshot()
 
     def save_cats(self):
         """Save the cat data."""
@@ -404,10 +482,10 @@ class Game():
             os.makedirs(directory)
 
         # Delete all existing relationship files
-        if not os.path.exists(directory + '/relationships'):
-            os.makedirs(directory + '/relationships')
-        for f in os.listdir(directory + '/relationships'):
-            os.remove(os.path.join(directory + '/relationships', f))
+        if not uses_archive(directory):
+            os.makedirs(directory + '/relationships', exist_ok=True)
+        for f in list_save_dir(directory + '/relationships'):
+            self.safe_remove(os.path.join(directory + '/relationships', f))
 
         self.save_faded_cats(clanname)  # Fades cat and saves them, if needed
 
@@ -416,26 +494,27 @@ class Game():
             cat_data = inter_cat.get_save_dict()
             clan_cats.append(cat_data)
 
-            # Don't save conditions for classic condition. This
-            # should allow closing and reloading to clear conditions on
-            # classic, just in case a condition is accidently applied.
-            if game.game_mode != "classic":
-                inter_cat.save_condition()
-
-            if inter_cat.history:
-                inter_cat.save_history(directory + '/history')
-                # after saving, dump the history info
-                inter_cat.history = None
             if not inter_cat.dead:
                 inter_cat.save_relationship_of_cat(
                     directory + '/relationships')
 
+        # Don't save conditions for classic condition. This
+        # should allow closing and reloading to clear conditions on
+        # classic, just in case a condition is accidently applied.
+        if game.game_mode != "classic":
+            self.condition_store.save(directory)
+
+        # Only the histories that changed get written.
+        if not uses_archive(directory):
+            os.makedirs(directory + '/history', exist_ok=True)
+        self.history_store.save(directory + '/history')
+
         self.safe_save(
             f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
 
     def save_faded_cats(self, clanname):
         """Deals with fades cats, if needed, adding them as faded """
-        if game.cat_to_fade:
+        if game.cat_to_fade and not uses_archive(get_save_dir() + '/' + clanname):
             directory = get_save_dir() + '/' + clanname + "/faded_cats"
             if not os.path.exists(directory):
                 os.makedirs(directory)
@@ -497,20 +576,26 @@ class Game():
 
     def save_events(self):
         """
-        Save current events list to events.json
+        Save current events list to events.json, and add any finished moons to the event history.
         """
         events_list = []
         for event in game.cur_events_list:
             events_list.append(event.to_dict())
         game.safe_save(
             f"{get_save_dir()}/{game.clan.name}/events.json", events_list)
+        event_history.save()
 
     def add_faded_offspring_to_faded_cat(self, parent, offspring):
         """In order to siblings to work correctly, and not to lose relation info on fading, we have to keep track of
         both active and faded cat's faded offpsring. This will add a faded offspring to a faded parents file. """
+        path = get_save_dir() + '/' + self.clan.name + '/faded_cats/' + parent + ".json"
         try:
-            with open(get_save_dir() + '/' + self.clan.name + '/faded_cats/' + parent + ".json", 'r') as read_file:
-                cat_info = ujson.loads(read_file.read())
+            if SaveSession.active is not None and SaveSession.active.staged_path(path) != path:
+                # The parent may have faded earlier in this same save.
+                with open(SaveSession.active.staged_path(path), 'r') as read_file:
+                    cat_info = ujson.loads(read_file.read())
+            else:
+                cat_info = ujson.loads(read_save_file(path))
         except:
             print("ERROR: loading faded cat")
             return False
@@ -528,11 +613,11 @@ class Game():
         """
 
         clanname = self.clan.name
+        event_history.load(f'{get_save_dir()}/{clanname}', self.clan.age)
         events_path = f'{get_save_dir()}/{clanname}/events.json'
         events_list = []
         try:
-            with open(events_path, 'r') as f:
-                events_list = ujson.loads(f.read())
+            events_list = ujson.loads(read_save_file(events_path))
             for event_dict in events_list:
                 event_obj = Single_Event.from_dict(event_dict)
                 if event_obj:
@@ -1,11 +1,140 @@
+import threading
+from collections import OrderedDict
+from os.path import exists as path_exists
+
 import pygame
 
-_images = {}
+
+class ImageCache():
+    """
+    Keeps loaded images, so the same file isn't loaded over and over.
+
+    The images are kept until they take up more than memory_budget bytes, then the ones that were used the longest
+    ago are dropped. Files that were looked for and aren't there are remembered as well, so art that doesn't exist
+    (a lot of patrols don't have their own) doesn't mean going to the disk every time.
+
+    Images that will likely be needed soon can be loaded in the background with prefetch.
+
+    Don't draw on the images you get from here, they are shared. Convert, copy or scale them first.
+    """
+
+    def __init__(self, memory_budget=128 * 1024 * 1024):
+        self.memory_budget = memory_budget
+        self.images = OrderedDict()  # path: surface, the least recently used first
+        self.memory_used = 0
+        self.found = {}  # path: if the file exists
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_surface_size(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def load(self, path):
+        """
+        If not in the cache already, loads the image from path as a surface.
+        Otherwise, the image is retrieved from the cache.
+        """
+        with self.lock:
+            if path in self.images:
+                self.images.move_to_end(path)
+                return self.images[path]
+
+        try:
+            image = pygame.image.load(path)
+        except FileNotFoundError:
+            with self.lock:
+                self.found[path] = False
+            raise
+        return self._add(path, image)
+
+    def exists(self, path):
+        """Returns if there is an image at path. The answer is remembered, so only the first check goes to the disk."""
+        with self.lock:
+            if path in self.found:
+                return self.found[path]
+            if path in self.images:
+                self.found[path] = True
+                return True
+        # Not with the lock held, so the other thread doesn't wait on the disk
+        found = path_exists(path)
+        with self.lock:
+            self.found[path] = found
+        return found
+
+    def _is_loaded(self, path):
+        with self.lock:
+            return path in self.images
+
+    def prefetch(self, paths):
+        """Loads the images that aren't loaded yet in the background. Paths that don't exist are skipped."""
+        paths = [path for path in paths if not self._is_loaded(path)]
+        if not paths:
+            return
+        thread = threading.Thread(target=self._prefetch, args=(paths,), daemon=True)
+        thread.start()
+
+    def _prefetch(self, paths):
+        for path in paths:
+            if self._is_loaded(path) or not self.exists(path):
+                continue
+            try:
+                self._add(path, pygame.image.load(path))
+            except (pygame.error, OSError) as e:
+                print(f"WARNING: couldn't prefetch {path}: {e}")
+
+    def _add(self, path, image):
+        with self.lock:
+            # If it was loaded in the background at the same time, use that one.
+            if path in self.images:
+                self.images.move_to_end(path)
+                return self.images[path]
+
+            self.images[path] = image
+            self.found[path] = True
+            self.memory_used += self.get_surface_size(image)
+            # Always keep the image that was just asked for, even if it's over budget by itself.
+            self._drop_over_budget(keep=1)
+            return image
+
+    def _drop_over_budget(self, keep=0):
+        """Drops the least recently used images until the rest fit in the budget. Only called with the lock held."""
+        while self.memory_used > self.memory_budget and len(self.images) > keep:
+            _, old_image = self.images.popitem(last=False)
+            self.memory_used -= self.get_surface_size(old_image)
+
+    def set_memory_budget(self, memory_budget):
+        """Changes the budget, and drops the images that no longer fit in it right away."""
+        with self.lock:
+            self.memory_budget = memory_budget
+            self._drop_over_budget()
+
+    def clear(self):
+        with self.lock:
+            self.images.clear()
+            self.memory_used = 0
+            self.found.clear()
+
+
+_cache = ImageCache()
+
+
 def load_image(path):
     """
     If not in the cache already, loads the image from path as a surface.
     Otherwise, the image is retrieved from the cache.
     """
-    if path not in _images:
-        _images[path] = pygame.image.load(path)
-    return _images[path]
+    return _cache.load(path)
+
+
+def image_exists(path):
+    """Like os.path.exists, but remembers the answer. Use it for art that might not be there."""
+    return _cache.exists(path)
+
+
+def prefetch_images(paths):
+    """Starts loading images that are likely to be needed soon, in the background."""
+    _cache.prefetch(paths)
+
+
+def set_memory_budget(memory_budget):
+    _cache.set_memory_budget(memory_budget)
@@ -1,7 +1,9 @@
 import os
 import random
+import sys
 from math import floor
 from .game_essentials import game
+from .save_archive import read_save_file
 from ..cat.history import History
 from ..cat.skills import CatSkills
 from ..housekeeping.datadir import get_save_dir
@@ -11,6 +13,7 @@ import ujson
 from re import sub
 from scripts.cat.pelts import Pelt
 from scripts.cat.cats import Cat, Personality, BACKSTORIES
+from scripts.conditions import condition_store
 from scripts.housekeeping.version import SAVE_VERSION_NUMBER
 from scripts.utility import update_sprite, is_iterable
 from random import choice
@@ -19,6 +22,12 @@ from scripts.cat_relations.inheritance import Inheritance
 import logging
 logger = logging.getLogger(__name__)
 
+# Cat data that's the same for lots of cats.
+INTERNED_KEYS = ["status", "gender", "gender_align", "backstory", "trait", "pelt_name", "pelt_length", "pelt_color",
+                 "eye_colour", "eye_colour2", "pattern", "tortie_base", "tortie_color", "tortie_pattern", "skin",
+                 "tint", "white_patches", "white_patches_tint", "vitiligo", "points", "accessory"]
+
+
 def load_cats():
     try:
         json_load()
@@ -39,8 +48,7 @@ def json_load():
     with open(f"resources/dicts/conversion_dict.json", 'r') as read_file:
         convert = ujson.loads(read_file.read())
     try:
-        with open(clan_cats_json_path, 'r') as read_file:
-            cat_data = ujson.loads(read_file.read())
+        cat_data = ujson.loads(read_save_file(clan_cats_json_path))
     except PermissionError as e:
         game.switches['error_message'] = f'Can\t open {clan_cats_json_path}!'
         game.switches['traceback'] = e
@@ -55,7 +63,11 @@ def json_load():
     # create new cat objects
     for i, cat in enumerate(cat_data):
         try:
-            
+            # Most cats share these, so keep one copy of each instead of one per cat.
+            for key in INTERNED_KEYS:
+                if isinstance(cat.get(key), str):
+                    cat[key] = sys.intern(cat[key])
+
             new_cat = Cat(ID=cat["ID"],
                         prefix=cat["name_prefix"],
                         suffix=cat["name_suffix"],
@@ -193,6 +205,9 @@ def json_load():
             game.switches['traceback'] = e
             raise
 
+    # The conditions of the whole Clan are in one file
+    condition_store.load(f'{get_save_dir()}/{clanname}')
+
     # replace cat ids with cat objects and add other needed variables
     for cat in all_cats:
 
@@ -0,0 +1,322 @@
+"""
+Single file saves. Instead of thousands of small json files, the bulk of a Clan's save (the cats, their
+relationships, histories and conditions, the faded cats, the events and the Clan file) can be kept in one compressed
+archive in the Clan's save folder. Everything else (settings, notes...) stays a normal file.
+
+The archive is the save files, each compressed with zlib on its own, followed by a table of contents:
+
+    MAGIC
+    compressed file
+    compressed file
+    ...
+    table of contents: zlib compressed json of {name: [offset, compressed size, crc32 of the uncompressed data]}
+    offset of the table of contents, 8 bytes little endian
+
+so a file can be read without reading the rest of the archive, and files that didn't change can be copied over
+into the next archive without decompressing them.
+
+The same files can be kept in an SQLite database instead, see save_database.
+
+Saves are read and written through read_save_file, save_file_exists, list_save_dir and game.safe_save, which
+work the same for every kind of save. A Clan uses its archive or database if it has one. Otherwise, new saves and
+Clans that are saved as folders are written in the "save_format" set in game_config.json. pack_clan and
+unpack_clan convert a Clan one way or the other.
+"""
+import os
+import struct
+import zlib
+
+import ujson
+
+from scripts.game_structure.save_database import SaveDatabase
+from scripts.housekeeping.datadir import get_save_dir
+
+
+ARCHIVE_NAME = "save.clanarchive"
+DATABASE_NAME = "save.sqlite"
+MAGIC = b"CLANGENARCHIVE1\n"
+
+# The save files that go in the archive, by their path within the Clan's save folder. The Clan file, which is
+# in the main save folder, is in there as "clan.json".
+ARCHIVED_FILES = ("clan.json", "clan_cats.json", "conditions.json", "events.json")
+ARCHIVED_FOLDERS = ("relationships/", "history/", "faded_cats/", "event_history/")
+
+# "files", "archive" or "database". Set from game_config.json when the game starts.
+new_save_format = "files"
+
+_open_archives = {}  # Clan save folder: SaveArchive or SaveDatabase
+
+
+class SaveArchive():
+    """One archive file. The table of contents is read when it's first needed, files only when they're read."""
+
+    def __init__(self, path):
+        self.path = path
+        self._toc = None
+        self._folders = None
+
+    @property
+    def toc(self):
+        if self._toc is None:
+            with open(self.path, "rb") as read_file:
+                if read_file.read(len(MAGIC)) != MAGIC:
+                    raise ValueError(f"{self.path} isn't a save archive")
+                read_file.seek(-8, os.SEEK_END)
+                end = read_file.tell()
+                toc_offset = struct.unpack("<Q", read_file.read(8))[0]
+                read_file.seek(toc_offset)
+                self._toc = ujson.loads(zlib.decompress(read_file.read(end - toc_offset)))
+        return self._toc
+
+    @property
+    def folders(self):
+        """The folders that have files in the archive, like "relationships/"."""
+        if self._folders is None:
+            self._folders = {name[:name.index("/") + 1] for name in self.toc if "/" in name}
+        return self._folders
+
+    def names(self):
+        return list(self.toc)
+
+    def __contains__(self, name):
+        return name in self.toc
+
+    def has_folder(self, folder):
+        return folder in self.folders
+
+    def list_folder(self, folder):
+        return [name[len(folder):] for name in self.toc if name.startswith(folder) and "/" not in name[len(folder):]]
+
+    def close(self):
+        pass
+
+    def read_all_compressed(self):
+        """Returns {name: (compressed data, checksum)} for every file, reading the archive in one go."""
+        with open(self.path, "rb") as read_file:
+            data = read_file.read()
+        return {name: (data[offset:offset + size], checksum) for name, (offset, size, checksum) in self.toc.items()}
+
+    def read_compressed(self, name):
+        """Returns the compressed data of the file and the checksum of its uncompressed data."""
+        offset, size, checksum = self.toc[name]
+        with open(self.path, "rb") as read_file:
+            read_file.seek(offset)
+            return read_file.read(size), checksum
+
+    def read(self, name):
+        """Returns the contents of the file called name, as a string. Raises KeyError if it isn't in there."""
+        compressed, checksum = self.read_compressed(name)
+        data = zlib.decompress(compressed)
+        if zlib.crc32(data) != checksum:
+            raise ValueError(f"{name} in {self.path} is corrupted")
+        return data.decode("utf-8")
+
+    @staticmethod
+    def write(path, files):
+        """
+        Writes a new archive.
+        :param path: where to write it
+        :param files: dict of name: (compressed data, checksum), as given by compress or read_compressed
+        :return: the crc32 of the whole archive, taken while it's written
+        """
+        toc = {}
+        with open(path, "wb") as write_file:
+            archive_checksum = zlib.crc32(MAGIC)
+            write_file.write(MAGIC)
+            for name, (compressed, checksum) in files.items():
+                toc[name] = [write_file.tell(), len(compressed), checksum]
+                archive_checksum = zlib.crc32(compressed, archive_checksum)
+                write_file.write(compressed)
+            toc_offset = write_file.tell()
+            end = zlib.compress(ujson.dumps(toc).encode("utf-8")) + struct.pack("<Q", toc_offset)
+            write_file.write(end)
+        return zlib.crc32(end, archive_checksum)
+
+    @staticmethod
+    def compress(data: bytes):
+        # The fastest level. Save files are very repetitive, so it's already around a twentieth of the size, and
+        # every file that's saved gets compressed again.
+        return zlib.compress(data, 1), zlib.crc32(data)
+
+
+# ---------------------------------------------------------------------------- #
+#                               finding save files                             #
+# ---------------------------------------------------------------------------- #
+
+def get_archive(clan_dir):
+    """Returns the archive or database of the Clan with this save folder, or None if it has neither."""
+    clan_dir = os.path.normpath(clan_dir)
+    if clan_dir not in _open_archives:
+        if os.path.exists(os.path.join(clan_dir, ARCHIVE_NAME)):
+            _open_archives[clan_dir] = SaveArchive(os.path.join(clan_dir, ARCHIVE_NAME))
+        elif os.path.exists(os.path.join(clan_dir, DATABASE_NAME)):
+            _open_archives[clan_dir] = SaveDatabase(os.path.join(clan_dir, DATABASE_NAME))
+        else:
+            return None
+    return _open_archives[clan_dir]
+
+
+def forget_archive(clan_dir):
+    """Called when an archive is replaced or removed, so the next read opens the new one."""
+    archive = _open_archives.pop(os.path.normpath(clan_dir), None)
+    if archive is not None:
+        archive.close()
+
+
+def find_member(path):
+    """If path is a save file that belongs in an archive, returns the Clan's save folder and the file's name in
+        there. Otherwise returns None. The archive doesn't need to exist yet."""
+    save_dir = os.path.normpath(get_save_dir())
+    path = os.path.normpath(path)
+    if os.path.dirname(path) == save_dir:
+        file_name = os.path.basename(path)
+        if not file_name.endswith("clan.json") or file_name == "clan.json":
+            return None
+        clan_name = file_name[:-len("clan.json")]
+        name = "clan.json"
+    else:
+        relative_path = os.path.relpath(path, save_dir)
+        if relative_path.startswith(".."):
+            return None
+        parts = relative_path.replace(os.sep, "/").split("/", 1)
+        if len(parts) < 2:
+            return None
+        clan_name, name = parts
+        if name not in ARCHIVED_FILES and not (name + "/").startswith(ARCHIVED_FOLDERS):
+            return None
+    return os.path.join(save_dir, clan_name), name
+
+
+def uses_archive(clan_dir):
+    """If saving the Clan should write to an archive or database, rather than to normal files."""
+    return new_save_format != "files" or get_archive(clan_dir) is not None
+
+
+def read_save_file(path):
+    """Returns the contents of a save file as a string, from the Clan's archive if it has one. Raises
+        FileNotFoundError if it doesn't exist. """
+    member = find_member(path)
+    archive = get_archive(member[0]) if member else None
+    if archive is None:
+        with open(path, "r", encoding="utf-8") as read_file:
+            return read_file.read()
+    try:
+        return archive.read(member[1])
+    except KeyError:
+        raise FileNotFoundError(path)
+
+
+def save_file_exists(path):
+    """os.path.exists, for save files that might be in an archive. Works for the archived folders too."""
+    member = find_member(path)
+    archive = get_archive(member[0]) if member else None
+    if archive is None:
+        return os.path.exists(path)
+    name = member[1]
+    if name + "/" in ARCHIVED_FOLDERS:
+        return archive.has_folder(name + "/")
+    return name in archive
+
+
+def list_save_dir(path):
+    """os.listdir, for save folders that might be in an archive. Returns [] if the folder doesn't exist."""
+    member = find_member(os.path.join(path, "_"))
+    archive = get_archive(member[0]) if member else None
+    if archive is None:
+        return os.listdir(path) if os.path.isdir(path) else []
+    return archive.list_folder(member[1][:-1])
+
+
+# ---------------------------------------------------------------------------- #
+#                                   converters                                 #
+# ---------------------------------------------------------------------------- #
+
+def get_loose_files(clan_name):
+    """Returns {name in the archive: path} for every save file of the Clan that's a normal file."""
+    save_dir = get_save_dir()
+    clan_dir = os.path.join(save_dir, clan_name)
+    files = {}
+    if os.path.exists(os.path.join(save_dir, clan_name + "clan.json")):
+        files["clan.json"] = os.path.join(save_dir, clan_name + "clan.json")
+    for name in ARCHIVED_FILES[1:]:
+        if os.path.exists(os.path.join(clan_dir, name)):
+            files[name] = os.path.join(clan_dir, name)
+    for folder in ARCHIVED_FOLDERS:
+        folder_path = os.path.join(clan_dir, folder)
+        if os.path.isdir(folder_path):
+            for file_name in os.listdir(folder_path):
+                files[folder + file_name] = os.path.join(folder_path, file_name)
+    return files
+
+
+def pack_clan(clan_name, save_format="archive"):
+    """Moves the Clan's save files into an archive, or a database if save_format is "database". Returns the
+        number of files that were packed. """
+    save_dir = get_save_dir()
+    clan_dir = os.path.join(save_dir, clan_name)
+    if get_archive(clan_dir) is not None:
+        return 0
+
+    loose_files = get_loose_files(clan_name)
+    if save_format == "database":
+        path = os.path.join(clan_dir, DATABASE_NAME)
+        files = {}
+        for name, file_path in loose_files.items():
+            with open(file_path, "r", encoding="utf-8") as read_file:
+                files[name] = read_file.read()
+        if os.path.exists(path + ".tmp"):
+            os.remove(path + ".tmp")
+        database = SaveDatabase(path + ".tmp")
+        database.write(files)
+        database.close()
+    else:
+        path = os.path.join(clan_dir, ARCHIVE_NAME)
+        files = {}
+        for name, file_path in loose_files.items():
+            with open(file_path, "rb") as read_file:
+                files[name] = SaveArchive.compress(read_file.read())
+        SaveArchive.write(path + ".tmp", files)
+    os.replace(path + ".tmp", path)
+
+    # The archive is used as soon as it's there, so it doesn't matter if the game is closed before this is done.
+    for file_path in loose_files.values():
+        os.remove(file_path)
+    for folder in ARCHIVED_FOLDERS:
+        folder_path = os.path.join(clan_dir, folder)
+        if os.path.isdir(folder_path) and not os.listdir(folder_path):
+            os.rmdir(folder_path)
+    forget_archive(clan_dir)
+    return len(loose_files)
+
+
+def unpack_clan(clan_name):
+    """Turns the Clan's archive or database back into normal save files. Returns the number of files that were
+        unpacked."""
+    save_dir = get_save_dir()
+    clan_dir = os.path.join(save_dir, clan_name)
+    archive = get_archive(clan_dir)
+    if archive is None:
+        return 0
+
+    names = archive.names()
+    for name in names:
+        path = os.path.join(save_dir, clan_name + "clan.json") if name == "clan.json" \
+            else os.path.join(clan_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as write_file:
+            write_file.write(archive.read(name))
+        os.replace(path + ".tmp", path)
+
+    forget_archive(clan_dir)
+    os.remove(archive.path)
+    return len(names)
+
+
+def get_save_stats(clan_name):
+    """Returns the number of files and bytes on disk of the Clan's save, counting the Clan file."""
+    save_dir = get_save_dir()
+    paths = [os.path.join(save_dir, clan_name + "clan.json")]
+    for root, _, file_names in os.walk(os.path.join(save_dir, clan_name)):
+        paths.extend(os.path.join(root, file_name) for file_name in file_names)
+    paths = [path for path in paths if os.path.exists(path)]
+    return len(paths), sum(os.path.getsize(path) for path in paths)
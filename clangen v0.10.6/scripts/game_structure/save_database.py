@@ -0,0 +1,165 @@
+"""
+Database saves, for Clans that have been going for so long that even an archive gets slow. The same save files
+as in an archive (see save_archive) are kept in an SQLite database in the Clan's save folder, split up so that
+a single cat can be read or written without touching the rest:
+
+    cats            one row per cat in clan_cats.json, in the order they were saved
+    relationships   one row per relationships/<ID>_relations.json
+    histories       one row per history/<ID>_history.json
+    faded_cats      one row per faded_cats/<ID>.json, so fetching a faded cat is a lookup by ID
+    conditions      one row per cat in conditions.json
+    event_history   one row per event_history/<moon>.json
+    files           everything else, with the file name as the ID: the Clan file and the events
+
+Reading and writing goes through the same names as the archive ("clan_cats.json", "history/1_history.json"...),
+so the rest of the game doesn't know which one it's using. A whole save is written in one transaction.
+"""
+import sqlite3
+import threading
+
+import ujson
+
+
+class SaveDatabase():
+    """One Clan's save database."""
+
+    # Folder in the save: (table, what comes after the cat ID in the file name)
+    FOLDER_TABLES = {
+        "relationships/": ("relationships", "_relations.json"),
+        "history/": ("histories", "_history.json"),
+        "faded_cats/": ("faded_cats", ".json"),
+        "event_history/": ("event_history", ".json"),
+    }
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cats (id TEXT PRIMARY KEY, position INTEGER NOT NULL, data TEXT NOT NULL);
+        CREATE INDEX IF NOT EXISTS cats_position ON cats (position);
+        CREATE TABLE IF NOT EXISTS relationships (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS histories (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS faded_cats (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS conditions (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS event_history (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS files (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Saves can happen on the timeskip thread, so the connection is shared, one query at a time.
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.executescript(self.SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def _query(self, sql, parameters=()):
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def _find_row(self, name):
+        """Returns the table and ID of a file that is one row, or None for clan_cats.json and conditions.json,
+            which are made up of a whole table."""
+        for folder, (table, ending) in self.FOLDER_TABLES.items():
+            if name.startswith(folder) and name.endswith(ending):
+                return table, name[len(folder):-len(ending)]
+        if name in ("clan_cats.json", "conditions.json"):
+            return None
+        return "files", name
+
+    # ---------------------------------------------------------------------------- #
+    #                                    reading                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def read(self, name):
+        """Returns the contents of the file called name, as a string. Raises KeyError if it isn't in there."""
+        if name == "clan_cats.json":
+            rows = self._query("SELECT data FROM cats ORDER BY position")
+            if not rows:
+                raise KeyError(name)
+            return "[" + ",".join(row[0] for row in rows) + "]"
+        if name == "conditions.json":
+            rows = self._query("SELECT id, data FROM conditions")
+            if not rows:
+                raise KeyError(name)
+            return "{" + ",".join(f"{ujson.dumps(cat_id)}:{data}" for cat_id, data in rows) + "}"
+
+        table, key = self._find_row(name)
+        rows = self._query(f"SELECT data FROM {table} WHERE id = ?", (key,))
+        if not rows:
+            raise KeyError(name)
+        return rows[0][0]
+
+    def __contains__(self, name):
+        if name in ("clan_cats.json", "conditions.json"):
+            table = "cats" if name == "clan_cats.json" else "conditions"
+            return bool(self._query(f"SELECT 1 FROM {table} LIMIT 1"))
+        row = self._find_row(name)
+        if row is None:
+            return False
+        table, key = row
+        return bool(self._query(f"SELECT 1 FROM {table} WHERE id = ?", (key,)))
+
+    def has_folder(self, folder):
+        if folder not in self.FOLDER_TABLES:
+            return False
+        return bool(self._query(f"SELECT 1 FROM {self.FOLDER_TABLES[folder][0]} LIMIT 1"))
+
+    def list_folder(self, folder):
+        if folder not in self.FOLDER_TABLES:
+            return []
+        table, ending = self.FOLDER_TABLES[folder]
+        return [cat_id + ending for (cat_id,) in self._query(f"SELECT id FROM {table}")]
+
+    def names(self):
+        names = [name for name in ("clan_cats.json", "conditions.json") if name in self]
+        names.extend(name for (name,) in self._query("SELECT id FROM files"))
+        for folder in self.FOLDER_TABLES:
+            names.extend(folder + file_name for file_name in self.list_folder(folder))
+        return names
+
+    # ---------------------------------------------------------------------------- #
+    #                                    writing                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def write(self, changes):
+        """
+        Saves a set of changes in one transaction. If anything goes wrong, none of it is saved.
+        :param changes: dict of name: new contents as a string, or None if the file was removed
+        """
+        inserts = {}  # table: [(key, data), ...]
+        deletes = {}  # table: [(key,), ...]
+        whole_tables = {}  # table: rows, for the tables that are replaced completely
+
+        for name, data in changes.items():
+            if name == "clan_cats.json":
+                cats = ujson.loads(data) if data is not None else []
+                whole_tables["cats"] = [(cat["ID"], position, ujson.dumps(cat)) for position, cat in enumerate(cats)]
+                continue
+            if name == "conditions.json":
+                conditions = ujson.loads(data) if data is not None else {}
+                whole_tables["conditions"] = [(cat_id, ujson.dumps(cat_conditions))
+                                              for cat_id, cat_conditions in conditions.items()]
+                continue
+            table, key = self._find_row(name)
+            if data is None:
+                deletes.setdefault(table, []).append((key,))
+            else:
+                inserts.setdefault(table, []).append((key, data))
+
+        with self.lock:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute("BEGIN")
+                for table, rows in whole_tables.items():
+                    cursor.execute(f"DELETE FROM {table}")
+                    placeholders = "?, ?, ?" if table == "cats" else "?, ?"
+                    cursor.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+                for table, keys in deletes.items():
+                    cursor.executemany(f"DELETE FROM {table} WHERE id = ?", keys)
+                for table, rows in inserts.items():
+                    cursor.executemany(f"INSERT OR REPLACE INTO {table} VALUES (?, ?)", rows)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
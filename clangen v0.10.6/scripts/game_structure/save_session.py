@@ -0,0 +1,321 @@
+"""
+Transactional saving. While a save session is open, everything game.safe_save writes goes to a staging folder
+instead of the save, and the files game.safe_remove deletes are only noted down. When the session closes,
+the whole save is moved into place in one go:
+
+    1. the staging folder is synced once, instead of every staged file on its own,
+    2. a journal listing every move, removal and database write, with the checksum of each staged file taken
+       while it was written, is written and synced, which is the commit point,
+    3. the staged changes to databases are written, each in one transaction,
+    4. the staged files are renamed over the old ones, and each save folder is synced once,
+    5. the journal and the staging folder are removed.
+
+If the game is closed before the journal is written, the staging folder is thrown away at the next start and
+the old save is untouched. If it's closed after, SaveSession.recover checks the staged files against their
+checksums and finishes the database writes and the moves from the journal, so a save is never left half old and
+half new.
+
+    with game.save_session():
+        game.save_cats()
+        game.clan.save_clan()
+"""
+import os
+import shutil
+import zlib
+
+import ujson
+
+from scripts.game_structure import save_archive
+from scripts.game_structure.save_archive import ARCHIVE_NAME, DATABASE_NAME, SaveArchive, find_member, \
+    forget_archive, get_archive, get_loose_files, uses_archive
+from scripts.game_structure.save_database import SaveDatabase
+
+
+class SaveSession():
+    """One save, staged in staging_dir. Sessions don't nest: opening one while another is open just joins
+        the one that's already open. """
+
+    # The session safe_save should write into, if any.
+    active = None
+
+    JOURNAL_FILE = "journal.json"
+
+    def __init__(self, staging_dir):
+        self.staging_dir = staging_dir
+        self.files_dir = os.path.join(staging_dir, "files")
+        self.joined = False
+        # target path -> [staged file name, checksum, or None for the files that aren't checked]
+        self.files = {}
+        self.staged_count = 0
+        self.removed = set()
+        # [staged file name, database path] for the changes to write into Clans' databases, see apply_databases
+        self.database_writes = []
+        self.commit_callbacks = []
+
+    def __enter__(self):
+        if SaveSession.active is not None:
+            self.joined = True
+            return SaveSession.active
+
+        # Anything left here is from a save that never got to its commit point.
+        if os.path.exists(self.staging_dir):
+            shutil.rmtree(self.staging_dir)
+        os.makedirs(self.files_dir)
+        SaveSession.active = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self.joined:
+            return False
+
+        SaveSession.active = None
+        if exc_type is None:
+            self.commit()
+        else:
+            # The save failed partway through. Leave the old save as it was.
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+        return False
+
+    def write(self, path, data):
+        """Stages data to be written to path. """
+        path = os.path.normpath(path)
+        self.removed.discard(path)
+        if path in self.files:
+            staged_name = self.files[path][0]
+        else:
+            staged_name = str(self.staged_count)
+            self.staged_count += 1
+
+        data = data.encode("utf-8")
+        with open(os.path.join(self.files_dir, staged_name), "wb") as write_file:
+            write_file.write(data)
+        self.files[path] = [staged_name, zlib.crc32(data)]
+
+    def remove(self, path):
+        """Notes that path should be deleted when the session is committed. """
+        path = os.path.normpath(path)
+        if path in self.files:
+            os.remove(os.path.join(self.files_dir, self.files.pop(path)[0]))
+        self.removed.add(path)
+
+    def on_commit(self, callback):
+        """Calls callback once the save has been moved into place. It's never called if the save fails. """
+        self.commit_callbacks.append(callback)
+
+    def staged_path(self, path):
+        """Returns where the newest version of path is. That's the staged file, if it's been written during the
+            session. """
+        staged = self.files.get(os.path.normpath(path))
+        if staged:
+            return os.path.join(self.files_dir, staged[0])
+        return path
+
+    def commit(self):
+        self.pack_archives()
+        _sync_dir(self.files_dir)
+
+        journal = {
+            "files": [[staged_name, path, checksum] for path, (staged_name, checksum) in self.files.items()],
+            "removed": sorted(self.removed),
+            "databases": self.database_writes
+        }
+        journal_path = os.path.join(self.staging_dir, SaveSession.JOURNAL_FILE)
+        with open(journal_path, "w") as write_file:
+            write_file.write(ujson.dumps(journal))
+            write_file.flush()
+            os.fsync(write_file.fileno())
+        _sync_dir(self.staging_dir)
+
+        try:
+            SaveSession.apply_databases(self.staging_dir, journal)
+        except Exception:
+            # The database rolled its transaction back and nothing has been moved yet, so the old save is still
+            # whole. Throw the journal away too, so it isn't tried again at the next start.
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            raise
+        SaveSession.apply_journal(self.staging_dir, journal)
+
+        for callback in self.commit_callbacks:
+            callback()
+
+    def pack_archives(self):
+        """Swaps the staged files that belong in a Clan's save archive for a new copy of the archive, with the
+            staged files in it, so the archive is moved into place like any other file. Files in the old archive
+            that weren't saved again are copied over as they are. The first time a Clan is saved as an archive, its
+            save files that are still normal files are packed in as well, and then removed.
+            Files that belong in a database are taken out of the session instead, see take_database_changes. """
+        archives = {}  # Clan save folder: {name in the archive: path}
+        for path in list(self.files) + list(self.removed):
+            member = find_member(path)
+            if member and uses_archive(member[0]):
+                archives.setdefault(member[0], {})[member[1]] = path
+
+        for clan_dir, members in archives.items():
+            old_archive = get_archive(clan_dir)
+            if isinstance(old_archive, SaveDatabase) or \
+                    (old_archive is None and save_archive.new_save_format == "database"):
+                self.take_database_changes(clan_dir, old_archive, members)
+                continue
+
+            if old_archive is not None:
+                files = old_archive.read_all_compressed()
+            else:
+                files = {}
+                for name, path in get_loose_files(os.path.basename(clan_dir)).items():
+                    with open(path, "rb") as read_file:
+                        files[name] = SaveArchive.compress(read_file.read())
+                    self.removed.add(os.path.normpath(path))
+
+            for name, path in members.items():
+                if path in self.files:
+                    staged_path = os.path.join(self.files_dir, self.files.pop(path)[0])
+                    with open(staged_path, "rb") as read_file:
+                        files[name] = SaveArchive.compress(read_file.read())
+                    os.remove(staged_path)
+                else:
+                    files.pop(name, None)
+
+            staged_name = str(self.staged_count)
+            self.staged_count += 1
+            checksum = SaveArchive.write(os.path.join(self.files_dir, staged_name), files)
+            self.files[os.path.join(clan_dir, ARCHIVE_NAME)] = [staged_name, checksum]
+            self.commit_callbacks.insert(0, lambda clan_dir=clan_dir: forget_archive(clan_dir))
+
+    def take_database_changes(self, clan_dir, database, members):
+        """Takes the files that go in the Clan's database out of the session. They're staged as one file of
+            changes, {name: contents, or None if removed}, that's written into the database once the journal is
+            written. If the Clan doesn't have a database yet, a new one is made with its save files in it, and
+            staged like the archives are. """
+        changes = {}
+        if database is None:
+            for name, path in get_loose_files(os.path.basename(clan_dir)).items():
+                with open(path, "r", encoding="utf-8") as read_file:
+                    changes[name] = read_file.read()
+                self.removed.add(os.path.normpath(path))
+
+        for name, path in members.items():
+            if path in self.files:
+                staged_path = os.path.join(self.files_dir, self.files.pop(path)[0])
+                with open(staged_path, "r", encoding="utf-8") as read_file:
+                    changes[name] = read_file.read()
+                os.remove(staged_path)
+            else:
+                changes[name] = None
+                self.removed.discard(path)
+
+        staged_name = str(self.staged_count)
+        self.staged_count += 1
+        staged_path = os.path.join(self.files_dir, staged_name)
+
+        if database is not None:
+            data = ujson.dumps(changes).encode("utf-8")
+            with open(staged_path, "wb") as write_file:
+                write_file.write(data)
+            self.database_writes.append([staged_name, database.path, zlib.crc32(data)])
+            return
+
+        new_database = SaveDatabase(staged_path)
+        new_database.write(changes)
+        new_database.close()
+        # SQLite writes the file itself, so there's no checksum of it without reading it all back.
+        self.files[os.path.join(clan_dir, DATABASE_NAME)] = [staged_name, None]
+        self.commit_callbacks.insert(0, lambda: forget_archive(clan_dir))
+
+    @staticmethod
+    def apply_databases(staging_dir, journal):
+        """Writes the staged changes into the databases in the journal. Each staged file is removed once it's
+            written, and writing the same changes twice gives the same save, so it's safe to run again. """
+        files_dir = os.path.join(staging_dir, "files")
+        for staged_name, path, _ in journal.get("databases", []):
+            staged_path = os.path.join(files_dir, staged_name)
+            if not os.path.exists(staged_path):
+                # Already written, before the game was closed.
+                continue
+            database = get_archive(os.path.dirname(path))
+            if database is None:
+                print(f"WARNING: {path} is gone, its changes can't be saved.")
+            else:
+                with open(staged_path, "r", encoding="utf-8") as read_file:
+                    database.write(ujson.loads(read_file.read()))
+            os.remove(staged_path)
+
+    @staticmethod
+    def apply_journal(staging_dir, journal):
+        """Writes the database changes, moves the staged files into place and removes the removed ones. Safe to
+            run more than once for the same journal, which is what makes recovery possible. """
+        files_dir = os.path.join(staging_dir, "files")
+        touched_dirs = set()
+
+        SaveSession.apply_databases(staging_dir, journal)
+
+        for staged_name, path, _ in journal["files"]:
+            staged_path = os.path.join(files_dir, staged_name)
+            if not os.path.exists(staged_path):
+                # Already moved, before the game was closed.
+                continue
+            dir_name = os.path.dirname(path)
+            if dir_name and dir_name not in touched_dirs:
+                os.makedirs(dir_name, exist_ok=True)
+            touched_dirs.add(dir_name)
+            try:
+                os.replace(staged_path, path)
+            except OSError:
+                # The temp folder is on a different drive than the saves.
+                shutil.move(staged_path, path)
+
+        for path in journal["removed"]:
+            if os.path.exists(path):
+                os.remove(path)
+                touched_dirs.add(os.path.dirname(path))
+
+        for dir_name in touched_dirs:
+            _sync_dir(dir_name)
+
+        os.remove(os.path.join(staging_dir, SaveSession.JOURNAL_FILE))
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    @staticmethod
+    def recover(staging_dir):
+        """Run before loading. Finishes a save that was committed but not fully moved into place, or throws away
+            one that never got committed. Returns True if a save had to be finished. """
+        if not os.path.exists(staging_dir):
+            return False
+
+        journal = None
+        try:
+            with open(os.path.join(staging_dir, SaveSession.JOURNAL_FILE), "r") as read_file:
+                journal = ujson.loads(read_file.read())
+        except (FileNotFoundError, ValueError):
+            pass
+
+        if journal is None:
+            print("WARNING: Throwing away an unfinished save.")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return False
+
+        # The staged files were only synced as a folder, so check that they all made it to the disk whole.
+        files_dir = os.path.join(staging_dir, "files")
+        for staged_name, path, checksum in journal["files"] + journal.get("databases", []):
+            staged_path = os.path.join(files_dir, staged_name)
+            if checksum is None or not os.path.exists(staged_path):
+                continue
+            with open(staged_path, "rb") as read_file:
+                if zlib.crc32(read_file.read()) != checksum:
+                    print(f"WARNING: Throwing away an interrupted save, {path} didn't make it to the disk.")
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    return False
+
+        print("WARNING: Finishing a save that was interrupted.")
+        SaveSession.apply_journal(staging_dir, journal)
+        return True
+
+
+def _sync_dir(dir_name):
+    """fsyncs a folder, so renames in it stick. Windows can't open folders, and doesn't need this. """
+    if os.name == "nt":
+        return
+    fd = os.open(dir_name or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
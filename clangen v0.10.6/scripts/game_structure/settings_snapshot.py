@@ -0,0 +1,51 @@
+"""
+The settings that are read for every cat, or every pair of cats, as plain attributes instead of lookups in
+game.settings, game.config and the Clan's settings. Use game.snapshot:
+
+    if game.snapshot.shaders:
+
+game.snapshot is made again whenever a setting is changed or loaded (see Game.switch_setting, Game.load_settings,
+Clan.switch_setting and Clan.load_clan_settings), and whenever another Clan is loaded. Tests can set their own:
+
+    game.snapshot = dataclasses.replace(game.snapshot, first_cousin_mates=True)
+"""
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot():
+    clan: Any  # the Clan the Clan settings are from, or None
+
+    # game.settings
+    shaders: bool
+
+    # game.config
+    all_cats_are_newborn: bool
+    sick_sprites: bool
+    sort_rank_by_death: bool
+    sort_dead_by_total_age: bool
+    age_to_fade: int
+    opacity_at_fade: int
+    visual_fading_speed: float
+
+    # the Clan's settings, None if there's no Clan
+    fading: Optional[bool]
+    first_cousin_mates: Optional[bool]
+
+    @classmethod
+    def from_game(cls, game):
+        clan_settings = getattr(game.clan, "clan_settings", None) if game.clan else None
+        return cls(
+            clan=game.clan,
+            shaders=game.settings["shaders"],
+            all_cats_are_newborn=game.config["fun"]["all_cats_are_newborn"],
+            sick_sprites=game.config["cat_sprites"]["sick_sprites"],
+            sort_rank_by_death=game.config["sorting"]["sort_rank_by_death"],
+            sort_dead_by_total_age=game.config["sorting"]["sort_dead_by_total_age"],
+            age_to_fade=game.config["fading"]["age_to_fade"],
+            opacity_at_fade=game.config["fading"]["opacity_at_fade"],
+            visual_fading_speed=game.config["fading"]["visual_fading_speed"],
+            fading=clan_settings["fading"] if clan_settings else None,
+            first_cousin_mates=clan_settings["first cousin mates"] if clan_settings else None,
+        )
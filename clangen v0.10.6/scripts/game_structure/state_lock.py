@@ -0,0 +1,99 @@
+"""
+Who's allowed to change the game state (the cats, the Clan, game.cur_events_list...) while work runs on another
+thread. Timeskips, patrols and mate changes run on a work thread (see Screens.loading_screen_start_work) while
+the UI thread keeps drawing, so:
+
+    - the work thread holds the lock for writing while it runs,
+    - anything on the UI thread that has to see the state as a whole, like saving, holds it for reading, and
+      waits for the work to be done first,
+    - things the UI only looks at use a copy taken before the work started, like Cat.get_roster, so the
+      loading animation never has to wait.
+
+The roster copy is only a copy of the list. The cats in it are the same objects the work is changing, so their
+status, dead, placement, sprite and so on can be halfway through a change. Screens don't build pages of cats
+while the work runs: the work is started with window_open set, which blocks the buttons that would rebuild
+them, and game.update_game holds back screen switches until the work is done.
+
+    with state_lock.writing():
+        events_class.one_moon()
+
+The thread that holds it for writing can read and write again without waiting for itself.
+"""
+import threading
+from contextlib import contextmanager
+
+
+class StateLock():
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.readers = 0
+        self.writer = None  # the thread that's writing
+        self.writer_depth = 0
+        # Called by the writer just before it starts changing things, to take copies for the UI
+        self.before_write = []
+        # Called once the writer is done, to let go of those copies
+        self.after_write = []
+
+    def is_changing(self):
+        """If another thread is changing the game state right now."""
+        writer = self.writer
+        return writer is not None and writer is not threading.current_thread()
+
+    def acquire_read(self):
+        with self.condition:
+            if self.writer is threading.current_thread():
+                self.writer_depth += 1
+                return
+            while self.writer is not None:
+                self.condition.wait()
+            self.readers += 1
+
+    def release_read(self):
+        with self.condition:
+            if self.writer is threading.current_thread():
+                self.writer_depth -= 1
+                return
+            self.readers -= 1
+            if not self.readers:
+                self.condition.notify_all()
+
+    def acquire_write(self):
+        with self.condition:
+            if self.writer is threading.current_thread():
+                self.writer_depth += 1
+                return
+            while self.writer is not None or self.readers:
+                self.condition.wait()
+            for callback in self.before_write:
+                callback()
+            self.writer = threading.current_thread()
+            self.writer_depth = 1
+
+    def release_write(self):
+        with self.condition:
+            self.writer_depth -= 1
+            if not self.writer_depth:
+                self.writer = None
+                for callback in self.after_write:
+                    callback()
+                self.condition.notify_all()
+
+    @contextmanager
+    def reading(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+state_lock = StateLock()
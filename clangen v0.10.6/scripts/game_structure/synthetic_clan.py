@@ -0,0 +1,505 @@
+"""
+Makes made-up Clans of any size and saves them like any other Clan, so big Clans can be tried out and timed
+without needing someone's save. Everything is made the way the game makes it: the cats with Cat(), so they get
+their pelts, names and skills as usual, their relationships with Relationship(), and the Clan with Clan(). The
+Clan is saved into the save folder with the normal saving code, so it loads like any other Clan.
+
+The Clan has a few generations of cats, with mates and kits, plus dead, faded and outside cats, conditions,
+histories and relationship logs. With the same seed, the same Clan is made every time.
+
+From the command line, in the game folder:
+
+    python -m scripts.game_structure.synthetic_clan 1000 --name Big --seed 1
+
+Or from code:
+
+    clan = SyntheticClan(1000, name="Big", seed=1).make()
+
+Making a Clan replaces the cats and the Clan that are loaded, so it's meant for a fresh game, a test or a
+benchmark. Tests and benchmarks can make their Clans inside preserved_game_state, which uses a temporary save
+folder and puts everything back afterwards:
+
+    with preserved_game_state() as save_dir:
+        SyntheticClan(100, seed=1).make()
+"""
+import os
+import random
+import shutil
+import tempfile
+from contextlib import contextmanager
+from copy import copy
+from math import ceil
+from random import choice, randint, random as roll, sample
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from scripts.cat.cats import Cat, ILLNESSES, INJURIES, PERMANENT
+from scripts.cat.history import History, history_store
+from scripts.cat.names import name_index
+from scripts.cat.pelts import Pelt
+from scripts.cat.sorting import sort_index
+from scripts.cat_relations.relationship import Relationship
+from scripts.clan import Clan, OtherClan
+from scripts.conditions import condition_store
+from scripts.game_structure.event_history import event_history
+from scripts.game_structure.game_essentials import game
+from scripts.housekeeping.datadir import get_save_dir
+
+# The modules that find the save folder with get_save_dir, so it can be pointed somewhere else
+SAVE_DIR_USERS = (
+    "scripts.cat.cats",
+    "scripts.cat.names",
+    "scripts.clan",
+    "scripts.game_structure.game_essentials",
+    "scripts.game_structure.load_cat",
+    "scripts.game_structure.save_archive",
+    "scripts.game_structure.synthetic_clan",
+)
+
+
+class SyntheticClan():
+
+    # Moons between one generation and the next
+    generation_moons = 30
+
+    # How many of the cats end up in each group, the rest are alive and in the Clan
+    dead_share = 0.2
+    faded_share = 0.1
+    outside_share = 0.1
+    dark_forest_share = 0.1  # of the dead cats
+
+    # How many of the living Clan cats have each of these
+    mated_share = 0.6  # of the adults
+    parents_share = 0.85  # of the cats born after the first generation, the rest joined the Clan
+    condition_share = 0.15
+    scar_share = 0.2
+    murdered_share = 0.05  # of the dead cats
+    logged_share = 0.2  # of the relationships
+
+    interactions = (
+        "{0} shared tongues with {1}.",
+        "{0} and {1} went hunting together.",
+        "{0} shared a piece of fresh-kill with {1}.",
+        "{0} told {1} a story about the old days.",
+        "{0} and {1} had an argument about patrol routes.",
+        "{0} showed {1} a new hunting crouch.",
+    )
+
+    def __init__(self, size, name="Synthetic", seed=None, generations=5, relationships_per_cat=40,
+                 game_mode="expanded", overwrite=False):
+        """
+        :param size: how many cats the Clan has altogether, dead, faded and outside cats included
+        :param name: the Clan's name, without "Clan"
+        :param seed: makes the same Clan every time, if it's given
+        :param generations: how many generations of cats there are
+        :param relationships_per_cat: how many other cats each living cat has a relationship with, on top of
+            their family and mates. None gives every living cat a relationship with every other, like a newly made
+            Clan, but that grows with the square of the number of cats.
+        :param game_mode: "classic", "expanded" or "cruel season". Classic Clans have no conditions.
+        :param overwrite: if a Clan of that name is already saved, it's thrown away. Otherwise, it's an error.
+        """
+        self.size = max(size, 4)
+        self.name = name
+        self.seed = seed
+        self.generations = max(generations, 1)
+        self.relationships_per_cat = relationships_per_cat
+        self.game_mode = game_mode
+        self.overwrite = overwrite
+
+        self.clan = None
+        self.cat_generations = []  # the cats of each generation, oldest first
+        self.living = []  # the cats that are alive, including the outside cats
+        self.faded = set()  # IDs of the cats that fade when the Clan is saved
+
+    @property
+    def clan_dir(self):
+        return get_save_dir() + '/' + self.name
+
+    def make(self):
+        """Makes the Clan, saves it and loads it as the current Clan. Returns the Clan."""
+        if self.seed is not None:
+            random.seed(self.seed)
+        self.clear_save()
+        clear_cats()
+        game.cur_events_list.clear()
+        game.mediated.clear()
+        game.patrolled.clear()
+
+        self.clan = Clan(self.name, biome=choice(Clan.BIOME_TYPES), camp_bg=choice(['camp1', 'camp2']),
+                         game_mode=self.game_mode, self_run_init_functions=False)
+        self.clan.age = self.generations * self.generation_moons
+        self.clan.current_season = Clan.seasons[self.clan.age % len(Clan.seasons)]
+        self.clan.all_clans = [OtherClan() for _ in range(randint(3, 5))]
+        game.clan = self.clan
+        game.switches['game_mode'] = self.game_mode
+        game.switches['clan_list'] = [self.name]
+
+        self.make_cats()
+        self.choose_leaders()
+        self.make_dead()
+        self.make_outside()
+        self.give_mentors()
+        self.give_conditions()
+        self.give_histories()
+        self.make_relationships()
+        self.save()
+        return self.clan
+
+    def clear_save(self):
+        """Throws away a saved Clan with the same name, if that's allowed."""
+        clan_file = get_save_dir() + f'/{self.name}clan.json'
+        if not os.path.exists(self.clan_dir) and not os.path.exists(clan_file):
+            return
+        if not self.overwrite:
+            raise FileExistsError(f"A Clan named {self.name} is already saved. Use overwrite to replace it.")
+        shutil.rmtree(self.clan_dir, ignore_errors=True)
+        if os.path.exists(clan_file):
+            os.remove(clan_file)
+
+    # ---------------------------------------------------------------------------- #
+    #                                     cats                                     #
+    # ---------------------------------------------------------------------------- #
+
+    def make_cats(self):
+        """Makes the cats, one generation at a time. The kits of each generation are born to the mates of the
+            generation before."""
+        # One cat is kept back for the instructor
+        per_generation = ceil((self.size - 1) / self.generations)
+        left = self.size - 1
+        mates = []
+        for generation in range(self.generations):
+            oldest = (self.generations - generation) * self.generation_moons - 1
+            youngest = oldest - self.generation_moons + 1
+            cats = []
+            for _ in range(min(per_generation, left)):
+                moons = randint(youngest, oldest)
+                if mates and roll() < self.parents_share:
+                    parent1, parent2 = choice(mates)
+                    cat = Cat(status=self.get_status(moons), moons=moons, parent1=parent1.ID, parent2=parent2.ID)
+                else:
+                    backstory = 'clan_founder' if generation == 0 else choice(['loner1', 'kittypet1', 'rogue1'])
+                    cat = Cat(status=self.get_status(moons), moons=moons, backstory=backstory)
+                cats.append(cat)
+                self.clan.add_cat(cat)
+            left -= len(cats)
+            self.cat_generations.append(cats)
+            mates = self.make_mates(cats)
+
+        self.living = [cat for cats in self.cat_generations for cat in cats]
+
+        self.clan.instructor = Cat(status=choice(["warrior", "medicine cat", "leader", "elder"]))
+        self.clan.instructor.dead = True
+        self.clan.instructor.dead_for = randint(20, 200)
+        self.clan.add_cat(self.clan.instructor)
+        self.clan.add_to_starclan(self.clan.instructor)
+
+    @staticmethod
+    def get_status(moons):
+        if moons == 0:
+            return 'newborn'
+        if moons < 6:
+            return 'kitten'
+        if moons < 12:
+            return choice(['apprentice', 'apprentice', 'apprentice', 'mediator apprentice'])
+        if moons >= 120:
+            return 'elder'
+        return choice(['warrior'] * 10 + ['mediator'])
+
+    def make_mates(self, cats):
+        """Pairs up some of the adults that aren't siblings. Returns the pairs."""
+        adults = [cat for cat in cats if cat.moons >= 12]
+        adults = sample(adults, int(len(adults) * self.mated_share) // 2 * 2)
+        pairs = []
+        for cat, other_cat in zip(adults[::2], adults[1::2]):
+            if cat.parent1 is not None and cat.parent1 == other_cat.parent1:
+                continue
+            cat.set_mate(other_cat)
+            pairs.append((cat, other_cat))
+        return pairs
+
+    def choose_leaders(self):
+        warriors = [cat for cat in self.living if cat.status == 'warrior']
+        # Very small Clans may not have enough warriors for all three
+        leader, deputy, medicine_cat = (sample(warriors, min(len(warriors), 3)) + [None, None, None])[:3]
+        self.clan.leader = leader
+        self.clan.deputy = deputy
+        self.clan.medicine_cat = medicine_cat
+        self.clan.leader_lives = randint(1, 9)
+        self.clan.post_initialization_functions()
+
+    def pick_cats(self, share, older_first=True):
+        """Picks share of the cats from the living cats, taking them out of the living cats. The Clan leaders
+            are never picked. """
+        leaders = (self.clan.leader, self.clan.deputy, self.clan.medicine_cat)
+        candidates = [cat for cat in self.living if cat not in leaders]
+        if older_first:
+            candidates.sort(key=lambda cat: cat.moons + randint(0, 2 * self.generation_moons), reverse=True)
+        else:
+            random.shuffle(candidates)
+        picked = candidates[:int(self.size * share)]
+        picked_ids = {cat.ID for cat in picked}
+        self.living = [cat for cat in self.living if cat.ID not in picked_ids]
+        return picked
+
+    def make_dead(self):
+        """Kills the older cats. Some of them are so long dead that they fade when the Clan is saved."""
+        dead = self.pick_cats(self.dead_share + self.faded_share)
+        faded = int(self.size * self.faded_share)
+        for number, cat in enumerate(dead):
+            cat.dead = True
+            cat.relationships = {}
+            if number < faded:
+                # The oldest have been dead long enough to fade
+                cat.dead_for = game.config["fading"]["age_to_fade"] + randint(0, 50)
+                self.faded.add(cat.ID)
+            else:
+                cat.dead_for = randint(0, self.clan.age)
+            Cat.dead_cats.append(cat)
+            if roll() < self.dark_forest_share:
+                cat.df = True
+                self.clan.add_to_darkforest(cat)
+            else:
+                self.clan.add_to_starclan(cat)
+
+    def make_outside(self):
+        """Sends some of the cats outside the Clan. Most are lost, a few are exiled."""
+        for cat in self.pick_cats(self.outside_share, older_first=False):
+            if roll() < 0.25:
+                cat.exile()
+                self.clan.add_to_outside(cat)
+            else:
+                cat.gone()
+            self.living.append(cat)
+
+    def give_mentors(self):
+        warriors = [cat for cat in self.living if cat.status == 'warrior' and not cat.outside]
+        for cat in self.living:
+            if cat.status == 'apprentice' and not cat.outside and warriors:
+                cat.update_mentor(choice(warriors).ID)
+
+    def give_conditions(self):
+        if self.game_mode == 'classic':
+            return
+        # The condition files have a few comments in them too
+        illnesses = [name for name, illness in ILLNESSES.items() if isinstance(illness, dict)]
+        injuries = [name for name, injury in INJURIES.items() if isinstance(injury, dict) and name != 'pregnant']
+        permanent_conditions = [name for name, condition in PERMANENT.items() if isinstance(condition, dict)]
+        for cat in self.living:
+            if cat.outside or roll() >= self.condition_share:
+                continue
+            kind = randint(0, 2)
+            if kind == 0:
+                cat.get_ill(choice(illnesses), lethal=False)
+            elif kind == 1:
+                cat.get_injured(choice(injuries), lethal=False)
+            else:
+                cat.get_permanent_condition(choice(permanent_conditions))
+
+    def give_histories(self):
+        """Gives every cat their beginning, and some of them scars, deaths and murders."""
+        all_cats = [cat for cat in Cat.all_cats.values() if cat is not self.clan.instructor]
+        for cat in all_cats:
+            History.add_beginning(cat, clan_born=cat.parent1 is not None)
+            if roll() < self.scar_share:
+                cat.pelt.scars.append(choice(Pelt.scars1))
+                History.add_scar(cat, "m_c was scarred in a fight with a rogue.")
+
+        living = [cat for cat in self.living if not cat.outside]
+        for cat in all_cats:
+            if not cat.dead:
+                continue
+            if living and roll() < self.murdered_share:
+                murderer = choice(living)
+                History.add_death(cat, "m_c was murdered.", other_cat=murderer)
+                History.add_murders(cat, murderer, revealed=roll() < 0.5, text="m_c was murdered.")
+            else:
+                History.add_death(cat, choice(["m_c died of old age.", "m_c died of a sickness.",
+                                               "m_c was killed by a fox."]))
+
+    # ---------------------------------------------------------------------------- #
+    #                                relationships                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def make_relationships(self):
+        children_index = Cat.get_children_index(Cat.all_cats.values())
+        if self.relationships_per_cat is None:
+            for cat in self.living:
+                cat.init_all_relationships(children_index)
+            return
+
+        for cat in self.living:
+            # Straight from the parent IDs, since Cat.get_parents works out the whole family with a pass over every cat
+            parents = [parent_id for parent_id in (cat.parent1, cat.parent2) if parent_id is not None]
+            family = set(parents)
+            for parent_id in parents:
+                family.update(children_index.get(parent_id, ()))
+            family.update(children_index.get(cat.ID, ()))
+            family.discard(cat.ID)
+
+            others = [other_cat for other_cat in
+                      sample(self.living, min(self.relationships_per_cat + 1, len(self.living)))
+                      if other_cat is not cat]
+            others = others[:self.relationships_per_cat]
+            for cat_id in sorted(family) + cat.mate:
+                other_cat = Cat.all_cats.get(cat_id)
+                if other_cat is not None and not other_cat.dead and other_cat not in others:
+                    others.append(other_cat)
+
+            for other_cat in others:
+                cat.relationships[other_cat.ID] = self.make_relationship(cat, other_cat, other_cat.ID in family)
+
+    def make_relationship(self, cat, other_cat, family):
+        mates = other_cat.ID in cat.mate
+        romantic_love = randint(20, 80) if mates else 0
+        if roll() < 0.05:
+            like = 0
+            dislike = randint(10, 25)
+            jealousy = randint(5, 15)
+        else:
+            like = randint(30, 70) if family else randint(0, 35)
+            dislike = 0
+            jealousy = 0
+
+        log = []
+        if roll() < self.logged_share:
+            for _ in range(randint(1, 3)):
+                interaction = choice(self.interactions).format(cat.name, other_cat.name)
+                moons = randint(0, cat.moons) if cat.moons else 0
+                log.append(f"{interaction} - {cat.name} was {moons} {'moon' if moons == 1 else 'moons'} old")
+
+        return Relationship(cat, other_cat, mates=mates, family=family, romantic_love=romantic_love,
+                            platonic_like=like, dislike=dislike, admiration=randint(0, 20),
+                            comfortable=randint(0, 25) + romantic_love // 2, jealousy=jealousy,
+                            trust=randint(0, 15) + romantic_love // 4, log=log)
+
+    # ---------------------------------------------------------------------------- #
+    #                                    saving                                    #
+    # ---------------------------------------------------------------------------- #
+
+    def save(self):
+        """Saves the Clan like a newly made Clan is saved, after fading the faded cats."""
+        event_history.new_clan(self.clan_dir)
+        with game.save_session():
+            self.fade_cats()
+            game.save_cats()
+            self.clan.save_clan()
+            game.save_events()
+        game.save_clanlist(self.name)
+        game.switches['clan_list'] = game.read_clans()
+        Cat.sort_cats()
+
+    def fade_cats(self):
+        """Saves the faded cats as faded and takes them out of the game, like Game.save_faded_cats does. That
+            works out each faded cat's whole family with a pass over every cat, so here only their parents
+            are told about them."""
+        for cat_id in sorted(self.faded, key=int):
+            cat = Cat.all_cats[cat_id]
+            for mate_id in cat.mate.copy():
+                if mate_id in Cat.all_cats:
+                    Cat.all_cats[mate_id].unset_mate(cat)
+            for parent_id in (cat.parent1, cat.parent2):
+                if parent_id in Cat.all_cats:
+                    Cat.all_cats[parent_id].faded_offspring.append(cat_id)
+                elif parent_id is not None:
+                    game.add_faded_offspring_to_faded_cat(parent_id, cat_id)
+            game.safe_save(f"{self.clan_dir}/faded_cats/{cat_id}.json", cat.get_save_dict(faded=True))
+            self.clan.faded_ids.append(cat_id)
+            self.clan.remove_cat(cat_id)
+
+
+def clear_cats():
+    """Takes every cat out of the game, for making a new Clan from nothing."""
+    Cat.all_cats.clear()
+    Cat.all_cats_list.clear()
+    Cat.outside_cats.clear()
+    Cat.dead_cats.clear()
+    name_index.clear()
+    sort_index.clear()
+    history_store.clear()
+    condition_store.clear()
+    for cat_ids in condition_store.index.values():
+        cat_ids.clear()
+    game.cat_to_fade = []
+    game.clan = None
+    # Cat "0" is left out of the cat lists, so IDs start from 1
+    Cat.id_allocator.next_id = 1
+
+
+@contextmanager
+def preserved_game_state(save_dir=None):
+    """
+    For tests and benchmarks that make their own Clans. Points the save folder at save_dir, or at a new temporary
+    folder that's removed afterwards, and starts from a game with no cats and no Clan (see clear_cats). The loaded
+    cats, the Clan and every cat index are put back as they were when it's done.
+    :return: the save folder
+    """
+    temporary = save_dir is None
+    if temporary:
+        save_dir = tempfile.mkdtemp()
+    # A plain function rather than a mock, since it's called for every file and mocks keep track of every call
+    patchers = [patch(module + ".get_save_dir", new=lambda: save_dir) for module in SAVE_DIR_USERS]
+
+    cat_groups = [(group, copy(group)) for group in
+                  (Cat.all_cats, Cat.all_cats_list, Cat.outside_cats, Cat.dead_cats, Cat.sprites_kept)]
+    # The indexes get new, empty containers while the Clan is made, and their own back afterwards. The cats'
+    # conditions point at condition_store's index, so it can't just be emptied and filled again.
+    indexes = [(index, vars(index).copy()) for index in (name_index, sort_index, history_store, condition_store)]
+    clan, clan_list, cat_to_fade = game.clan, game.switches['clan_list'], game.cat_to_fade
+    next_id, event_dir = Cat.id_allocator.next_id, event_history.clan_dir
+
+    for patcher in patchers:
+        patcher.start()
+    for index, _ in indexes:
+        vars(index).update(vars(type(index)()))
+    clear_cats()
+    Cat.sprites_kept.clear()
+    try:
+        yield save_dir
+    finally:
+        for patcher in patchers:
+            patcher.stop()
+        for group, contents in cat_groups:
+            group.clear()
+            if isinstance(group, list):
+                group.extend(contents)
+            else:
+                group.update(contents)
+        for index, state in indexes:
+            vars(index).clear()
+            vars(index).update(state)
+        game.clan, game.switches['clan_list'], game.cat_to_fade = clan, clan_list, cat_to_fade
+        Cat.id_allocator.next_id, event_history.clan_dir = next_id, event_dir
+        if temporary:
+            shutil.rmtree(save_dir, ignore_errors=True)
+
+
+def main(args=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Makes a made-up Clan of any size and saves it.")
+    parser.add_argument("size", type=int, help="how many cats, dead, faded and outside cats included")
+    parser.add_argument("--name", default="Synthetic", help="the Clan's name, without \"Clan\"")
+    parser.add_argument("--seed", type=int, default=None, help="makes the same Clan every time")
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--relationships", type=int, default=40,
+                        help="relationships per living cat, besides family and mates. -1 for every cat")
+    parser.add_argument("--game-mode", default="expanded", choices=["classic", "expanded", "cruel season"])
+    parser.add_argument("--overwrite", action="store_true", help="replace a saved Clan with the same name")
+    args = parser.parse_args(args)
+
+    synthetic_clan = SyntheticClan(args.size, name=args.name, seed=args.seed, generations=args.generations,
+                                   relationships_per_cat=None if args.relationships < 0 else args.relationships,
+                                   game_mode=args.game_mode, overwrite=args.overwrite)
+    try:
+        synthetic_clan.make()
+    except FileExistsError as e:
+        print(e)
+        return 1
+    print(f"Saved {args.name}Clan with {args.size} cats in {synthetic_clan.clan_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
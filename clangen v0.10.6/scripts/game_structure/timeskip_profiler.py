@@ -0,0 +1,71 @@
+"""
+Adds up how long the parts of a timeskip take, to find out what makes big Clans slow. Turn it on in the debug
+console with "toggle debug profiletimeskip". Each timeskip then prints how long it took in total, and how long
+was spent in each part that's timed:
+
+    with timeskip_profiler.section("grief"):
+        ...
+
+or, for a whole function:
+
+    @timeskip_profiler.timed("grief")
+    def grief(self, body: bool):
+"""
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+from scripts.game_structure.game_essentials import game
+
+
+class TimeskipProfiler():
+
+    def __init__(self):
+        self.sections = {}  # name: [seconds, times it ran]
+        self.start_time = None
+
+    @property
+    def enabled(self):
+        return game.debug_settings.get("profiletimeskip", False)
+
+    def start(self):
+        self.sections.clear()
+        self.start_time = perf_counter()
+
+    @contextmanager
+    def section(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            totals = self.sections.setdefault(name, [0.0, 0])
+            totals[0] += perf_counter() - start
+            totals[1] += 1
+
+    def timed(self, name):
+        """Decorator that times every call of the function as the section name."""
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.section(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def get_report(self):
+        """Returns the report as a list of lines."""
+        lines = [f"Timeskip took {(perf_counter() - self.start_time) * 1000:.1f} ms"]
+        for name, (seconds, count) in sorted(self.sections.items(), key=lambda item: -item[1][0]):
+            lines.append(f"    {name}: {seconds * 1000:.1f} ms, {count} times")
+        return lines
+
+    def finish(self):
+        if self.enabled and self.start_time is not None:
+            print("\n".join(self.get_report()))
+        self.start_time = None
+
+
+timeskip_profiler = TimeskipProfiler()
@@ -131,10 +131,11 @@ class SaveCheck(UIWindow):
                 if game.clan is not None:
                     self.save_button_saving_state.show()
                     self.save_button.disable()
-                    game.save_cats()
-                    game.clan.save_clan()
-                    game.clan.save_pregnancy(game.clan)
-                    game.save_events()
+                    with game.save_session():
+                        game.save_cats()
+                        game.clan.save_clan()
+                        game.clan.save_pregnancy(game.clan)
+                        game.save_events()
                     self.save_button_saving_state.hide()
                     self.save_button_saved_state.show()
             elif event.ui_element == self.back_button:
@@ -1263,7 +1264,7 @@ class EventLoading(UIWindow):
     def load_images():
         frames = []
         for i in range(0, 16):
-            frames.append(pygame.image.load(
+            frames.append(image_cache.load_image(
                 f"resources/images/loading_animate/timeskip/{i}.png"))
 
         return frames
@@ -8,7 +8,6 @@ from itertools import repeat
 
 import ujson
 import pygame
-from os.path import exists as path_exists
 
 from scripts.cat.history import History
 from scripts.clan import Clan
@@ -21,6 +20,7 @@ from scripts.utility import (
     get_special_snippet_list
 )
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure import image_cache
 from itertools import combinations
 from scripts.patrol.patrol_event import PatrolEvent
 from scripts.patrol.patrol_outcome import PatrolOutcome
@@ -879,7 +879,7 @@ class Patrol():
             file_name = self.patrol_event.patrol_art
             
         
-        if not isinstance(file_name, str) or not path_exists(f"{root_dir}{file_name}.png"):
+        if not isinstance(file_name, str) or not image_cache.image_exists(f"{root_dir}{file_name}.png"):
             if "herb_gathering" in self.patrol_event.types:
                 file_name = 'med'
             elif "hunting" in self.patrol_event.types:
@@ -891,7 +891,16 @@ class Patrol():
             
             file_name = f"{file_name}_general_intro"
             
-        return pygame.image.load(f"{root_dir}{file_name}.png")
+        return image_cache.load_image(f"{root_dir}{file_name}.png")
+
+    def prefetch_outcome_art(self):
+        """Starts loading the art of every outcome this patrol could have, so it's ready when the patrol ends."""
+        if not self.patrol_event:
+            return
+        outcomes = self.patrol_event.success_outcomes + self.patrol_event.fail_outcomes + \
+            self.patrol_event.antag_success_outcomes + self.patrol_event.antag_fail_outcomes
+        paths = [outcome.get_outcome_art_path() for outcome in outcomes]
+        image_cache.prefetch_images([path for path in paths if path])
     
     def process_text(self, text, stat_cat:Cat) -> str:
         """Processes text """
@@ -4,8 +4,6 @@ import random
 from random import choice, randint, choices
 from typing import List, Dict, Union, TYPE_CHECKING
 import re
-import pygame
-from os.path import exists as path_exists
 
 if TYPE_CHECKING:
     from scripts.patrol.patrol import Patrol
@@ -18,6 +16,7 @@ from scripts.utility import (
     change_relationship_values, create_new_cat,
 )
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure import image_cache
 from scripts.cat.skills import SkillPath
 from scripts.cat.cats import Cat, ILLNESSES, INJURIES, PERMANENT, BACKSTORIES
 from scripts.cat.pelts import Pelt
@@ -287,6 +286,14 @@ class PatrolOutcome():
 
     def get_outcome_art(self):
         """Return outcome art, if not None. Return's None if there is no outcome art, or if outcome art can't be found.  """
+        path = self.get_outcome_art_path()
+        if path is None:
+            return None
+
+        return image_cache.load_image(path)
+
+    def get_outcome_art_path(self):
+        """Return's the path to the outcome art, or None if there is no outcome art or it can't be found. """
         root_dir = "resources/images/patrol_art/"
         
         if game.settings.get("gore") and self.outcome_art_clean:
@@ -294,10 +301,10 @@ class PatrolOutcome():
         else:
             file_name = self.outcome_art
 
-        if not isinstance(file_name, str) or not path_exists(f"{root_dir}{file_name}.png"):
+        if not isinstance(file_name, str) or not image_cache.image_exists(f"{root_dir}{file_name}.png"):
             return None
-            
-        return pygame.image.load(f"{root_dir}{file_name}.png")
+
+        return f"{root_dir}{file_name}.png"
         
     # ---------------------------------------------------------------------------- #
     #                                   HANDLERS                                   #
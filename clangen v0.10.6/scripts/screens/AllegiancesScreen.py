@@ -4,6 +4,7 @@ import pygame_gui
 from .Screens import Screens
 
 from scripts.cat.cats import Cat
+from scripts.game_structure import image_cache
 from scripts.game_structure.image_button import UISpriteButton, UIImageButton, UITextBoxTweaked
 from scripts.utility import get_text_box_theme, scale, get_med_cats, shorten_text_to_fit, get_alive_clan_queens
 from scripts.game_structure.game_essentials import game, screen_x, screen_y, MANAGER
@@ -358,7 +359,7 @@ class MedDenScreen(Screens):
             self.log_title.hide()
             self.cat_bg = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                             ((280, 880), (1120, 400))),
-                                                      pygame.image.load(
+                                                      image_cache.load_image(
                                                           "resources/images/sick_hurt_bg.png").convert_alpha()
                                                       , manager=MANAGER)
             self.cat_bg.disable()
@@ -750,7 +751,7 @@ class MedDenScreen(Screens):
                 self.herbs["cobweb1"] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                           ((216, 190), (792, 448))),
                                                                     pygame.transform.scale(
-                                                                        pygame.image.load(
+                                                                        image_cache.load_image(
                                                                             "resources/images/med_cat_den/cobweb1.png").convert_alpha(),
                                                                         (792, 448)
                                                                     ), manager=MANAGER)
@@ -758,7 +759,7 @@ class MedDenScreen(Screens):
                     self.herbs["cobweb2"] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                               ((216, 190), (792, 448))),
                                                                         pygame.transform.scale(
-                                                                            pygame.image.load(
+                                                                            image_cache.load_image(
                                                                                 "resources/images/med_cat_den/cobweb2.png").convert_alpha(),
                                                                             (792, 448)
                                                                         ), manager=MANAGER)
@@ -766,7 +767,7 @@ class MedDenScreen(Screens):
             self.herbs[herb] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                  ((216, 190), (792, 448))),
                                                            pygame.transform.scale(
-                                                               pygame.image.load(
+                                                               image_cache.load_image(
                                                                    f"resources/images/med_cat_den/{herb}.png").convert_alpha(),
                                                                (792, 448)
                                                            ), manager=MANAGER)
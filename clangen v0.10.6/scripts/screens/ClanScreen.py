@@ -1,8 +1,6 @@
 import pygame
 import pygame_gui
 import traceback
-from copy import deepcopy
-import random
 
 from .Screens import Screens
 
@@ -10,6 +8,7 @@ from scripts.cat.cats import Cat
 from scripts.game_structure.image_button import UISpriteButton, UIImageButton
 from scripts.utility import scale
 from scripts.game_structure import image_cache
+from scripts.game_structure.camp_layout import camp_layout
 from scripts.game_structure.game_essentials import game, screen, screen_x, screen_y
 from scripts.game_structure.windows import SaveError
 
@@ -31,6 +30,7 @@ class ClanScreen(Screens):
         self.leader_den_label = None
         self.warrior_den_label = None
         self.layout = None
+        self.layout_name = None
 
     def on_use(self):
         if game.clan.clan_settings['backgrounds']:
@@ -51,10 +51,11 @@ class ClanScreen(Screens):
                 try:
                     self.save_button_saving_state.show()
                     self.save_button.disable()
-                    game.save_cats()
-                    game.clan.save_clan()
-                    game.clan.save_pregnancy(game.clan)
-                    game.save_events()
+                    with game.save_session():
+                        game.save_cats()
+                        game.clan.save_clan()
+                        game.clan.save_pregnancy(game.clan)
+                        game.save_events()
                     game.save_settings()
                     game.switches['saved_clan'] = True
                     self.update_buttons_and_text()
@@ -87,10 +88,11 @@ class ClanScreen(Screens):
             elif event.key == pygame.K_SPACE:
                 self.save_button_saving_state.show()
                 self.save_button.disable()
-                game.save_cats()
-                game.clan.save_clan()
-                game.clan.save_pregnancy(game.clan)
-                game.save_events()
+                with game.save_session():
+                    game.save_cats()
+                    game.clan.save_clan()
+                    game.clan.save_pregnancy(game.clan)
+                    game.save_events()
                 game.save_settings()
                 game.switches['saved_clan'] = True
                 self.update_buttons_and_text()
@@ -100,9 +102,10 @@ class ClanScreen(Screens):
         self.update_camp_bg()
         game.switches['cat'] = None
         if game.clan.biome + game.clan.camp_bg in game.clan.layouts:
-            self.layout = game.clan.layouts[game.clan.biome + game.clan.camp_bg]
+            self.layout_name = game.clan.biome + game.clan.camp_bg
         else:
-            self.layout = game.clan.layouts["default"]
+            self.layout_name = "default"
+        self.layout = game.clan.layouts[self.layout_name]
 
         self.choose_cat_positions()
         
@@ -116,9 +119,9 @@ class ClanScreen(Screens):
         # We have to convert the positions to something pygame_gui buttons will understand
         # This should be a temp solution. We should change the code that determines positions.
         i = 0
-        for x in game.clan.clan_cats:
-            if not Cat.all_cats[x].dead and Cat.all_cats[x].in_camp and \
-                    not (Cat.all_cats[x].exiled or Cat.all_cats[x].outside) and (Cat.all_cats[x].status != 'newborn' or game.config['fun']['all_cats_are_newborn'] or game.config['fun']['newborns_can_roam']):
+        for the_cat in Cat.get_roster_cats(game.clan.clan_cats):
+            if not the_cat.dead and the_cat.in_camp and \
+                    not (the_cat.exiled or the_cat.outside) and (the_cat.status != 'newborn' or game.config['fun']['all_cats_are_newborn'] or game.config['fun']['newborns_can_roam']):
 
                 i += 1
                 if i > self.max_sprites_displayed:
@@ -126,13 +129,13 @@ class ClanScreen(Screens):
 
                 try:
                     self.cat_buttons.append(
-                        UISpriteButton(scale(pygame.Rect(tuple(Cat.all_cats[x].placement), (100, 100))),
-                                       Cat.all_cats[x].sprite,
-                                       cat_id=x,
+                        UISpriteButton(scale(pygame.Rect(tuple(the_cat.placement), (100, 100))),
+                                       the_cat.sprite,
+                                       cat_id=the_cat.ID,
                                        starting_height=i)
                     )
                 except:
-                    print(f"ERROR: placing {Cat.all_cats[x].name}\'s sprite on Clan page")
+                    print(f"ERROR: placing {the_cat.name}\'s sprite on Clan page")
                     
         # Den Labels
         # Redo the locations, so that it uses layout on the Clan page
@@ -268,108 +271,22 @@ class ClanScreen(Screens):
             all_backgrounds.append(platform_dir)
 
         self.newleaf_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[0]).convert(), (screen_x, screen_y))
+            image_cache.load_image(all_backgrounds[0]).convert(), (screen_x, screen_y))
         self.greenleaf_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[1]).convert(), (screen_x, screen_y))
+            image_cache.load_image(all_backgrounds[1]).convert(), (screen_x, screen_y))
         self.leafbare_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[2]).convert(), (screen_x, screen_y))
+            image_cache.load_image(all_backgrounds[2]).convert(), (screen_x, screen_y))
         self.leaffall_bg = pygame.transform.scale(
-            pygame.image.load(all_backgrounds[3]).convert(), (screen_x, screen_y))
-
-    def choose_nonoverlapping_positions(self, first_choices, dens, weights=None):
-        if not weights:
-            weights = [1] * len(dens)
-
-        dens = dens.copy()
-
-        chosen_index = random.choices(range(0, len(dens)), weights=weights, k=1)[0]
-        first_chosen_den = dens[chosen_index]
-        while True:
-            chosen_den = dens[chosen_index]
-            if first_choices[chosen_den]:
-                pos = random.choice(first_choices[chosen_den])
-                first_choices[chosen_den].remove(pos)
-                just_pos = pos[0].copy()
-                if pos not in first_choices[chosen_den]:
-                    # Then this is the second cat to be places here, given an offset
-
-                    # Offset based on the "tag" in pos[1]. If "y" is in the tag,
-                    # the cat will be offset down. If "x" is in the tag, the behavior depends on
-                    # the presence of the "y" tag. If "y" is not present, always shift the cat left or right
-                    # if it is present, shift the cat left or right 3/4 of the time.
-                    if "x" in pos[1] and ("y" not in pos[1] or random.getrandbits(2)):
-                        just_pos[0] += 15 * random.choice([-1, 1])
-                    if "y" in pos[1]:
-                        just_pos[1] += 15
-                return tuple(just_pos)
-            dens.pop(chosen_index)
-            weights.pop(chosen_index)
-            if not dens:
-                break
-            # Put finding the next index after the break condition, so it won't be done unless needed
-            chosen_index = random.choices(range(0, len(dens)), weights=weights, k=1)[0]
-
-        # If this code is reached, all position are filled.  Choose any position in the first den
-        # checked, apply offsets.
-        pos = random.choice(self.layout[first_chosen_den])
-        just_pos = pos[0].copy()
-        if "x" in pos[1] and random.getrandbits(1):
-            just_pos[0] += 15 * random.choice([-1, 1])
-        if "y" in pos[1]:
-            just_pos[1] += 15
-        return tuple(just_pos)
+            image_cache.load_image(all_backgrounds[3]).convert(), (screen_x, screen_y))
 
     def choose_cat_positions(self):
-        """Determines the positions of cat on the clan screen."""
-        # These are the first choices. As positions are chosen, they are removed from the options to indicate they are
-        # taken.
-        first_choices = deepcopy(self.layout)
-
-        all_dens = ["nursery place", "leader place", "elder place", "medicine place", "apprentice place",
-                    "clearing place", "warrior place"]
-
-        # Allow two cat in the same position.
-        for x in all_dens:
-            first_choices[x].extend(first_choices[x])
-
-        for x in game.clan.clan_cats:
-            if Cat.all_cats[x].dead or Cat.all_cats[x].outside:
-                continue
-
-            # Newborns are not meant to be placed. They are hiding. 
-            if Cat.all_cats[x].status == 'newborn' or game.config['fun']['all_cats_are_newborn']:
-                if game.config['fun']['all_cats_are_newborn'] or game.config['fun']['newborns_can_roam']:
-                    # Free them
-                    Cat.all_cats[x].placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                     [1, 100, 1, 1, 1, 100, 50])
-                else:
-                    continue
- 
-            if Cat.all_cats[x].status in ['apprentice', 'mediator apprentice']:
-                Cat.all_cats[x].placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                 [1, 50, 1, 1, 100, 100, 1])
-            elif Cat.all_cats[x].status == 'deputy':
-                Cat.all_cats[x].placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                 [1, 50, 1, 1, 1, 50, 1])
-
-            elif Cat.all_cats[x].status == 'elder':
-                Cat.all_cats[x].placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                 [1, 1, 2000, 1, 1, 1, 1])
-            elif Cat.all_cats[x].status == 'kitten':
-                Cat.all_cats[x].placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                 [60, 8, 1, 1, 1, 1, 1])
-            elif Cat.all_cats[x].status in [
-                'medicine cat apprentice', 'medicine cat'
-            ]:
-                Cat.all_cats[x].placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                 [20, 20, 20, 400, 1, 1, 1])
-            elif Cat.all_cats[x].status in ['warrior', 'mediator']:
-                Cat.all_cats[x].placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                 [1, 1, 1, 1, 1, 60, 60])
-            elif Cat.all_cats[x].status == "leader":
-                game.clan.leader.placement = self.choose_nonoverlapping_positions(first_choices, all_dens,
-                                                                                  [1, 200, 1, 1, 1, 1, 1])
-                                                                                  
+        """Determines the positions of cat on the clan screen. They only change once a moon, or when the cats in
+            camp change."""
+        cats = [cat for cat in Cat.get_roster_cats(game.clan.clan_cats) if not (cat.dead or cat.outside)]
+        camp_layout.place_cats(cats, self.layout_name, self.layout,
+                               seed=f"{game.clan.name}{game.clan.age}",
+                               newborns_roam=game.config['fun']['all_cats_are_newborn'] or
+                               game.config['fun']['newborns_can_roam'])
 
     def update_buttons_and_text(self):
         if game.switches['saved_clan']:
@@ -10,6 +10,7 @@ from ..cat.cats import Cat
 from ..game_structure import image_cache
 from scripts.event_class import Single_Event
 from scripts.game_structure.windows import GameOver
+from scripts.game_structure.event_history import event_history
 
 
 class EventsScreen(Screens):
@@ -52,6 +53,10 @@ class EventsScreen(Screens):
         self.cat_profile_buttons = {}
         self.scroll_height = {}
         self.events_thread = None
+        self.previous_moon_button = None
+        self.next_moon_button = None
+        # The moon whose events are shown, or None for the current moon.
+        self.viewed_moon = None
 
         # Stores the involved cat button that currently has its cat profile buttons open
         self.open_involved_cat_button = None
@@ -149,6 +154,10 @@ class EventsScreen(Screens):
                 self.update_list_buttons(self.misc_events_button, self.misc_alert)
                 self.display_events = self.misc_events
                 self.update_events_display()
+            elif event.ui_element == self.previous_moon_button:
+                self.change_viewed_moon(self.get_previous_moon())
+            elif event.ui_element == self.next_moon_button:
+                self.change_viewed_moon(self.get_next_moon())
             elif event.ui_element in self.involved_cat_buttons:
                 self.make_cat_buttons(event.ui_element)
             elif event.ui_element in self.cat_profile_buttons:
@@ -242,6 +251,7 @@ class EventsScreen(Screens):
         # On first open, update display events list
         if not self.first_opened:
             self.first_opened = True
+            self.viewed_moon = None
             self.update_display_events_lists()
             self.display_events = self.all_events
 
@@ -275,6 +285,17 @@ class EventsScreen(Screens):
         self.timeskip_button = UIImageButton(scale(pygame.Rect((620, 436), (360, 60))), "", object_id="#timeskip_button"
                                              , manager=MANAGER)
 
+        # Page through the event history
+        self.previous_moon_button = UIImageButton(scale(pygame.Rect((520, 346), (68, 68))), "",
+                                                  object_id="#arrow_left_button",
+                                                  tool_tip_text="See the events of the previous moon",
+                                                  manager=MANAGER)
+        self.next_moon_button = UIImageButton(scale(pygame.Rect((1012, 346), (68, 68))), "",
+                                              object_id="#arrow_right_button",
+                                              tool_tip_text="See the events of the next moon",
+                                              manager=MANAGER)
+        self.update_moon_buttons()
+
         # commenting out for now as there seems to be a consensus that it isn't needed anymore?
         #if game.clan.closed_borders:
         #    self.toggle_borders_button = pygame_gui.elements.UIButton(scale(pygame.Rect((500, 210), (200, 30))),
@@ -353,6 +374,10 @@ class EventsScreen(Screens):
 
         self.timeskip_button.kill()
         del self.timeskip_button
+        self.previous_moon_button.kill()
+        del self.previous_moon_button
+        self.next_moon_button.kill()
+        del self.next_moon_button
         if game.clan.game_mode != "classic":
             self.freshkill_pile_button.kill()
             del self.freshkill_pile_button
@@ -420,6 +445,8 @@ class EventsScreen(Screens):
         """Various sorting and other tasks that must be done with the timeskip is over. """
         
         self.scroll_height = {}
+        self.viewed_moon = None
+        self.update_moon_buttons()
         
         if get_living_clan_cat_count(Cat) == 0:
             GameOver('events screen')
@@ -535,9 +562,11 @@ class EventsScreen(Screens):
     def update_events_display(self):
 
         self.season.set_text(f'Current season: {game.clan.current_season}')
-        if game.clan.age == 1:
+        if self.viewed_moon is not None:
+            self.clan_age.set_text(f'Events of moon {self.viewed_moon}')
+        elif game.clan.age == 1:
             self.clan_age.set_text(f'Clan age: {game.clan.age} moon')
-        if game.clan.age != 1:
+        else:
             self.clan_age.set_text(f'Clan age: {game.clan.age} moons')
 
         for ele in self.display_events_elements:
@@ -666,16 +695,64 @@ class EventsScreen(Screens):
 
     def update_display_events_lists(self):
         """
-        Categorize events from game.cur_events_list into display categories for screen
+        Categorize events from game.cur_events_list, or from the event history if a previous moon is being viewed,
+        into display categories for screen
         """
+        if self.viewed_moon is None:
+            events_list = game.cur_events_list
+        else:
+            events_list = event_history.get_moon(self.viewed_moon)
+
+        self.all_events = [x for x in events_list if "interaction" not in x.types]
+        self.ceremony_events = [x for x in events_list if "ceremony" in x.types]
+        self.birth_death_events = [x for x in events_list if "birth_death" in x.types]
+        self.relation_events = [x for x in events_list if "relation" in x.types]
+        self.health_events = [x for x in events_list if "health" in x.types]
+        self.other_clans_events = [x for x in events_list if "other_clans" in x.types]
+        self.misc_events = [x for x in events_list if "misc" in x.types]
+
+    def get_previous_moon(self):
+        """ Returns the closest moon before the viewed one that has recorded events, or None if there isn't one """
+        current = game.clan.age if self.viewed_moon is None else self.viewed_moon
+        earlier = [moon for moon in event_history.get_moons() if moon < current]
+        return earlier[-1] if earlier else None
+
+    def get_next_moon(self):
+        """ Returns the closest moon after the viewed one that has recorded events. None means the current moon. """
+        if self.viewed_moon is None:
+            return None
+        later = [moon for moon in event_history.get_moons() if self.viewed_moon < moon < game.clan.age]
+        return later[0] if later else None
+
+    def change_viewed_moon(self, moon):
+        """ Shows the events of the given moon, or the current moon's if moon is None """
+        self.viewed_moon = moon
+        self.scroll_height = {}
+        self.update_display_events_lists()
+        self.display_events = {
+            "all events": self.all_events,
+            "ceremony events": self.ceremony_events,
+            "birth death events": self.birth_death_events,
+            "relationship events": self.relation_events,
+            "health events": self.health_events,
+            "other clans events": self.other_clans_events,
+            "misc events": self.misc_events
+        }[self.event_display_type]
+        self.update_moon_buttons()
+        self.update_events_display()
 
-        self.all_events = [x for x in game.cur_events_list if "interaction" not in x.types]
-        self.ceremony_events = [x for x in game.cur_events_list if "ceremony" in x.types]
-        self.birth_death_events = [x for x in game.cur_events_list if "birth_death" in x.types]
-        self.relation_events = [x for x in game.cur_events_list if "relation" in x.types]
-        self.health_events = [x for x in game.cur_events_list if "health" in x.types]
-        self.other_clans_events = [x for x in game.cur_events_list if "other_clans" in x.types]
-        self.misc_events = [x for x in game.cur_events_list if "misc" in x.types]
+    def update_moon_buttons(self):
+        """ Enables the history arrows only if there is somewhere for them to go """
+        if not self.previous_moon_button:
+            return
+        if self.get_previous_moon() is None:
+            self.previous_moon_button.disable()
+        else:
+            self.previous_moon_button.enable()
+        if self.viewed_moon is None:
+            self.next_moon_button.disable()
+        else:
+            self.next_moon_button.enable()
 
     def make_events_container(self):
         """ In its own function so that there is only one place the box size is set"""
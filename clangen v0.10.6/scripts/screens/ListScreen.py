@@ -4,16 +4,18 @@ import pygame_gui
 
 from .Screens import Screens
 from scripts.cat.cats import Cat
-from scripts.game_structure.image_button import UISpriteButton, UIImageButton
-from scripts.utility import get_text_box_theme, scale, shorten_text_to_fit
+from scripts.cat.names import name_index
+from scripts.game_structure import image_cache
+from scripts.game_structure.image_button import UIImageButton
+from scripts.game_structure.cat_grid import UICatGrid
+from scripts.utility import get_text_box_theme, scale
 from scripts.game_structure.game_essentials import game, screen, screen_x, screen_y, MANAGER
 
 
 class ListScreen(Screens):
     # the amount of cats a page can hold is 20, so the amount of pages is cats/20
     list_page = 1
-    display_cats = []
-    cat_names = []
+    cat_grid = None
 
     previous_search_text = ""
 
@@ -24,6 +26,8 @@ class ListScreen(Screens):
         self.death_status = "living"
         self.current_group = "clan"
         self.full_cat_list = []
+        # The sort type full_cat_list was last sorted by, or None if it needs sorting again.
+        self.full_cat_list_sort = None
 
         self.bg = None
         self.df_button = None
@@ -60,13 +64,13 @@ class ListScreen(Screens):
         self.current_listed_cats = None
 
         self.sc_bg = pygame.transform.scale(
-            pygame.image.load("resources/images/starclanbg.png").convert(),
+            image_cache.load_image("resources/images/starclanbg.png").convert(),
             (screen_x, screen_y))
         self.df_Bg = pygame.transform.scale(
-            pygame.image.load("resources/images/darkforestbg.png").convert(),
+            image_cache.load_image("resources/images/darkforestbg.png").convert(),
             (screen_x, screen_y))
         self.ur_bg = pygame.transform.scale(
-            pygame.image.load("resources/images/urbg.png").convert(),
+            image_cache.load_image("resources/images/urbg.png").convert(),
             (screen_x, screen_y))
 
     def handle_event(self, event):
@@ -165,8 +169,8 @@ class ListScreen(Screens):
                 game.sort_type = "death"
                 self.update_filter_buttons()
                 self.update_search_cats(self.search_bar.get_text())
-            elif event.ui_element in self.display_cats:
-                game.switches["cat"] = event.ui_element.return_cat_id()
+            elif self.cat_grid and event.ui_element in self.cat_grid:
+                game.switches["cat"] = self.cat_grid.get_cat(event.ui_element).ID
                 game.last_list_forProfile = self.current_group
                 self.change_screen('profile screen')
             else:
@@ -217,7 +221,7 @@ class ListScreen(Screens):
 
         # search bar
         self.search_bar_image = pygame_gui.elements.UIImage(scale(pygame.Rect((279, y_pos), (236, 68))),
-                                                            pygame.image.load(
+                                                            image_cache.load_image(
                                                                 "resources/images/search_bar.png").convert_alpha(),
                                                             manager=MANAGER)
 
@@ -379,7 +383,11 @@ class ListScreen(Screens):
 
         self.update_filter_buttons()
 
-        self.update_search_cats("")  # This will list all the cats, and create the button objects.
+        # The cat sprites and names are made once here, and reused for every page and search.
+        self.cat_grid = UICatGrid((270, 370), (240, 200), 5, 4,
+                                  text_theme=self.get_name_theme(), fav_markers=True)
+
+        self.update_search_cats("")  # This will list all the cats, and fill in the cat grid.
 
     def update_bg(self):
         if self.current_group == 'sc':
@@ -480,75 +488,78 @@ class ListScreen(Screens):
         self.filter_not_fav.kill()
 
         # Remove currently displayed cats and cat names.
-        for cat in self.display_cats:
-            cat.kill()
-        self.display_cats = []
-
-        for name in self.cat_names:
-            name.kill()
-        self.cat_names = []
+        self.cat_grid.kill()
+        self.cat_grid = None
 
     def get_your_clan_cats(self):
         self.current_group = 'clan'
+        self.full_cat_list_sort = None
         self.death_status = 'living'
         self.full_cat_list = []
-        for the_cat in Cat.all_cats_list:
+        for the_cat in Cat.get_roster():
             if not the_cat.dead and not the_cat.outside:
                 self.full_cat_list.append(the_cat)
 
     def get_cotc_cats(self):
         self.current_group = 'cotc'
+        self.full_cat_list_sort = None
         self.death_status = 'living'
         self.full_cat_list = []
-        for the_cat in Cat.all_cats_list:
+        for the_cat in Cat.get_roster():
             if not the_cat.dead and the_cat.outside:
                 self.full_cat_list.append(the_cat)
 
     def get_sc_cats(self):
         self.current_group = 'sc'
+        self.full_cat_list_sort = None
         self.death_status = 'dead'
         self.full_cat_list = []
-        for the_cat in Cat.all_cats_list:
+        for the_cat in Cat.get_roster():
             if the_cat.dead and the_cat.ID != game.clan.instructor.ID and not the_cat.outside and not the_cat.df and \
                     not the_cat.faded:
                 self.full_cat_list.append(the_cat)
 
     def get_df_cats(self):
         self.current_group = 'df'
+        self.full_cat_list_sort = None
         self.death_status = 'dead'
         self.full_cat_list = []
 
-        for the_cat in Cat.all_cats_list:
+        for the_cat in Cat.get_roster():
             if the_cat.dead and the_cat.ID != game.clan.instructor.ID and the_cat.df and \
                     not the_cat.faded:
                 self.full_cat_list.append(the_cat)
 
     def get_ur_cats(self):
         self.current_group = 'ur'
+        self.full_cat_list_sort = None
         self.death_status = 'dead'
         self.full_cat_list = []
-        for the_cat in Cat.all_cats_list:
+        for the_cat in Cat.get_roster():
             if the_cat.ID in game.clan.unknown_cats and not the_cat.faded:
                 self.full_cat_list.append(the_cat)
 
     def update_search_cats(self, search_text):
         """Run this function when the search text changes, or when the screen is switched to."""
         self.current_listed_cats = []
-        Cat.sort_cats(self.full_cat_list)
 
-        # adding in the guide if necessary, this ensures the guide isn't affected by sorting as we always want them to
-        # be the first cat on the list
-        if (self.current_group == 'df' and game.clan.instructor.df) or (self.current_group == 'sc' and not game.clan.instructor.df):
-            if game.clan.instructor in self.full_cat_list:
-                self.full_cat_list.remove(game.clan.instructor)
-            self.full_cat_list.insert(0, game.clan.instructor)
+        # Only sort when the group or sort type has changed, not on every keystroke in the search bar.
+        if self.full_cat_list_sort != game.sort_type:
+            Cat.sort_cats(self.full_cat_list)
+            self.full_cat_list_sort = game.sort_type
+
+            # adding in the guide if necessary, this ensures the guide isn't affected by sorting as we always want
+            # them to be the first cat on the list
+            if (self.current_group == 'df' and game.clan.instructor.df) or \
+                    (self.current_group == 'sc' and not game.clan.instructor.df):
+                if game.clan.instructor in self.full_cat_list:
+                    self.full_cat_list.remove(game.clan.instructor)
+                self.full_cat_list.insert(0, game.clan.instructor)
 
 
         search_text = search_text.strip()
         if search_text not in ['', 'name search']:
-            for cat in self.full_cat_list:
-                if search_text.lower() in str(cat.name).lower():
-                    self.current_listed_cats.append(cat)
+            self.current_listed_cats = name_index.search(self.full_cat_list, search_text)
         else:
             self.current_listed_cats = self.full_cat_list.copy()
 
@@ -594,63 +605,16 @@ class ListScreen(Screens):
 
         self.page_number.set_text(str(self.list_page) + "/" + str(self.all_pages))
 
-        # Remove the images for currently listed cats
-        for cat in self.display_cats:
-            cat.kill()
-        self.display_cats = []
-
-        for name in self.cat_names:
-            name.kill()
-        self.cat_names = []
-
-        # Generate object for the current cats
+        # Rebind the cat grid to the current page
+        self.cat_grid.set_text_theme(self.get_name_theme())
+        page_size = self.cat_grid.page_size
+        self.cat_grid.set_cats(self.current_listed_cats[(self.list_page - 1) * page_size:self.list_page * page_size],
+                               show_fav=game.clan.clan_settings["show fav"])
 
+    def get_name_theme(self):
         if self.death_status == 'living':
-            text_theme = get_text_box_theme("#text_box_30_horizcenter")
-        else:
-            text_theme = "#text_box_30_horizcenter_light"
-
-        pos_x = 0
-        pos_y = 10
-        if self.current_listed_cats:
-            for cat in self.chunks(self.current_listed_cats, 20)[self.list_page - 1]:
-
-                # update_sprite(cat)
-                if game.clan.clan_settings["show fav"] and cat.favourite:
-
-                    _temp = pygame.transform.scale(
-                        pygame.image.load(
-                            f"resources/images/fav_marker.png").convert_alpha(),
-                        (100, 100))
-
-                    if game.settings["dark mode"]:
-                        _temp.set_alpha(150)
-
-                    self.display_cats.append(
-                        pygame_gui.elements.UIImage(
-                            scale(pygame.Rect((270 + pos_x, 360 + pos_y), (100, 100))),
-                            _temp))
-                    self.display_cats[-1].disable()
-
-                self.display_cats.append(
-                    UISpriteButton(scale(pygame.Rect
-                                         ((270 + pos_x, 360 + pos_y), (100, 100))),
-                                   cat.sprite,
-                                   cat.ID,
-                                   starting_height=0, manager=MANAGER))
-
-                name = str(cat.name)
-                short_name = shorten_text_to_fit(name, 220, 30)
-
-                self.cat_names.append(
-                    pygame_gui.elements.ui_label.UILabel(scale(pygame.Rect((170 + pos_x, 460 + pos_y), (300, 60))),
-                                                         short_name,
-                                                         object_id=text_theme,
-                                                         manager=MANAGER))
-                pos_x += 240
-                if pos_x >= 1200:
-                    pos_x = 0
-                    pos_y += 200
+            return get_text_box_theme("#text_box_30_horizcenter")
+        return "#text_box_30_horizcenter_light"
 
     def on_use(self):
         # Only update the positions if the search text changes
@@ -661,6 +625,3 @@ class ListScreen(Screens):
         self.previous_search_text = self.search_bar.get_text()
 
         self.update_bg()
-
-    def chunks(self, L, n):
-        return [L[x: x + n] for x in range(0, len(L), n)]
@@ -6,31 +6,34 @@ from .Screens import Screens
 
 from scripts.utility import get_text_box_theme, scale
 from scripts.clan import Clan
-from scripts.cat.cats import create_example_cats, Cat
+from scripts.cat.cats import Cat
+from scripts.cat.example_cats import example_cat_pool
 from scripts.cat.names import names
 from re import sub
 from scripts.game_structure import image_cache
 from scripts.game_structure.image_button import UIImageButton, UISpriteButton
 from scripts.game_structure.game_essentials import game, screen, screen_x, screen_y, MANAGER
+from scripts.game_structure.event_history import event_history
+from scripts.housekeeping.datadir import get_save_dir
 from scripts.patrol.patrol import Patrol
 
 
 class MakeClanScreen(Screens):
     # UI images
-    clan_frame_img = pygame.transform.scale(pygame.image.load(
+    clan_frame_img = pygame.transform.scale(image_cache.load_image(
         'resources/images/pick_clan_screen/clan_name_frame.png').convert_alpha(), (432, 100))
-    name_clan_img = pygame.transform.scale(pygame.image.load(
+    name_clan_img = pygame.transform.scale(image_cache.load_image(
         'resources/images/pick_clan_screen/name_clan_light.png').convert_alpha(), (1600, 1400))
-    leader_img = pygame.transform.scale(pygame.image.load(
+    leader_img = pygame.transform.scale(image_cache.load_image(
         'resources/images/pick_clan_screen/leader_light.png').convert_alpha(), (1600, 1400))
-    deputy_img = pygame.transform.scale(pygame.image.load(
+    deputy_img = pygame.transform.scale(image_cache.load_image(
         'resources/images/pick_clan_screen/deputy_light.png').convert_alpha(), (1600, 1400))
-    medic_img = pygame.transform.scale(pygame.image.load(
+    medic_img = pygame.transform.scale(image_cache.load_image(
         'resources/images/pick_clan_screen/med_light.png').convert_alpha(), (1600, 1400))
-    clan_img = pygame.transform.scale(pygame.image.load(
+    clan_img = pygame.transform.scale(image_cache.load_image(
         'resources/images/pick_clan_screen/clan_light.png').convert_alpha(), (1600, 1400))
     bg_preview_border = pygame.transform.scale(
-        pygame.image.load("resources/images/bg_preview_border.png").convert_alpha(), (466, 416))
+        image_cache.load_image("resources/images/bg_preview_border.png").convert_alpha(), (466, 416))
 
     classic_mode_text = "This mode is Clan Generator at it's most basic. " \
                         "The player will not be expected to manage the minutia of Clan life. <br><br>" \
@@ -102,7 +105,7 @@ class MakeClanScreen(Screens):
         )
         self.main_menu = UIImageButton(scale(pygame.Rect((50, 100), (306, 60))), "", object_id="#main_menu_button"
                                        , manager=MANAGER)
-        create_example_cats()
+        game.choose_cats.update(enumerate(example_cat_pool.take()))
         # self.worldseed = randrange(10000)
         self.open_game_mode()
 
@@ -233,7 +236,7 @@ class MakeClanScreen(Screens):
         if event.ui_element in [self.elements['roll1'], self.elements['roll2'], self.elements['roll3'],
                                 self.elements["dice"]]:
             self.elements['select_cat'].hide()
-            create_example_cats()  # create new cats
+            game.choose_cats.update(enumerate(example_cat_pool.take()))  # new cats, made in the background
             self.selected_cat = None  # Your selected cat now no longer exists. Sad. They go away.
             if self.elements['error_message']:
                 self.elements['error_message'].hide()
@@ -444,6 +447,7 @@ class MakeClanScreen(Screens):
         self.menu_warning.kill()
         self.clear_all_page()
         self.rolls_left = game.config["clan_creation"]["rerolls"]
+        example_cat_pool.stop()
         return super().exit_screen()
 
     def on_use(self):
@@ -533,31 +537,31 @@ class MakeClanScreen(Screens):
             if len(self.members) == 0:
                 self.elements["background"].set_image(
                     pygame.transform.scale(
-                        pygame.image.load("resources/images/pick_clan_screen/clan_none_light.png").convert_alpha(),
+                        image_cache.load_image("resources/images/pick_clan_screen/clan_none_light.png").convert_alpha(),
                         (1600, 1400)))
                 self.elements['next_step'].disable()
             elif len(self.members) == 1:
                 self.elements["background"].set_image(
                     pygame.transform.scale(
-                        pygame.image.load("resources/images/pick_clan_screen/clan_one_light.png").convert_alpha(),
+                        image_cache.load_image("resources/images/pick_clan_screen/clan_one_light.png").convert_alpha(),
                         (1600, 1400)))
                 self.elements['next_step'].disable()
             elif len(self.members) == 2:
                 self.elements["background"].set_image(
                     pygame.transform.scale(
-                        pygame.image.load("resources/images/pick_clan_screen/clan_two_light.png").convert_alpha(),
+                        image_cache.load_image("resources/images/pick_clan_screen/clan_two_light.png").convert_alpha(),
                         (1600, 1400)))
                 self.elements['next_step'].disable()
             elif len(self.members) == 3:
                 self.elements["background"].set_image(
                     pygame.transform.scale(
-                        pygame.image.load("resources/images/pick_clan_screen/clan_three_light.png").convert_alpha(),
+                        image_cache.load_image("resources/images/pick_clan_screen/clan_three_light.png").convert_alpha(),
                         (1600, 1400)))
                 self.elements['next_step'].disable()
             elif 4 <= len(self.members) <= 6:
                 self.elements["background"].set_image(
                     pygame.transform.scale(
-                        pygame.image.load("resources/images/pick_clan_screen/clan_four_light.png").convert_alpha(),
+                        image_cache.load_image("resources/images/pick_clan_screen/clan_four_light.png").convert_alpha(),
                         (1600, 1400)))
                 self.elements['next_step'].enable()
                 # In order for the "previous step" to work properly, we must enable this button, just in case it
@@ -566,7 +570,7 @@ class MakeClanScreen(Screens):
             elif len(self.members) == 7:
                 self.elements["background"].set_image(
                     pygame.transform.scale(
-                        pygame.image.load("resources/images/pick_clan_screen/clan_full_light.png").convert_alpha(),
+                        image_cache.load_image("resources/images/pick_clan_screen/clan_full_light.png").convert_alpha(),
                         (1600, 1400)))
                 self.elements["select_cat"].disable()
                 self.elements['next_step'].enable()
@@ -697,14 +701,14 @@ class MakeClanScreen(Screens):
         if self.biome_selected:
             self.elements["camp_art"] = pygame_gui.elements.UIImage(scale(pygame.Rect((350, 340), (900, 800))),
                                                                     pygame.transform.scale(
-                                                                        pygame.image.load(
+                                                                        image_cache.load_image(
                                                                             self.get_camp_art_path(
                                                                                 self.selected_camp_tab)).convert_alpha(),
                                                                         (900, 800)), manager=MANAGER)
             self.elements['art_frame'].kill()
             self.elements['art_frame'] = pygame_gui.elements.UIImage(scale(pygame.Rect(((334, 324), (932, 832)))),
                                                                      pygame.transform.scale(
-                                                                         pygame.image.load(
+                                                                         image_cache.load_image(
                                                                              "resources/images/bg_preview_border.png").convert_alpha(),
                                                                          (932, 832)), manager=MANAGER)
 
@@ -1051,7 +1055,7 @@ class MakeClanScreen(Screens):
 
         self.elements['background'] = pygame_gui.elements.UIImage(scale(pygame.Rect((0, 828), (1600, 572))),
                                                                   pygame.transform.scale(
-                                                                      pygame.image.load(
+                                                                      image_cache.load_image(
                                                                           "resources/images/pick_clan_screen/clan_none_light.png").convert_alpha(),
                                                                       (1600, 1400)), manager=MANAGER)
         self.elements['background'].disable()
@@ -1153,12 +1157,12 @@ class MakeClanScreen(Screens):
         # art frame
         self.elements['art_frame'] = pygame_gui.elements.UIImage(scale(pygame.Rect(((334, 324), (932, 832)))),
                                                                  pygame.transform.scale(
-                                                                     pygame.image.load(
+                                                                     image_cache.load_image(
                                                                          "resources/images/bg_preview_border.png").convert_alpha(),
                                                                      (932, 832)), manager=MANAGER)
 
         # camp art self.elements["camp_art"] = pygame_gui.elements.UIImage(scale(pygame.Rect((175,170),(450, 400))),
-        # pygame.image.load(self.get_camp_art_path(1)).convert_alpha(), visible=False)
+        # image_cache.load_image(self.get_camp_art_path(1)).convert_alpha(), visible=False)
 
     def open_clan_saved_screen(self):
         self.clear_all_page()
@@ -1177,7 +1181,9 @@ class MakeClanScreen(Screens):
                                                                       manager=MANAGER)
 
     def save_clan(self):
-        
+        # Making the Clan goes through every cat, so no more can be made in the background.
+        example_cat_pool.stop()
+
         game.mediated.clear()
         game.patrolled.clear()
         game.cat_to_fade.clear()
@@ -1195,6 +1201,7 @@ class MakeClanScreen(Screens):
         game.clan.create_clan()
         #game.clan.starclan_cats.clear()
         game.cur_events_list.clear()
+        event_history.new_clan(f"{get_save_dir()}/{self.clan_name}")
         game.herb_events_list.clear()
         Cat.grief_strings.clear()
         Cat.sort_cats()
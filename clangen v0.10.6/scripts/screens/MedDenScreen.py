@@ -3,10 +3,11 @@ import pygame_gui
 
 from .Screens import Screens
 from scripts.cat.cats import Cat
+from scripts.game_structure import image_cache
 from scripts.game_structure.image_button import UISpriteButton, UIImageButton, UITextBoxTweaked
 from scripts.utility import get_text_box_theme, scale, get_med_cats, shorten_text_to_fit
 from scripts.game_structure.game_essentials import game, MANAGER
-from ..conditions import get_amount_cat_for_one_medic, medical_cats_condition_fulfilled
+from ..conditions import get_amount_cat_for_one_medic, medical_cats_condition_fulfilled, condition_store
 
 
 class MedDenScreen(Screens):
@@ -145,7 +146,7 @@ class MedDenScreen(Screens):
             self.log_title.hide()
             self.cat_bg = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                             ((280, 880), (1120, 400))),
-                                                      pygame.image.load(
+                                                      image_cache.load_image(
                                                           "resources/images/sick_hurt_bg.png").convert_alpha()
                                                       , manager=MANAGER)
             self.cat_bg.disable()
@@ -190,10 +191,7 @@ class MedDenScreen(Screens):
             self.in_den_cats = []
             self.out_den_cats = []
             self.minor_cats = []
-            self.injured_and_sick_cats = []
-            for the_cat in Cat.all_cats_list:
-                if not the_cat.dead and not the_cat.outside and (the_cat.injuries or the_cat.illnesses):
-                    self.injured_and_sick_cats.append(the_cat)
+            self.injured_and_sick_cats = condition_store.get_cats("injuries", "illnesses")
             for cat in self.injured_and_sick_cats:
                 if cat.injuries:
                     for injury in cat.injuries:
@@ -537,7 +535,7 @@ class MedDenScreen(Screens):
                 self.herbs["cobweb1"] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                           ((216, 190), (792, 448))),
                                                                     pygame.transform.scale(
-                                                                        pygame.image.load(
+                                                                        image_cache.load_image(
                                                                             "resources/images/med_cat_den/cobweb1.png").convert_alpha(),
                                                                         (792, 448)
                                                                     ), manager=MANAGER)
@@ -545,7 +543,7 @@ class MedDenScreen(Screens):
                     self.herbs["cobweb2"] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                               ((216, 190), (792, 448))),
                                                                         pygame.transform.scale(
-                                                                            pygame.image.load(
+                                                                            image_cache.load_image(
                                                                                 "resources/images/med_cat_den/cobweb2.png").convert_alpha(),
                                                                             (792, 448)
                                                                         ), manager=MANAGER)
@@ -553,7 +551,7 @@ class MedDenScreen(Screens):
             self.herbs[herb] = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                  ((216, 190), (792, 448))),
                                                            pygame.transform.scale(
-                                                               pygame.image.load(
+                                                               image_cache.load_image(
                                                                    f"resources/images/med_cat_den/{herb}.png").convert_alpha(),
                                                                (792, 448)
                                                            ), manager=MANAGER)
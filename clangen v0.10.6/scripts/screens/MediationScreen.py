@@ -128,7 +128,7 @@ class MediationScreen(Screens):
         self.cat_bg = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                         ((100, 940), (1400, 300))),
                                                   pygame.transform.scale(
-                                                      pygame.image.load(
+                                                      image_cache.load_image(
                                                           "resources/images/mediation_selection_bg.png").convert_alpha(),
                                                       (1400, 300))
                                                   )
@@ -282,7 +282,7 @@ class MediationScreen(Screens):
         for cat in self.all_cats[self.page - 1]:
             if game.clan.clan_settings["show fav"] and cat.favourite:
                 _temp = pygame.transform.scale(
-                            pygame.image.load(
+                            image_cache.load_image(
                                 f"resources/images/fav_marker.png").convert_alpha(),
                             (100, 100))
                     
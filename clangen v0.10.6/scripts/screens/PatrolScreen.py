@@ -4,6 +4,7 @@ import pygame_gui
 
 from .Screens import Screens
 from scripts.utility import get_text_box_theme, scale, shorten_text_to_fit
+from scripts.game_structure import image_cache
 from scripts.game_structure.image_button import UIImageButton, UISpriteButton
 from scripts.patrol.patrol import Patrol
 from scripts.cat.cats import Cat
@@ -12,15 +13,15 @@ from scripts.game_structure.propagating_thread import PropagatingThread
 
 
 class PatrolScreen(Screens):
-    able_box = pygame.transform.scale(pygame.image.load("resources/images/patrol_able_cats.png").convert_alpha(),
+    able_box = pygame.transform.scale(image_cache.load_image("resources/images/patrol_able_cats.png").convert_alpha(),
                                       (540, 402))
-    patrol_box = pygame.transform.scale(pygame.image.load("resources/images/patrol_cats.png").convert_alpha(),
+    patrol_box = pygame.transform.scale(image_cache.load_image("resources/images/patrol_cats.png").convert_alpha(),
                                         (540, 402))
-    cat_frame = pygame.transform.scale(pygame.image.load("resources/images/patrol_cat_frame.png").convert_alpha(),
+    cat_frame = pygame.transform.scale(image_cache.load_image("resources/images/patrol_cat_frame.png").convert_alpha(),
                                        (400, 550))
-    app_frame = pygame.transform.scale(pygame.image.load("resources/images/patrol_app_frame.png").convert_alpha(),
+    app_frame = pygame.transform.scale(image_cache.load_image("resources/images/patrol_app_frame.png").convert_alpha(),
                                        (332, 340))
-    mate_frame = pygame.transform.scale(pygame.image.load("resources/images/patrol_mate_frame.png").convert_alpha(),
+    mate_frame = pygame.transform.scale(image_cache.load_image("resources/images/patrol_mate_frame.png").convert_alpha(),
                                         (332, 340))
 
     current_patrol = []
@@ -227,6 +228,10 @@ class PatrolScreen(Screens):
         self.show_menu_buttons()
         self.open_choose_cats_screen()
 
+        # The general art is used by every patrol that doesn't have its own, so get it ready.
+        image_cache.prefetch_images([f"resources/images/patrol_art/{patrol_type}_general_intro.png"
+                                     for patrol_type in ("hunt", "bord", "train", "med")])
+
     def update_button(self):
         """" Updates button availabilities. """
         if self.patrol_stage == 'choose_cats':
@@ -376,7 +381,7 @@ class PatrolScreen(Screens):
             'Smaller patrols help cats gain more experience, but larger patrols are safer.',
             scale(pygame.Rect((375, 190), (850, 200))), object_id=get_text_box_theme("#text_box_22_horizcenter"))
         self.elements["cat_frame"] = pygame_gui.elements.UIImage(scale(pygame.Rect((600, 330), (400, 550))),
-                                                                 pygame.image.load(
+                                                                 image_cache.load_image(
                                                                      "resources/images/patrol_cat_frame.png").convert_alpha()
                                                                  , manager=MANAGER)
 
@@ -496,20 +501,20 @@ class PatrolScreen(Screens):
         # Layout images
         self.elements['event_bg'] = pygame_gui.elements.UIImage(scale(pygame.Rect((762, 330), (708, 540))),
                                                                 pygame.transform.scale(
-                                                                    pygame.image.load(
+                                                                    image_cache.load_image(
                                                                         "resources/images/patrol_event_frame.png").convert_alpha(),
                                                                     (708, 540)
                                                                 ), manager=MANAGER)
         self.elements['event_bg'].disable()
         self.elements['info_bg'] = pygame_gui.elements.UIImage(scale(pygame.Rect((180, 912), (840, 408))),
                                                                pygame.transform.scale(
-                                                                   pygame.image.load(
+                                                                   image_cache.load_image(
                                                                        "resources/images/patrol_info.png").convert_alpha(),
                                                                    (840, 408)
                                                                ), manager=MANAGER)
         self.elements['image_frame'] = pygame_gui.elements.UIImage(scale(pygame.Rect((130, 280), (640, 640))),
                                                                    pygame.transform.scale(
-                                                                       pygame.image.load(
+                                                                       image_cache.load_image(
                                                                            "resources/images/patrol_sprite_frame.png").convert_alpha(),
                                                                        (640, 640)
                                                                    ), manager=MANAGER) 
@@ -520,6 +525,7 @@ class PatrolScreen(Screens):
                         pygame.transform.scale(
                             self.patrol_obj.get_patrol_art(), (600, 600))
                     )
+        self.patrol_obj.prefetch_outcome_art()
         
 
         # Prepare Intro Text
@@ -633,7 +639,7 @@ class PatrolScreen(Screens):
         self.able_cats = []
 
         # ASSIGN TO ABLE CATS
-        for the_cat in Cat.all_cats_list:
+        for the_cat in Cat.get_roster():
             if not the_cat.dead and the_cat.in_camp and the_cat.ID not in game.patrolled and the_cat.status not in [
                 'elder', 'kitten', 'mediator', 'mediator apprentice'
             ] and not the_cat.outside and the_cat not in self.current_patrol and not the_cat.not_working():
@@ -684,7 +690,7 @@ class PatrolScreen(Screens):
                 self.fav[str(i)] = pygame_gui.elements.UIImage(
                     scale(pygame.Rect((pos_x, pos_y), (100, 100))),
                     pygame.transform.scale(
-                        pygame.image.load(
+                        image_cache.load_image(
                             f"resources/images/fav_marker.png").convert_alpha(),
                         (100, 100))
                 )
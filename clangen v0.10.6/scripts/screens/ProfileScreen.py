@@ -23,6 +23,7 @@ import pygame_gui
 from re import sub
 from scripts.game_structure.image_button import UIImageButton, UITextBoxTweaked
 from scripts.game_structure.game_essentials import game, MANAGER
+from scripts.game_structure.event_history import event_history
 from scripts.clan_resources.freshkill import FRESHKILL_ACTIVE
 
 
@@ -1091,10 +1092,34 @@ class ProfileScreen(Screens):
             if murder:
                 life_history.append(murder)
 
+            clan_events = self.get_clan_events_text()
+            if clan_events:
+                life_history.append(clan_events)
+
             # join together history list with line breaks
             output = '\n\n'.join(life_history)
         return output
 
+    def get_clan_events_text(self, max_events=10):
+        """
+        returns the most recent events the cat was involved in, from the event history and the current moon
+        """
+        cat_events = event_history.get_cat_events(self.the_cat.ID)
+        cat_events.extend((game.clan.age, event) for event in game.cur_events_list
+                          if self.the_cat.ID in event.cats_involved)
+        cat_events = [(moon, event) for moon, event in cat_events
+                      if "interaction" not in event.types and isinstance(event.text, str)]
+        if not cat_events:
+            return None
+
+        lines = []
+        for moon, event in cat_events[-max_events:]:
+            if game.switches['show_history_moons']:
+                lines.append(f"Moon {moon}: {event.text}")
+            else:
+                lines.append(event.text)
+        return "Recent events:\n" + "\n".join(lines)
+
     def get_backstory_text(self):
         """
         returns the backstory blurb
@@ -2055,7 +2080,7 @@ class ProfileScreen(Screens):
 
         biome = biome.lower()
 
-        platformsheet = pygame.image.load('resources/images/platforms.png').convert_alpha()
+        platformsheet = image_cache.load_image('resources/images/platforms.png').convert_alpha()
 
         order = ['beach', 'forest', 'mountainous', 'nest', 'plains', 'SC/DF']
 
@@ -1,14 +1,17 @@
 import pygame.transform
 import pygame_gui.elements
 from random import choice
+from math import ceil
 
 
 from .Screens import Screens
 
-from scripts.utility import get_text_box_theme, scale, scale_dimentions, shorten_text_to_fit
+from scripts.utility import get_text_box_theme, scale, scale_dimentions
 from scripts.cat.cats import Cat
+from scripts.cat.names import name_index
 from scripts.game_structure import image_cache
-from scripts.game_structure.image_button import UIImageButton, UISpriteButton, UIRelationStatusBar
+from scripts.game_structure.image_button import UIImageButton, UIRelationStatusBar
+from scripts.game_structure.cat_grid import UICatGrid
 from scripts.game_structure.game_essentials import game, screen, screen_x, screen_y, MANAGER
 from scripts.game_structure.windows import RelationshipLog
 from scripts.game_structure.propagating_thread import PropagatingThread
@@ -18,7 +21,8 @@ class RelationshipScreen(Screens):
     checkboxes = {}  # To hold the checkboxes.
     focus_cat_elements = {}
     relation_list_elements = {}
-    sprite_buttons = {}
+    cat_grid = None
+    displayed_relations = []
     inspect_cat_elements = {}
     previous_search_text = ""
 
@@ -64,8 +68,8 @@ class RelationshipScreen(Screens):
 
     def handle_event(self, event):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
-            if event.ui_element in self.sprite_buttons.values():
-                self.inspect_cat = event.ui_element.return_cat_object()
+            if self.cat_grid and event.ui_element in self.cat_grid:
+                self.inspect_cat = self.cat_grid.get_cat(event.ui_element)
                 self.update_inspected_relation()
             elif event.ui_element == self.back_button:
                 self.change_screen("profile screen")
@@ -152,6 +156,16 @@ class RelationshipScreen(Screens):
                                                  object_id="#log_icon")
         self.log_icon.disable()
 
+        # The sprites and names of the listed cats are made once, and reused for every page and search.
+        self.cat_grid = UICatGrid((580, 300), (244, 484), 4, 2,
+                                  sprite_rect=((44, 0), (100, 100)),
+                                  name_rect=((-10, -50), (220, 60)),
+                                  name_length=210,
+                                  name_font_size=26,
+                                  text_theme="#text_box_26_horizcenter",
+                                  name_element=pygame_gui.elements.UITextBox)
+        self.displayed_relations = []
+
         # Updates all info for the currently focused cat.
         self.update_focus_cat()
 
@@ -168,9 +182,9 @@ class RelationshipScreen(Screens):
             self.relation_list_elements[ele].kill()
         self.relation_list_elements = {}
 
-        for ele in self.sprite_buttons:
-            self.sprite_buttons[ele].kill()
-        self.sprite_buttons = {}
+        self.cat_grid.kill()
+        self.cat_grid = None
+        self.displayed_relations = []
 
         for ele in self.inspect_cat_elements:
             self.inspect_cat_elements[ele].kill()
@@ -467,34 +481,33 @@ class RelationshipScreen(Screens):
                                  rel.jealousy + rel.trust) > 0, self.filtered_cats))
 
         # Filter for search
-        search_cats = []
         if search_text.strip() != "":
-            for cat in self.filtered_cats:
-                if search_text.lower() in str(cat.cat_to.name).lower():
-                    search_cats.append(cat)
-            self.filtered_cats = search_cats
+            self.filtered_cats = name_index.search(self.filtered_cats, search_text, get_cat=lambda rel: rel.cat_to)
 
     def update_cat_page(self):
-        for ele in self.relation_list_elements:
-            self.relation_list_elements[ele].kill()
-        self.relation_list_elements = {}
-
-        for ele in self.sprite_buttons:
-            self.sprite_buttons[ele].kill()
-        self.sprite_buttons = {}
+        page_size = self.cat_grid.page_size
+        page_count = ceil(len(self.filtered_cats) / page_size)
 
-        all_pages = self.chunks(self.filtered_cats, 8)
-
-        if self.current_page > len(all_pages):
-            self.current_page = len(all_pages)
+        if self.current_page > page_count:
+            self.current_page = page_count
 
         if self.current_page == 0:
             self.current_page = 1
 
-        if all_pages:
-            display_rel = all_pages[self.current_page - 1]
-        else:
-            display_rel = []
+        display_rel = self.filtered_cats[(self.current_page - 1) * page_size:self.current_page * page_size]
+
+        self.update_page_buttons(page_count)
+
+        # Searching or toggling a filter often leaves the visible page as it was. Then there is nothing to redo.
+        if display_rel == self.displayed_relations:
+            return
+        self.displayed_relations = display_rel
+
+        for ele in self.relation_list_elements:
+            self.relation_list_elements[ele].kill()
+        self.relation_list_elements = {}
+
+        self.cat_grid.set_cats([rel.cat_to for rel in display_rel])
 
         pos_x = 580
         pos_y = 300
@@ -508,16 +521,17 @@ class RelationshipScreen(Screens):
                 pos_y += 484
                 pos_x = 580
 
-        self.page_number.set_text(f"{self.current_page} / {len(all_pages)}")
+    def update_page_buttons(self, page_count):
+        self.page_number.set_text(f"{self.current_page} / {page_count}")
 
         # Enable and disable page buttons.
-        if len(all_pages) <= 1:
+        if page_count <= 1:
             self.previous_page_button.disable()
             self.next_page_button.disable()
-        elif self.current_page >= len(all_pages):
+        elif self.current_page >= page_count:
             self.previous_page_button.enable()
             self.next_page_button.disable()
-        elif self.current_page == 1 and len(all_pages) > 1:
+        elif self.current_page == 1 and page_count > 1:
             self.previous_page_button.disable()
             self.next_page_button.enable()
         else:
@@ -527,22 +541,10 @@ class RelationshipScreen(Screens):
     def generate_relation_block(self, pos, the_relationship, i):
         # Generates a relation_block starting at postion, from the relationship object "the_relation"
         # "position" should refer to the top left corner of the *main* relation box, not including the name.
+        # The sprite and name of the cat are shown by the cat grid.
         pos_x = pos[0]
         pos_y = pos[1]
 
-        self.sprite_buttons["image" + str(i)] = UISpriteButton(scale(pygame.Rect((pos_x + 44, pos_y), (100, 100))),
-                                                               the_relationship.cat_to.sprite,
-                                                               cat_object=the_relationship.cat_to)
-
-        # CHECK NAME LENGTH - SHORTEN IF NECESSARY
-        name = str(the_relationship.cat_to.name)  # get name
-        short_name = shorten_text_to_fit(name, 210, 26)
-        self.relation_list_elements["name" + str(i)] = pygame_gui.elements.UITextBox(short_name,
-                                                                                     scale(pygame.Rect(
-                                                                                         (pos_x - 10, pos_y - 50),
-                                                                                         (220, 60))),
-                                                                                     object_id="#text_box_26_horizcenter")
-
         # Gender alignment
         if the_relationship.cat_to.genderalign == 'female':
             gender_icon = image_cache.load_image("resources/images/female_big.png").convert_alpha()
@@ -780,6 +782,3 @@ class RelationshipScreen(Screens):
             self.update_cat_page()
         self.previous_search_text = self.search_bar.get_text()
 
-    def chunks(self, L, n):
-        return [L[x: x + n] for x in range(0, len(L), n)]
-
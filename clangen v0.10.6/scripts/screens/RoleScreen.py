@@ -103,7 +103,7 @@ class RoleScreen(Screens):
         self.blurb_background = pygame_gui.elements.UIImage(scale(pygame.Rect
                                                                   ((100, 390), (1400, 300))),
                                                             pygame.transform.scale(
-                                                                pygame.image.load(
+                                                                image_cache.load_image(
                                                                     "resources/images/mediation_selection_bg.png").convert_alpha(),
                                                                 (1400, 300))
                                                             )
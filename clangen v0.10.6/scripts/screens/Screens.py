@@ -8,6 +8,7 @@ from scripts.game_structure.image_button import UIImageButton
 import pygame_gui
 from scripts.game_structure.windows import SaveCheck, EventLoading
 from scripts.game_structure.propagating_thread import PropagatingThread
+from scripts.game_structure.state_lock import state_lock
 from threading import current_thread
 
 
@@ -134,7 +135,9 @@ class Screens():
 
         exp = None
         try:
-            target(*args)
+            # The UI keeps going while this runs, see state_lock
+            with state_lock.writing():
+                target(*args)
         except Exception as e:
             exp = e
 
@@ -274,6 +274,7 @@ class SettingsScreen(Screens):
         del self.open_data_directory_button
 
         game.settings = self.settings_at_open
+        game.refresh_snapshot()
 
     def save_settings(self):
         """Saves the settings, ensuring that they will be retained when the screen changes."""
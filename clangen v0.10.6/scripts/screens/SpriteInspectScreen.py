@@ -9,6 +9,7 @@ from .Screens import Screens
 from scripts.utility import get_text_box_theme, scale_dimentions, generate_sprite, shorten_text_to_fit
 from scripts.cat.cats import Cat
 import pygame_gui
+from scripts.game_structure import image_cache
 from scripts.game_structure.image_button import UIImageButton, UITextBoxTweaked
 from scripts.game_structure.game_essentials import game, MANAGER
 
@@ -451,7 +452,7 @@ class SpriteInspectScreen(Screens):
 
         biome = biome.lower()
 
-        platformsheet = pygame.image.load('resources/images/platforms.png').convert_alpha()
+        platformsheet = image_cache.load_image('resources/images/platforms.png').convert_alpha()
         
         order = ['beach', 'forest', 'mountainous', 'nest', 'plains', 'SC/DF']
         
@@ -10,6 +10,7 @@ import ujson
 
 from scripts.cat.cats import Cat
 from scripts.clan import Clan
+from scripts.game_structure import image_cache
 from scripts.game_structure.discord_rpc import _DiscordRPC
 from scripts.game_structure.game_essentials import game, screen, screen_x, screen_y, MANAGER
 from scripts.game_structure.image_button import UIImageButton
@@ -100,7 +101,7 @@ class SwitchClanScreen(Screens):
         TODO: DOCS
         """
         self.screen = pygame.transform.scale(
-            pygame.image.load(
+            image_cache.load_image(
                 "resources/images/clan_saves_frame.png").convert_alpha(),
             (440 / 1600 * screen_x, 750 / 1400 * screen_y))
         self.main_menu = UIImageButton(scale(pygame.Rect((50, 50), (306, 60))),
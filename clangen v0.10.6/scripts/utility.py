@@ -17,6 +17,7 @@ from typing import Dict
 
 logger = logging.getLogger(__name__)
 from scripts.game_structure import image_cache
+from scripts.cat.ages import AGE_GROUPS, Age
 from scripts.cat.history import History
 from scripts.cat.names import names
 from scripts.cat.pelts import Pelt
@@ -32,37 +33,34 @@ def get_alive_clan_queens(living_cats):
     living_kits = [cat for cat in living_cats if not (cat.dead or cat.outside) and cat.status in ["kitten", "newborn"]]
 
     queen_dict = {}
-    for cat in living_kits.copy():
-        parents = cat.get_parents()
+    kits_without_queen = []
+    for cat in living_kits:
         #Fetch parent object, only alive and not outside. 
-        parents = [cat.fetch_cat(i) for i in parents if cat.fetch_cat(i) and not(cat.fetch_cat(i).dead or cat.fetch_cat(i).outside)]
+        parents = [cat.fetch_cat(i) for i in cat.get_parents()]
+        parents = [i for i in parents if i and not (i.dead or i.outside)]
         if not parents:
+            kits_without_queen.append(cat)
             continue
         
         if len(parents) == 1 or len(parents) > 2 or\
             all(i.gender == "male" for i in parents) or\
             parents[0].gender == "female":
-            if parents[0].ID in queen_dict:
-                queen_dict[parents[0].ID].append(cat)
-                living_kits.remove(cat)
-            else:
-                queen_dict[parents[0].ID] = [cat]
-                living_kits.remove(cat)
-        elif len(parents) == 2:
-            if parents[1].ID in queen_dict:
-                queen_dict[parents[1].ID].append(cat)
-                living_kits.remove(cat)
-            else:
-                queen_dict[parents[1].ID] = [cat]
-                living_kits.remove(cat)
-    return queen_dict, living_kits
+            queen = parents[0]
+        else:
+            queen = parents[1]
+
+        if queen.ID in queen_dict:
+            queen_dict[queen.ID].append(cat)
+        else:
+            queen_dict[queen.ID] = [cat]
+    return queen_dict, kits_without_queen
 
 def get_alive_kits(Cat):
     """
     returns a list of IDs for all living kittens in the clan
     """
     alive_kits = [i for i in Cat.all_cats.values() if
-                  i.age in ['kitten', 'newborn'] and not i.dead and not i.outside]
+                  i.is_baby() and not i.dead and not i.outside]
 
     return alive_kits
 
@@ -1127,16 +1125,43 @@ def shorten_text_to_fit(name, length_limit, font_size=None, font_type="resources
     if font_size is None:
         font_size = 30
     font_size = font_size//2 if not game.settings['fullscreen'] else font_size
-    # Create the font object
-    font = pygame.font.Font(font_type, font_size)
-    
+
+    # The same names are shortened every time a page of cats is shown, so the results are kept.
+    key = (name, length_limit, font_size, font_type)
+    if key not in _shortened_text:
+        if len(_shortened_text) >= _max_shortened_text:
+            _shortened_text.clear()
+        _shortened_text[key] = _shorten_text(name, length_limit, font_size, font_type)
+    return _shortened_text[key]
+
+
+_fonts = {}  # (font type, font size): (font, {character: width})
+_shortened_text = {}  # (text, length limit, font size, font type): shortened text
+_max_shortened_text = 5000
+
+
+def get_font(font_type, font_size):
+    """Returns the font for this file and size, and a dict to keep the width of its characters in. Opening a
+        font file is slow, so each font is only opened once."""
+    if (font_type, font_size) not in _fonts:
+        _fonts[(font_type, font_size)] = (pygame.font.Font(font_type, font_size), {})
+    return _fonts[(font_type, font_size)]
+
+
+def _shorten_text(name, length_limit, font_size, font_type):
+    font, char_widths = get_font(font_type, font_size)
+    if "..." not in char_widths:
+        char_widths["..."] = font.size("...")[0]
+    ellipsis_width = char_widths["..."]
+
     # Add dynamic name lengths by checking the actual width of the text
     total_width = 0
     short_name = ''
     for index, character in enumerate(name):
-        char_width = font.size(character)[0]
-        ellipsis_width = font.size("...")[0]
-        
+        if character not in char_widths:
+            char_widths[character] = font.size(character)[0]
+        char_width = char_widths[character]
+
         # Check if the current character is the last one and its width is less than or equal to ellipsis_width
         if index == len(name) - 1 and char_width <= ellipsis_width:
             short_name += character
@@ -1180,8 +1205,9 @@ def update_sprite(cat):
         # Don't update the sprite if the cat is faded.
         return
 
-    # apply
-    cat.sprite = generate_sprite(cat)
+    # Most changes to a cat are noticed by cat.sprite already (see Cat.get_sprite_key), this is for
+    # anything else. The sprite is made again the next time it's needed.
+    cat.sprite = None
     # update class dictionary
     cat.all_cats[cat.ID] = cat
 
@@ -1207,14 +1233,18 @@ def generate_sprite(cat, life_state=None, scars_hidden=False, acc_hidden=False,
     else:
         dead = cat.dead
     
+    age_group = AGE_GROUPS.get(age)
+    settings = game.snapshot
+
     # setting the cat_sprite (bc this makes things much easier)
-    if not no_not_working and cat.not_working() and age != 'newborn' and game.config['cat_sprites']['sick_sprites']:
-        if age in ['kitten', 'adolescent']:
+    if not no_not_working and cat.not_working() and age_group is not Age.NEWBORN \
+            and settings.sick_sprites:
+        if age_group in (Age.KITTEN, Age.ADOLESCENT):
             cat_sprite = str(19)
         else:
             cat_sprite = str(18)
-    elif cat.pelt.paralyzed and age != 'newborn':
-        if age in ['kitten', 'adolescent']:
+    elif cat.pelt.paralyzed and age_group is not Age.NEWBORN:
+        if age_group in (Age.KITTEN, Age.ADOLESCENT):
             cat_sprite = str(17)
         else:
             if cat.pelt.length == 'long':
@@ -1222,10 +1252,10 @@ def generate_sprite(cat, life_state=None, scars_hidden=False, acc_hidden=False,
             else:
                 cat_sprite = str(15)
     else:
-        if age == 'elder' and not game.config['fun']['all_cats_are_newborn']:
+        if age == 'elder' and not settings.all_cats_are_newborn:
             age = 'senior'
         
-        if game.config['fun']['all_cats_are_newborn']:
+        if settings.all_cats_are_newborn:
             cat_sprite = str(cat.pelt.cat_sprites['newborn'])
         else:
             cat_sprite = str(cat.pelt.cat_sprites[age])
@@ -1306,7 +1336,7 @@ def generate_sprite(cat, life_state=None, scars_hidden=False, acc_hidden=False,
                     new_sprite.blit(sprites.sprites['scars' + scar + cat_sprite], (0, 0))
 
         # draw line art
-        if game.settings['shaders'] and not dead:
+        if settings.shaders and not dead:
             new_sprite.blit(sprites.sprites['shaders' + cat_sprite], (0, 0), special_flags=pygame.BLEND_RGB_MULT)
             new_sprite.blit(sprites.sprites['lighting' + cat_sprite], (0, 0))
 
@@ -1335,7 +1365,7 @@ def generate_sprite(cat, life_state=None, scars_hidden=False, acc_hidden=False,
                 new_sprite.blit(sprites.sprites['collars' + cat.pelt.accessory + cat_sprite], (0, 0))
 
         # Apply fading fog
-        if cat.pelt.opacity <= 97 and not cat.prevent_fading and game.clan.clan_settings["fading"] and dead:
+        if cat.pelt.opacity <= 97 and not cat.prevent_fading and settings.fading and dead:
 
             stage = "0"
             if 80 >= cat.pelt.opacity > 45:
@@ -0,0 +1,236 @@
+"""
+Times the parts of the game that get slow with big Clans: loading the cats, saving them, a timeskip, starting a
+patrol and drawing the cats' sprites. Each one is timed on made-up Clans of a few sizes (see synthetic_clan),
+without a window, so it runs anywhere the unit tests run. The Clans are made in a temporary folder, so the
+saves in the save folder are never touched.
+
+Run it from the game folder:
+
+    python -m tests.benchmarks --sizes 100 1000 --output results.json
+
+The results are printed, and saved as json with --output. To see if anything got slower, save the results from
+before a change and compare against them after:
+
+    python -m tests.benchmarks --sizes 100 1000 --output baseline.json
+    python -m tests.benchmarks --sizes 100 1000 --compare baseline.json --threshold 0.2
+
+Anything that got more than 20% slower is reported, and the exit code is 1. Times are only comparable on the
+same machine, so CI only runs each benchmark once and uploads the results. Comparing them is done by hand, against
+results from the same kind of machine.
+"""
+import argparse
+import contextlib
+import io
+import os
+import platform
+import random
+import statistics
+import sys
+from time import perf_counter
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.cat.cats import Cat
+from scripts.cat.sprites import sprites
+from scripts.clan import clan_class
+from scripts.events import events_class
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure.load_cat import load_cats
+from scripts.game_structure.synthetic_clan import SyntheticClan, clear_cats, preserved_game_state
+from scripts.patrol.patrol import Patrol
+from scripts.utility import generate_sprite
+
+CLAN_NAME = "Benchmark"
+PATROL_STATUSES = ("warrior", "apprentice", "deputy", "leader")
+
+
+def load_clan():
+    """Loads the benchmark Clan from its save, replacing the loaded cats, like starting the game does."""
+    clear_cats()
+    game.switches['clan_list'] = [CLAN_NAME]
+    load_cats()
+    clan_class.load_clan()
+    game.load_events()
+
+
+# Each benchmark is (setup, timed), run once per round. Only timed is timed. Both are given the size of the Clan.
+
+def setup_load_cats(size):
+    clear_cats()
+    game.switches['clan_list'] = [CLAN_NAME]
+
+
+def time_load_cats(size):
+    load_cats()
+
+
+def setup_save_cats(size):
+    if game.clan is None:
+        load_clan()
+
+
+def time_save_cats(size):
+    with game.save_session():
+        game.save_cats()
+
+
+def setup_one_moon(size):
+    # Every round starts from the same moon
+    load_clan()
+    random.seed(size)
+
+
+def time_one_moon(size):
+    events_class.one_moon()
+
+
+def setup_patrol(size):
+    if game.clan is None:
+        load_clan()
+    random.seed(size)
+
+
+def time_patrol(size):
+    able_cats = [cat for cat in Cat.all_cats.values() if cat.status in PATROL_STATUSES and not cat.dead
+                 and not cat.outside and not cat.not_working()]
+    Patrol().setup_patrol(random.sample(able_cats, min(3, len(able_cats))), "hunting")
+
+
+def setup_generate_sprite(size):
+    if game.clan is None:
+        load_clan()
+
+
+def time_generate_sprite(size):
+    for cat in Cat.all_cats.values():
+        generate_sprite(cat)
+
+
+BENCHMARKS = {
+    "load_cats": (setup_load_cats, time_load_cats),
+    "save_cats": (setup_save_cats, time_save_cats),
+    "one_moon": (setup_one_moon, time_one_moon),
+    "setup_patrol": (setup_patrol, time_patrol),
+    "generate_sprite": (setup_generate_sprite, time_generate_sprite),
+}
+
+
+def time_rounds(setup, timed, size, rounds):
+    """Returns how long timed took in each round, in seconds."""
+    times = []
+    for _ in range(rounds):
+        setup(size)
+        start = perf_counter()
+        timed(size)
+        times.append(perf_counter() - start)
+    return times
+
+
+def run_benchmarks(sizes, names=None, rounds=3, seed=1, quiet=True):
+    """
+    runs the benchmarks on a made-up Clan of each size
+    :param sizes: how many cats the Clans have
+    :param names: which benchmarks to run, all of them if it's None
+    :param rounds: how many times each benchmark is run
+    :param seed: the seed the Clans are made with, so they're the same every time
+    :param quiet: hides what the game prints while it runs
+    :return: the results, as they're saved with --output
+    """
+    names = names or list(BENCHMARKS)
+    results = {}
+    # The Clans are made in a temporary save folder, and the cats that were loaded are put back afterwards.
+    with preserved_game_state():
+        if "generate_sprite" in names and not sprites.sprites:
+            sprites.load_all()
+        for size in sizes:
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+                SyntheticClan(size, name=CLAN_NAME, seed=seed, overwrite=True).make()
+                for name in names:
+                    setup, timed = BENCHMARKS[name]
+                    times = time_rounds(setup, timed, size, rounds)
+                    results[f"{name}[{size}]"] = {
+                        "benchmark": name,
+                        "cats": size,
+                        "rounds": rounds,
+                        "min": min(times),
+                        "median": statistics.median(times),
+                        "mean": statistics.mean(times),
+                        "max": max(times),
+                    }
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    compares the results against a baseline
+    :param threshold: how much slower a benchmark can get before it counts, 0.2 is 20% slower
+    :return: (name, baseline median, median) of every benchmark that got slower than that
+    """
+    regressions = []
+    for name, result in results["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        if result["median"] > before["median"] * (1 + threshold):
+            regressions.append((name, before["median"], result["median"]))
+    return regressions
+
+
+def format_results(results, baseline=None):
+    lines = [f"{'benchmark':<24}{'median':>12}{'min':>12}{'max':>12}" + (f"{'before':>12}{'change':>10}"
+                                                                        if baseline else "")]
+    for name, result in results["results"].items():
+        line = f"{name:<24}{result['median'] * 1000:>10.1f}ms{result['min'] * 1000:>10.1f}ms" \
+               f"{result['max'] * 1000:>10.1f}ms"
+        before = baseline["results"].get(name) if baseline else None
+        if before:
+            change = result["median"] / before["median"] - 1
+            line += f"{before['median'] * 1000:>10.1f}ms{change:>+10.0%}"
+        lines.append(line)
+    return lines
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Times loading, saving, timeskips, patrols and sprites on "
+                                                 "made-up Clans.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000], help="how many cats the Clans have")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="only run these benchmarks")
+    parser.add_argument("--rounds", type=int, default=3, help="how many times each benchmark is run")
+    parser.add_argument("--seed", type=int, default=1, help="the seed the Clans are made with")
+    parser.add_argument("--output", help="save the results to this json file")
+    parser.add_argument("--compare", help="compare the results against ones saved with --output")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="how much slower counts as slower when comparing, 0.2 is 20%%")
+    args = parser.parse_args(args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as read_file:
+            baseline = ujson.loads(read_file.read())
+
+    results = run_benchmarks(args.sizes, args.only, args.rounds, args.seed)
+    print("\n".join(format_results(results, baseline)))
+
+    if args.output:
+        with open(args.output, 'w') as write_file:
+            write_file.write(ujson.dumps(results, indent=4))
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print(f"SLOWER: {name} took {after * 1000:.1f} ms, was {before * 1000:.1f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+import unittest
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from tests.benchmarks import BENCHMARKS, compare, run_benchmarks
+
+
+def make_results(**medians):
+    return {"results": {name: {"median": median} for name, median in medians.items()}}
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_slower_past_threshold(self):
+        baseline = make_results(load=1.0, save=1.0, moon=1.0)
+        results = make_results(load=1.5, save=1.1, moon=0.5, patrol=9.0)
+        # Only load got more than 20% slower, and patrol has nothing to compare against.
+        self.assertEqual(compare(results, baseline, 0.2), [("load", 1.0, 1.5)])
+        self.assertEqual(compare(results, baseline, 0.05), [("load", 1.0, 1.5), ("save", 1.0, 1.1)])
+
+
+class TestRunBenchmarks(unittest.TestCase):
+
+    def test_run(self):
+        results = run_benchmarks([30], rounds=1)
+        self.assertEqual(set(results["results"]), {f"{name}[30]" for name in BENCHMARKS})
+        for result in results["results"].values():
+            self.assertEqual(result["cats"], 30)
+            self.assertGreater(result["median"], 0)
+        self.assertEqual(compare(results, results), [])
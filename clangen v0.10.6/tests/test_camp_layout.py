@@ -0,0 +1,59 @@
+import unittest
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.clan import Clan
+from scripts.game_structure.camp_layout import CampLayout
+
+
+class TestCampLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.layout = Clan.layouts["default"]
+        self.camp_layout = CampLayout()
+
+    def make_cats(self, amount, status):
+        cats = [Cat(status=status) for _ in range(amount)]
+        for cat in cats:
+            Cat.all_cats.pop(cat.ID, None)
+        return cats
+
+    def test_same_seed_same_places(self):
+        cats = self.make_cats(20, "warrior")
+        placements = dict(self.camp_layout.place_cats(cats, "default", self.layout, seed="test1"))
+
+        other_layout = CampLayout()
+        self.assertEqual(other_layout.place_cats(cats, "default", self.layout, seed="test1"), placements)
+        self.assertNotEqual(other_layout.place_cats(cats, "default", self.layout, seed="test2"), placements)
+
+    def test_kept_until_cats_change(self):
+        cats = self.make_cats(10, "warrior")
+        placements = self.camp_layout.place_cats(cats, "default", self.layout, seed="test")
+        self.assertIs(self.camp_layout.place_cats(cats, "default", self.layout, seed="test"), placements)
+
+        cats[0].status = "elder"
+        self.assertIsNot(self.camp_layout.place_cats(cats, "default", self.layout, seed="test"), placements)
+
+    def test_newborns_hide(self):
+        cats = self.make_cats(3, "newborn")
+        self.assertEqual(self.camp_layout.place_cats(cats, "default", self.layout, seed="test"), {})
+        self.assertEqual(len(self.camp_layout.place_cats(cats, "default", self.layout, seed="test",
+                                                         newborns_roam=True)), 3)
+
+    def test_big_clans_are_spread_out(self):
+        den_places = sum(len(self.layout[den]) for den in CampLayout.dens) * 2
+        cats = self.make_cats(den_places + 100, "warrior")
+        placements = self.camp_layout.place_cats(cats, "default", self.layout, seed="test")
+
+        self.assertEqual(len(placements), len(cats))
+        self.assertEqual(cats[-1].placement, placements[cats[-1].ID])
+        # Only the cats sharing a den place may be close to each other, the rest each get their own grid cell.
+        cells = {self.camp_layout._get_cell(pos) for pos in placements.values()}
+        self.assertGreater(len(cells), len(cats) - den_places)
+
+
+if __name__ == "__main__":
+    unittest.main()
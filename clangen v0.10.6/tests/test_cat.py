@@ -1,4 +1,5 @@
 from copy import deepcopy
+from dataclasses import replace
 import unittest
 from unittest.mock import patch
 
@@ -8,7 +9,9 @@ import os
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+from scripts.cat.ages import Age, build_age_table
 from scripts.cat.cats import Cat
+from scripts.game_structure.game_essentials import game
 from scripts.cat_relations.relationship import Relationship
 
 
@@ -38,6 +41,34 @@ class TestCreationAge(unittest.TestCase):
         test_cat = Cat(moons=120)
         self.assertEqual(test_cat.age,"senior")
 
+class TestAgeGroup(unittest.TestCase):
+
+    def test_moons_change_age(self):
+        test_cat = Cat(moons=5)
+        test_cat.moons = 6
+        self.assertEqual(test_cat.age, "adolescent")
+        self.assertEqual(test_cat.age_group, Age.ADOLESCENT)
+        test_cat.moons = 400
+        self.assertEqual(test_cat.age, "senior")
+
+    def test_age_table(self):
+        table = build_age_table(game.config["cat_ages"])
+        for moons in range(0, 301):
+            self.assertEqual(table[moons], Cat(moons=moons).age)
+
+    def test_compare(self):
+        self.assertTrue(Cat(moons=0).is_baby())
+        self.assertFalse(Cat(moons=6).is_baby())
+        self.assertLess(Cat(moons=20).age_group, Cat(moons=100).age_group)
+
+    def test_no_age(self):
+        test_cat = Cat(moons=20)
+        test_cat.age = None
+        self.assertIsNone(test_cat.age_group)
+        # Used to raise a TypeError from comparing None with an age group
+        self.assertTrue(test_cat.is_potential_mate(Cat(moons=20), age_restriction=False))
+
+
 class TestRelativesFunction(unittest.TestCase):
 
     def test_is_parent(self):
@@ -373,6 +404,51 @@ class TestMateFunctions(unittest.TestCase):
         self.assertGreaterEqual(old_relation2.admiration, relation2.admiration)
         self.assertGreaterEqual(old_relation2.jealousy, relation2.jealousy)  
 
+class TestInitRelationships(unittest.TestCase):
+
+    def setUp(self):
+        grandparent1 = Cat(moons=80)
+        grandparent2 = Cat(moons=80)
+        self.parent1 = Cat(moons=40, parent1=grandparent1.ID, parent2=grandparent2.ID)
+        self.parent2 = Cat(moons=40, parent1=grandparent1.ID, parent2=grandparent2.ID)
+        self.kit = Cat(moons=2, parent1=self.parent1.ID, parent2=self.parent2.ID)
+        self.sibling = Cat(moons=2, parent1=self.parent1.ID, parent2=self.parent2.ID)
+        self.stranger = Cat(moons=40)
+        self.cats = [self.parent1, self.parent2, self.kit, self.sibling, self.stranger]
+
+    @patch.dict(game.settings, {"random relation": False})
+    def test_family(self):
+        with patch.object(Cat, "all_cats", {cat.ID: cat for cat in self.cats}):
+            self.kit.init_all_relationships()
+            self.parent1.init_all_relationships()
+
+        self.assertEqual(len(self.kit.relationships), 4)
+        self.assertEqual(self.kit.relationships[self.parent1.ID].platonic_like, 60)
+        self.assertEqual(self.kit.relationships[self.sibling.ID].platonic_like, 30)
+        self.assertTrue(self.kit.relationships[self.sibling.ID].family)
+        self.assertFalse(self.kit.relationships[self.stranger.ID].family)
+        self.assertEqual(self.kit.relationships[self.stranger.ID].platonic_like, 0)
+        self.assertTrue(self.parent1.relationships[self.kit.ID].family)
+        self.assertEqual(self.parent1.relationships[self.kit.ID].platonic_like, 0)
+
+    @patch.dict(game.settings, {"random relation": True})
+    def test_random_values_in_range(self):
+        with patch.object(Cat, "all_cats", {cat.ID: cat for cat in self.cats}):
+            for _ in range(50):
+                self.stranger.init_all_relationships()
+                for relationship in self.stranger.relationships.values():
+                    for value in (relationship.romantic_love, relationship.platonic_like, relationship.dislike,
+                                  relationship.admiration, relationship.comfortable, relationship.jealousy,
+                                  relationship.trust):
+                        self.assertTrue(0 <= value <= 100)
+
+    def test_new_cat(self):
+        with patch.object(Cat, "all_cats", {cat.ID: cat for cat in self.cats}):
+            self.stranger.create_relationships_new_cat()
+        self.assertEqual(set(self.stranger.relationships), {cat.ID for cat in self.cats[:4]})
+        self.assertIs(self.kit.relationships[self.stranger.ID].cat_to, self.stranger)
+
+
 class TestUpdateMentor(unittest.TestCase):
     def test_exile_apprentice(self):
         # given
@@ -391,3 +467,84 @@ class TestUpdateMentor(unittest.TestCase):
         self.assertFalse(app.ID in mentor.apprentice)
         self.assertTrue(app.ID in mentor.former_apprentices)
         self.assertIsNone(app.mentor)
+
+
+@patch("scripts.cat.cats.generate_sprite", side_effect=lambda cat: object())
+class TestSprite(unittest.TestCase):
+
+    def test_sprite_kept(self, generate_sprite):
+        test_cat = Cat(moons=20)
+        sprite = test_cat.sprite
+        self.assertIs(test_cat.sprite, sprite)
+        self.assertEqual(generate_sprite.call_count, 1)
+
+    def test_sprite_made_again_on_change(self, generate_sprite):
+        test_cat = Cat(moons=20)
+        sprite = test_cat.sprite
+
+        test_cat.pelt.accessory = "MAPLE LEAF"
+        new_sprite = test_cat.sprite
+        self.assertIsNot(new_sprite, sprite)
+
+        test_cat.pelt.scars.append("ONE")
+        self.assertIsNot(test_cat.sprite, new_sprite)
+
+        sprite = test_cat.sprite
+        test_cat.dead = True
+        self.assertIsNot(test_cat.sprite, sprite)
+        self.assertEqual(generate_sprite.call_count, 4)
+
+    def test_faded_cat_keeps_sprite(self, generate_sprite):
+        test_cat = Cat(moons=20)
+        test_cat.faded = True
+        test_cat.sprite = "faded"
+        self.assertEqual(test_cat.sprite, "faded")
+        generate_sprite.assert_not_called()
+
+    def test_only_recent_sprites_kept(self, generate_sprite):
+        cats = [Cat(moons=20) for _ in range(3)]
+        config = dict(game.config["cat_sprites"], max_kept_sprites=2)
+        with patch.dict(game.config, {"cat_sprites": config}), patch.dict(Cat.sprites_kept, clear=True):
+            first_sprite = cats[0].sprite
+            cats[1].sprite
+            cats[0].sprite
+            cats[2].sprite
+            # cats[1] was shown the longest ago
+            self.assertNotIn(cats[1].ID, Cat.sprites_kept)
+            self.assertIs(cats[0].sprite, first_sprite)
+            self.assertEqual(list(Cat.sprites_kept), [cats[2].ID, cats[0].ID])
+        self.assertEqual(generate_sprite.call_count, 3)
+
+    def test_removed_cat_sprite_let_go(self, generate_sprite):
+        test_cat = Cat(moons=20)
+        sprite = test_cat.sprite
+        self.assertIs(Cat.sprites_kept[test_cat.ID][1], sprite)
+
+        Cat.forget_sprite(test_cat.ID)
+        self.assertNotIn(test_cat.ID, Cat.sprites_kept)
+        self.assertIsNot(test_cat.sprite, sprite)
+
+
+class TestSettingsSnapshot(unittest.TestCase):
+
+    def test_snapshot_follows_settings(self):
+        shaders = game.settings["shaders"]
+        try:
+            game.switch_setting("shaders")
+            self.assertEqual(game.snapshot.shaders, game.settings["shaders"])
+            self.assertNotEqual(game.snapshot.shaders, shaders)
+        finally:
+            game.settings["shaders"] = shaders
+            game.refresh_snapshot()
+
+    def test_injected_first_cousin_setting(self):
+        old_snapshot = game.snapshot
+        cat1 = Cat(moons=20)
+        cat2 = Cat(moons=20)
+        try:
+            game.snapshot = replace(old_snapshot, first_cousin_mates=True)
+            with patch.object(Cat, "is_related", return_value=False) as is_related:
+                cat1.is_potential_mate(cat2)
+            is_related.assert_called_with(cat2, True)
+        finally:
+            game.snapshot = old_snapshot
@@ -0,0 +1,87 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.cat.cats import Cat
+from scripts.conditions import ConditionStore, condition_store
+
+
+class TestConditionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.clan_dir = tempfile.mkdtemp()
+        self.cats = [Cat(), Cat(), Cat()]
+        for cat in self.cats:
+            Cat.all_cats[cat.ID] = cat
+
+    def tearDown(self):
+        for cat in self.cats:
+            Cat.all_cats.pop(cat.ID, None)
+        shutil.rmtree(self.clan_dir)
+
+    def get_cats(self, *kinds):
+        # Only the cats of this test, in case others are left over.
+        return [cat for cat in condition_store.get_cats(*kinds) if cat in self.cats]
+
+    def test_index_follows_conditions(self):
+        sick_cat, hurt_cat, healthy_cat = self.cats
+        sick_cat.illnesses["fleas"] = {"severity": "minor"}
+        hurt_cat.injuries = {"sprain": {"severity": "major"}}
+        self.assertEqual(self.get_cats("illnesses"), [sick_cat])
+        self.assertEqual(self.get_cats("illnesses", "injuries"), [sick_cat, hurt_cat])
+        self.assertNotIn(healthy_cat, condition_store.get_cats())
+
+        sick_cat.illnesses.pop("fleas")
+        self.assertEqual(self.get_cats("illnesses"), [])
+
+        hurt_cat.dead = True
+        self.assertEqual(self.get_cats("injuries"), [])
+
+    def test_removed_cat(self):
+        sick_cat, other_cat, _ = self.cats
+        sick_cat.illnesses["fleas"] = {"severity": "minor"}
+        condition_store.add_contact(sick_cat, other_cat)
+
+        condition_store.remove(sick_cat.ID)
+        self.assertNotIn(sick_cat.ID, condition_store.index["illnesses"])
+        self.assertNotIn(sick_cat.ID, condition_store.contacts)
+        self.assertNotIn(sick_cat.ID, condition_store.get_contacts(other_cat.ID))
+
+    def test_save_and_load(self):
+        self.cats[0].permanent_condition["one bad eye"] = {"severity": "minor", "born_with": True}
+        condition_store.clear()
+        condition_store.save(self.clan_dir)
+
+        file_path = os.path.join(self.clan_dir, ConditionStore.FILE_NAME)
+        with open(file_path, 'r') as read_file:
+            saved = ujson.loads(read_file.read())
+        self.assertEqual(saved[self.cats[0].ID], {"permanent conditions": {
+            "one bad eye": {"severity": "minor", "born_with": True}}})
+        self.assertNotIn(self.cats[1].ID, saved)
+
+        # Nothing changed, so nothing is written.
+        os.remove(file_path)
+        condition_store.save(self.clan_dir)
+        self.assertFalse(os.path.exists(file_path))
+
+    def test_load_old_condition_files(self):
+        old_dir = os.path.join(self.clan_dir, "conditions")
+        os.makedirs(old_dir)
+        with open(os.path.join(old_dir, self.cats[1].ID + "_conditions.json"), 'w') as write_file:
+            write_file.write(ujson.dumps({"illnesses": {"running nose": {"severity": "minor"}}}))
+
+        condition_store.load(self.clan_dir)
+        for cat in self.cats:
+            cat.load_conditions()
+        self.assertEqual(list(self.cats[1].illnesses), ["running nose"])
+        self.assertEqual(self.get_cats(), [self.cats[1]])
+
+        condition_store.save(self.clan_dir)
+        self.assertEqual(os.listdir(old_dir), [])
+        self.assertTrue(os.path.exists(os.path.join(self.clan_dir, ConditionStore.FILE_NAME)))
@@ -0,0 +1,41 @@
+import unittest
+import os
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.events_module.generate_events import GenerateEvents
+
+
+class TestDeathReactions(unittest.TestCase):
+
+    def setUp(self):
+        GenerateEvents.death_reactions.clear()
+        GenerateEvents.loaded_death_reactions.clear()
+        GenerateEvents.possible_death_reaction_lists.clear()
+
+    def test_general_and_trait_reactions(self):
+        general = GenerateEvents.get_death_reaction_dicts("general", "platonic")
+        reactions = GenerateEvents.possible_death_reactions("general", "platonic", "loving", "body")
+        expected = general["general"]["body"] + general.get("loving", {}).get("body", [])
+        self.assertEqual(list(reactions), expected)
+
+    def test_family_reactions(self):
+        general = GenerateEvents.get_death_reaction_dicts("general", "platonic")
+        parent = GenerateEvents.get_death_reaction_dicts("parent", "platonic")
+        reactions = GenerateEvents.possible_death_reactions("parent", "platonic", "troublesome", "no_body")
+        for text in general["general"]["no_body"] + parent["general"]["no_body"]:
+            self.assertIn(text, reactions)
+
+    def test_no_family_romance(self):
+        self.assertEqual(GenerateEvents.possible_death_reactions("parent", "romantic", "loving", "body"),
+                         GenerateEvents.possible_death_reactions("general", "romantic", "loving", "body"))
+
+    def test_files_read_once(self):
+        with patch.object(GenerateEvents, "get_death_reaction_dicts",
+                          wraps=GenerateEvents.get_death_reaction_dicts) as get_dicts:
+            for trait in ("loving", "troublesome", "calm"):
+                for body_status in ("body", "no_body"):
+                    GenerateEvents.possible_death_reactions("sibling", "trust", trait, body_status)
+            self.assertEqual(get_dicts.call_count, 2)
@@ -0,0 +1,149 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.event_class import Single_Event
+from scripts.game_structure import save_archive
+from scripts.game_structure.event_history import EventHistory
+from scripts.game_structure.save_archive import DATABASE_NAME, get_archive, pack_clan
+from scripts.game_structure.save_database import SaveDatabase
+from scripts.game_structure.save_session import SaveSession
+
+
+class TestEventHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.clan_dir = os.path.join(self.dir, "Test")
+        self.history = EventHistory()
+        self.history.new_clan(self.clan_dir)
+        self.history.add_moon(1, [Single_Event("Firekit was born.", "birth_death", ["1"]),
+                                  Single_Event("Brambleclaw hunted.", "misc", ["2"])])
+        self.history.add_moon(2, [Single_Event("Firekit got sick.", "health", ["1"])])
+        self.save(self.history)
+
+    def tearDown(self):
+        SaveSession.active = None
+        shutil.rmtree(self.dir)
+
+    def save(self, history):
+        with SaveSession(os.path.join(self.dir, "staging")):
+            history.save()
+
+    def reload(self, current_moon):
+        history = EventHistory()
+        history.load(self.clan_dir, current_moon)
+        return history
+
+    def test_get_moon(self):
+        history = self.reload(3)
+        self.assertEqual(history.get_moons(), [1, 2])
+        self.assertEqual([ev.text for ev in history.get_moon(1)], ["Firekit was born.", "Brambleclaw hunted."])
+        self.assertEqual(history.get_moon(2)[0].types, ["health"])
+        self.assertEqual(history.get_moon(5), [])
+
+    def test_index_by_type_and_cat(self):
+        history = self.reload(3)
+        self.assertEqual(history.get_moons("health"), [2])
+        self.assertEqual([(moon, ev.text) for moon, ev in history.get_cat_events("1")],
+                         [(1, "Firekit was born."), (2, "Firekit got sick.")])
+        self.assertEqual(history.get_cat_events("5"), [])
+
+    def test_save_only_writes_new_moons(self):
+        history = self.reload(3)
+        history.get_cat_events("2")
+        history.add_moon(3, [Single_Event("Brambleclaw became deputy.", "ceremony", ["2"])])
+        # Not saved until the Clan is, but still visible.
+        self.assertEqual(history.get_moons(), [1, 2, 3])
+        self.assertEqual(len(history.get_cat_events("2")), 2)
+
+        with patch.object(SaveSession, "write", autospec=True, side_effect=SaveSession.write) as write:
+            self.save(history)
+        self.assertEqual([call.args[1] for call in write.call_args_list], [history.moon_path(3)])
+        self.assertEqual(history.pending, [])
+        self.assertEqual(history.get_moons("ceremony"), [3])
+        self.assertEqual(self.reload(4).get_moons("ceremony"), [3])
+
+    def test_failed_save_keeps_moons_pending(self):
+        history = self.reload(3)
+        history.add_moon(3, [Single_Event("Brambleclaw became deputy.", "ceremony", ["2"])])
+        with self.assertRaises(RuntimeError):
+            with SaveSession(os.path.join(self.dir, "staging")):
+                history.save()
+                raise RuntimeError("the save failed")
+        self.assertEqual(self.reload(4).get_moons(), [1, 2])
+
+        self.assertEqual(len(history.pending), 1)
+        self.save(history)
+        self.assertEqual(self.reload(4).get_moons(), [1, 2, 3])
+
+    def test_unsaved_moons_are_cut_off(self):
+        # The history has the end of moon 2 in it, but the Clan itself was saved while still on moon 2.
+        history = self.reload(2)
+        self.assertEqual(history.get_moons(), [1])
+        self.assertEqual(len(history.get_cat_events("1")), 1)
+
+        self.save(history)
+        self.assertFalse(os.path.exists(history.moon_path(2)))
+
+    def test_old_log_is_moved(self):
+        shutil.rmtree(os.path.join(self.clan_dir, EventHistory.FOLDER))
+        with open(os.path.join(self.clan_dir, EventHistory.OLD_LOG_FILE), 'wb') as write_file:
+            write_file.write(b'{"moon": 1, "text": "Firekit was born.", "types": [], "cats_involved": ["1"]}\n')
+            write_file.write(b'{"moon": 3, "text": "Half')
+
+        history = self.reload(4)
+        self.assertEqual([ev.text for ev in history.get_moon(1)], ["Firekit was born."])
+        self.save(history)
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, EventHistory.OLD_LOG_FILE)))
+        self.assertEqual(self.reload(4).get_moons(), [1])
+
+    def test_new_clan_drops_old_moons(self):
+        self.history.new_clan(self.clan_dir)
+        self.history.add_moon(1, [Single_Event("Leafkit was born.", "birth_death", ["7"])])
+        self.save(self.history)
+        history = self.reload(3)
+        self.assertEqual(history.get_moons(), [1])
+        self.assertEqual([ev.text for ev in history.get_moon(1)], ["Leafkit was born."])
+        self.assertEqual(history.get_cat_events("1"), [])
+
+
+class TestEventHistoryInDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.save_dir = os.path.join(self.dir, "saves")
+        self.clan_dir = os.path.join(self.save_dir, "Test")
+        self.patcher = patch("scripts.game_structure.save_archive.get_save_dir", return_value=self.save_dir)
+        self.patcher.start()
+        os.makedirs(self.clan_dir)
+        with open(os.path.join(self.clan_dir, "clan_cats.json"), 'w') as write_file:
+            write_file.write(ujson.dumps([{"ID": "1"}]))
+        pack_clan("Test", "database")
+
+    def tearDown(self):
+        self.patcher.stop()
+        for clan_dir in list(save_archive._open_archives):
+            save_archive.forget_archive(clan_dir)
+        SaveSession.active = None
+        shutil.rmtree(self.dir)
+
+    def test_moons_saved_in_database(self):
+        history = EventHistory()
+        history.load(self.clan_dir, 1)
+        history.add_moon(1, [Single_Event("Firekit was born.", "birth_death", ["1"])])
+        with SaveSession(os.path.join(self.dir, "staging")):
+            history.save()
+
+        self.assertIsInstance(get_archive(self.clan_dir), SaveDatabase)
+        self.assertEqual(os.listdir(self.clan_dir), [DATABASE_NAME])
+        history = EventHistory()
+        history.load(self.clan_dir, 2)
+        self.assertEqual([(moon, ev.text) for moon, ev in history.get_cat_events("1")], [(1, "Firekit was born.")])
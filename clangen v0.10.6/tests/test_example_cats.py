@@ -0,0 +1,80 @@
+import unittest
+import os
+import threading
+import time
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat, make_example_cats
+from scripts.cat.example_cats import ExampleCatPool
+from scripts.conditions import condition_store
+from scripts.game_structure.state_lock import state_lock
+
+
+class TestExampleCatPool(unittest.TestCase):
+
+    def setUp(self):
+        # Patched for the whole test, since cats are still being made after the test is done.
+        self.patcher = patch("scripts.cat.cats.generate_sprite", return_value="sprite")
+        self.patcher.start()
+        self.pool = ExampleCatPool(size=2)
+
+    def tearDown(self):
+        self.pool.stop()
+        self.patcher.stop()
+
+    def test_take(self):
+        batch = self.pool.take()
+        self.assertEqual(len(batch), 12)
+        for cat in batch:
+            self.assertIn(cat.ID, Cat.all_cats)
+            self.assertEqual(Cat.sprites_kept[cat.ID][1], "sprite")
+
+    def test_pool_fills_up(self):
+        first = self.pool.take()
+        self.pool.thread.join()
+        self.assertEqual(self.pool.batches.qsize(), 2)
+        second = self.pool.take()
+        self.assertFalse(set(cat.ID for cat in first) & set(cat.ID for cat in second))
+
+    def test_stop_removes_unused_cats(self):
+        self.pool.take()
+        self.pool.thread.join()
+        unused = [cat.ID for batch in list(self.pool.batches.queue) for cat in batch]
+        self.pool.stop()
+        self.assertEqual(len(unused), 24)
+        for cat_id in unused:
+            self.assertNotIn(cat_id, Cat.all_cats)
+            self.assertNotIn(cat_id, Cat.sprites_kept)
+            for cat_ids in condition_store.index.values():
+                self.assertNotIn(cat_id, cat_ids)
+
+    def test_cats_made_with_state_lock(self):
+        writing = []
+
+        def checked_make_example_cats():
+            writing.append(state_lock.writer is threading.current_thread())
+            return make_example_cats()
+
+        with patch("scripts.cat.example_cats.make_example_cats", side_effect=checked_make_example_cats):
+            self.pool.start()
+            self.pool.thread.join()
+        self.assertEqual(writing, [True, True])
+
+    def test_take_waits_for_batch_being_made(self):
+        made_on = []
+
+        def slow_make_example_cats():
+            made_on.append(threading.current_thread())
+            time.sleep(0.2)
+            return make_example_cats()
+
+        with patch("scripts.cat.example_cats.make_example_cats", side_effect=slow_make_example_cats):
+            self.pool.start()
+            while not made_on:
+                time.sleep(0.01)
+            self.assertEqual(len(self.pool.take()), 12)
+            self.pool.stop()
+        self.assertNotIn(threading.current_thread(), made_on)
@@ -1,4 +1,6 @@
 import unittest
+from unittest.mock import patch
+
 import ujson
 from scripts.cat.cats import Cat
 from scripts.cat.skills import Skill, SkillPath
@@ -420,3 +422,30 @@ class FreshkillPile(unittest.TestCase):
         self.assertEqual(freshkill_pile.nutrition_info[injured_cat.ID].percentage, 100)
         self.assertEqual(freshkill_pile.nutrition_info[sick_cat.ID].percentage, 100)
         self.assertLess(freshkill_pile.nutrition_info[healthy_cat.ID].percentage, 70)
+
+    def test_feeding_large_clan(self) -> None:
+        # given
+        cats = []
+        for i in range(1000):
+            cat = Cat()
+            cat.status = ["warrior", "apprentice", "elder", "kitten"][i % 4]
+            cat.moons = i % 120
+            cats.append(cat)
+        freshkill_pile = Freshkill_Pile()
+        freshkill_pile.add_freshkill(2000)
+
+        # when
+        try:
+            with patch.object(Freshkill_Pile, "amount_food_needed", autospec=True,
+                              side_effect=Freshkill_Pile.amount_food_needed) as amount_food_needed:
+                freshkill_pile.feed_cats(cats)
+        finally:
+            for cat in cats:
+                Cat.all_cats.pop(cat.ID, None)
+                if cat in Cat.all_cats_list:
+                    Cat.all_cats_list.remove(cat)
+
+        # then
+        # how much food is needed is worked out per group, not for every cat
+        self.assertLess(amount_food_needed.call_count, 20)
+        self.assertEqual(len(freshkill_pile.nutrition_info), 1000)
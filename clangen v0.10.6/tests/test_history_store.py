@@ -0,0 +1,58 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.history import HistoryStore
+from scripts.game_structure.game_essentials import game
+
+
+class TestHistoryStore(unittest.TestCase):
+
+    def setUp(self):
+        self.old_clan_list = game.switches['clan_list']
+        game.switches['clan_list'] = ["HistoryStoreTest"]
+        self.history_dir = tempfile.mkdtemp()
+        self.store = HistoryStore(max_cached=2)
+        self.cats = [Cat(), Cat(), Cat()]
+
+    def tearDown(self):
+        game.switches['clan_list'] = self.old_clan_list
+        shutil.rmtree(self.history_dir)
+
+    def test_loaded_once(self):
+        history = self.store.get(self.cats[0])
+        self.assertIs(self.store.get(self.cats[0]), history)
+        self.assertFalse(self.store.is_changed(self.cats[0].ID))
+
+    def test_only_changed_histories_are_saved(self):
+        self.store.get(self.cats[0])
+        self.store.get(self.cats[1]).beginning = {"clan_born": True, "moon": 3}
+        self.store.save(self.history_dir)
+        self.assertEqual(os.listdir(self.history_dir), [self.cats[1].ID + "_history.json"])
+        self.assertFalse(self.store.is_changed(self.cats[1].ID))
+
+        # Nothing changed since, so nothing is written.
+        os.remove(os.path.join(self.history_dir, self.cats[1].ID + "_history.json"))
+        self.store.save(self.history_dir)
+        self.assertEqual(os.listdir(self.history_dir), [])
+
+    def test_cache_is_bounded(self):
+        for cat in self.cats:
+            self.store.get(cat)
+        self.assertEqual(list(self.store.cache), [self.cats[1].ID, self.cats[2].ID])
+
+    def test_changed_histories_are_kept(self):
+        self.store.get(self.cats[0]).died_by.append({"involved": None, "text": "died", "moon": 1})
+        self.store.get(self.cats[1])
+        self.store.get(self.cats[2])
+        self.assertIn(self.cats[0].ID, self.store.cache)
+
+        self.store.save(self.history_dir)
+        self.assertEqual(len(self.store.cache), 2)
+        self.assertNotIn(self.cats[1].ID, self.store.cache)
+        self.assertEqual(os.listdir(self.history_dir), [self.cats[0].ID + "_history.json"])
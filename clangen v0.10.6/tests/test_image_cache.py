@@ -0,0 +1,62 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+from scripts.game_structure.image_cache import ImageCache
+
+
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.image_dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.image_dir, f"{i}.png")
+            pygame.image.save(pygame.Surface((10, 10), pygame.SRCALPHA), path)
+            self.paths.append(path)
+        # Room for two of the images.
+        image_size = ImageCache.get_surface_size(pygame.image.load(self.paths[0]))
+        self.cache = ImageCache(memory_budget=image_size * 2)
+
+    def tearDown(self):
+        shutil.rmtree(self.image_dir)
+
+    def test_loaded_once(self):
+        image = self.cache.load(self.paths[0])
+        self.assertIs(self.cache.load(self.paths[0]), image)
+
+    def test_least_recently_used_dropped(self):
+        self.cache.load(self.paths[0])
+        self.cache.load(self.paths[1])
+        self.cache.load(self.paths[0])
+        self.cache.load(self.paths[2])
+        self.assertEqual(list(self.cache.images), [self.paths[0], self.paths[2]])
+        self.assertLessEqual(self.cache.memory_used, self.cache.memory_budget)
+
+    def test_smaller_budget_drops_images(self):
+        for path in self.paths[:2]:
+            self.cache.load(path)
+        self.cache.set_memory_budget(self.cache.memory_budget // 2)
+        self.assertEqual(list(self.cache.images), [self.paths[1]])
+        self.assertLessEqual(self.cache.memory_used, self.cache.memory_budget)
+
+    def test_missing_files_remembered(self):
+        missing_path = os.path.join(self.image_dir, "missing.png")
+        self.assertFalse(self.cache.exists(missing_path))
+        pygame.image.save(pygame.Surface((10, 10)), missing_path)
+        self.assertFalse(self.cache.exists(missing_path))
+        self.assertTrue(self.cache.exists(self.paths[0]))
+
+    def test_prefetch(self):
+        self.cache._prefetch(self.paths[:2] + [os.path.join(self.image_dir, "missing.png")])
+        self.assertEqual(list(self.cache.images), self.paths[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -214,3 +214,20 @@ class SingleInteractionCatConstraints(unittest.TestCase):
 
             self.assertTrue(cats_fulfill_single_interaction_constraints(clan, clan, clan_to_all, game_mode))
             self.assertTrue(cats_fulfill_single_interaction_constraints(clan, clan, all_to_clan, game_mode))
+
+
+class UsedInteractions(unittest.TestCase):
+    def test_kept_per_relationship(self):
+        # given
+        cat1 = Cat()
+        cat2 = Cat()
+        rel1 = Relationship(cat1, cat2)
+        rel2 = Relationship.new_unchecked(cat2, cat1)
+
+        # when
+        rel1.used_interaction_ids.append("test")
+        rel2.used_interaction_ids = ["other"]
+
+        # then
+        self.assertEqual(rel1.used_interaction_ids, ["test"])
+        self.assertEqual(rel2.used_interaction_ids, ["other"])
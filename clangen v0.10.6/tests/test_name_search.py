@@ -0,0 +1,54 @@
+import unittest
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.names import name_index
+
+
+class TestNameSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = name_index
+        self.index.clear()
+        self.cat1 = Cat(prefix="Bramble", suffix="claw", status="warrior")
+        self.cat2 = Cat(prefix="Fire", suffix="heart", status="warrior")
+        self.cat3 = Cat(prefix="Bramble", suffix="kit", status="kitten")
+        self.cats = [self.cat1, self.cat2, self.cat3]
+
+    def test_search_matches_substring(self):
+        self.assertEqual(self.index.search(self.cats, "bram"), [self.cat1, self.cat3])
+        self.assertEqual(self.index.search(self.cats, "RT"), [self.cat2])
+        self.assertEqual(self.index.search(self.cats, "e"), self.cats)
+        self.assertEqual(self.index.search(self.cats, "starclan"), [])
+
+    def test_search_keeps_order(self):
+        reverse = list(reversed(self.cats))
+        self.assertEqual(self.index.search(reverse, "bramble"), [self.cat3, self.cat1])
+
+    def test_search_as_you_type(self):
+        for text, expected in (("b", [self.cat1, self.cat3]),
+                               ("br", [self.cat1, self.cat3]),
+                               ("bra", [self.cat1, self.cat3]),
+                               ("brambl", [self.cat1, self.cat3]),
+                               ("bramblec", [self.cat1]),
+                               ("brambl", [self.cat1, self.cat3])):
+            self.assertEqual(self.index.search(self.cats, text), expected)
+
+    def test_rename_updates_index(self):
+        self.assertEqual(self.index.search(self.cats, "fire"), [self.cat2])
+        self.cat2.name.prefix = "Ash"
+        self.assertEqual(self.index.search(self.cats, "fire"), [])
+        self.assertEqual(self.index.search(self.cats, "ashheart"), [self.cat2])
+
+    def test_status_change_updates_index(self):
+        self.assertEqual(self.index.search(self.cats, "kit"), [self.cat3])
+        self.cat3.status_change("apprentice")
+        self.assertEqual(self.index.search(self.cats, "kit"), [])
+        self.assertEqual(self.index.search(self.cats, "paw"), [self.cat3])
+
+    def test_search_relationships(self):
+        items = [("a", self.cat1), ("b", self.cat2)]
+        self.assertEqual(self.index.search(items, "heart", get_cat=lambda i: i[1]), [("b", self.cat2)])
@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import patch
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.clan import Clan
+from scripts.conditions import condition_store
+from scripts.events_module.outbreak_events import Outbreak_Events
+from scripts.game_structure.game_essentials import game
+
+
+class TestOutbreakEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.old_clan = game.clan
+        game.clan = Clan(name="test")
+        game.clan.game_mode = "expanded"
+        game.clan.current_season = "Leaf-bare"
+
+        # Only the cats made here are in the Clan, so cats left by other tests can't catch the illness instead
+        # or count towards max_sick_fraction.
+        self.patchers = [patch.dict(Cat.all_cats, clear=True), patch.dict(condition_store.contacts, clear=True)]
+        self.patchers += [patch.dict(cat_ids, clear=True) for cat_ids in condition_store.index.values()]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        game.clan = self.old_clan
+
+    def make_cats(self, amount, status):
+        cats = [Cat(status=status, moons=20 if status != "kitten" else 3) for _ in range(amount)]
+        for cat in cats:
+            Cat.all_cats[cat.ID] = cat
+        return cats
+
+    def test_kittencough_stays_in_nursery(self):
+        sick_kit = self.make_cats(1, "kitten")[0]
+        sick_kit.get_ill("kittencough")
+        self.make_cats(4, "kitten")
+        self.make_cats(10, "warrior")
+
+        dens = Outbreak_Events.get_healthy_cats_by_den()
+        self.assertNotIn(sick_kit.ID, dens["nursery"])
+        for _ in range(20):
+            for infected_cat in Outbreak_Events.choose_infected_cats(sick_kit, "kittencough", dens):
+                self.assertEqual(Outbreak_Events.get_den(infected_cat), "nursery")
+
+    def test_contacts_are_infected_first(self):
+        sick_cat = self.make_cats(1, "warrior")[0]
+        sick_cat.get_ill("greencough")
+        warriors = self.make_cats(10, "warrior")
+        for warrior in warriors[:2]:
+            condition_store.add_contact(sick_cat, warrior)
+
+        dens = Outbreak_Events.get_healthy_cats_by_den()
+        config = dict(game.config["outbreaks"], same_den_weight=0, other_den_weight=0)
+        with patch.dict(game.config, {"outbreaks": config}):
+            infected_cats = Outbreak_Events.choose_infected_cats(sick_cat, "greencough", dens)
+        self.assertEqual(sorted(cat.ID for cat in infected_cats), sorted(cat.ID for cat in warriors[:2]))
+
+    def test_outbreak_spreads(self):
+        sick_cat = self.make_cats(1, "warrior")[0]
+        sick_cat.get_ill("greencough")
+        warriors = self.make_cats(20, "warrior")
+
+        with patch.object(Outbreak_Events, "roll_outbreak", return_value="greencough"):
+            Outbreak_Events.handle_outbreaks()
+        infected_cats = [cat for cat in warriors if "greencough" in cat.illnesses]
+        self.assertGreaterEqual(len(infected_cats), 2)
+        self.assertFalse(condition_store.contacts)
+
+    def test_no_outbreaks_in_classic(self):
+        game.clan.game_mode = "classic"
+        sick_cat = self.make_cats(1, "warrior")[0]
+        sick_cat.illnesses["greencough"] = {"severity": "major", "infectiousness": 1}
+        warriors = self.make_cats(5, "warrior")
+
+        with patch.object(Outbreak_Events, "roll_outbreak", return_value="greencough"):
+            Outbreak_Events.handle_outbreaks()
+        self.assertFalse(any(cat.illnesses for cat in warriors))
@@ -0,0 +1,73 @@
+import unittest
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.roster import CatGroup, CatIDAllocator
+from scripts.clan import Clan
+
+
+class TestCatGroup(unittest.TestCase):
+
+    def test_keeps_order(self):
+        group = CatGroup(["3", "1"])
+        group.append("2")
+        group.append("3")
+        self.assertEqual(list(group), ["3", "1", "2"])
+        self.assertEqual(list(reversed(group)), ["2", "1", "3"])
+        self.assertEqual(",".join(group), "3,1,2")
+        self.assertEqual(len(group), 3)
+        self.assertEqual(group[-1], "2")
+
+    def test_remove(self):
+        group = CatGroup(["1", "2"])
+        self.assertIn("1", group)
+        group.remove("1")
+        self.assertNotIn("1", group)
+        with self.assertRaises(ValueError):
+            group.remove("1")
+        group.discard("1")
+        self.assertEqual(group, ["2"])
+
+
+class TestCatIDAllocator(unittest.TestCase):
+
+    def test_allocate(self):
+        allocator = CatIDAllocator()
+        self.assertEqual(allocator.allocate(), "0")
+        allocator.reserve("5")
+        allocator.reserve("2")
+        allocator.reserve("not a number")
+        self.assertEqual(allocator.allocate({"6": None}, CatGroup(["7"])), "8")
+        allocator.skip_to(4)
+        self.assertEqual(allocator.allocate(), "9")
+        allocator.skip_to(20)
+        self.assertEqual(allocator.allocate(), "20")
+
+    def test_new_cats_skip_used_ids(self):
+        loaded_id = str(Cat.id_allocator.next_id + 100)
+        Cat(ID=loaded_id)
+        self.assertEqual(Cat().ID, str(int(loaded_id) + 1))
+
+
+class TestClanGroups(unittest.TestCase):
+
+    def test_groups_belong_to_the_clan(self):
+        clan = Clan()
+        clan.clan_cats.append("1")
+        self.assertNotIn("1", Clan().clan_cats)
+        self.assertEqual(len(clan.faded_ids), 0)
+
+    def test_remove_cat(self):
+        clan = Clan("Test", self_run_init_functions=False)
+        cat = Cat(status="warrior")
+        cat.dead = True
+        clan.add_cat(cat)
+        clan.add_to_starclan(cat)
+        clan.add_to_starclan(cat)
+        self.assertEqual(list(clan.starclan_cats), [cat.ID])
+        clan.remove_cat(cat.ID)
+        self.assertNotIn(cat.ID, clan.clan_cats)
+        self.assertNotIn(cat.ID, clan.starclan_cats)
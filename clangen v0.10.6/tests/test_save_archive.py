@@ -0,0 +1,93 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.game_structure import save_archive
+from scripts.game_structure.game_essentials import Game
+from scripts.game_structure.save_archive import ARCHIVE_NAME, SaveArchive, list_save_dir, pack_clan, \
+    read_save_file, save_file_exists, unpack_clan
+from scripts.game_structure.save_session import SaveSession
+
+
+class TestSaveArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.save_dir = os.path.join(self.dir, "saves")
+        self.staging = os.path.join(self.dir, "staging")
+        self.clan_dir = os.path.join(self.save_dir, "Test")
+        self.archive_path = os.path.join(self.clan_dir, ARCHIVE_NAME)
+        self.patcher = patch("scripts.game_structure.save_archive.get_save_dir", return_value=self.save_dir)
+        self.patcher.start()
+
+        Game.safe_save(os.path.join(self.save_dir, "Testclan.json"), {"clanname": "Test"})
+        Game.safe_save(os.path.join(self.clan_dir, "clan_cats.json"), [{"ID": "1"}, {"ID": "2"}])
+        Game.safe_save(os.path.join(self.clan_dir, "relationships", "1_relations.json"), [])
+        Game.safe_save(os.path.join(self.clan_dir, "relationships", "2_relations.json"), [])
+        Game.safe_save(os.path.join(self.clan_dir, "clan_settings.json"), {})
+
+    def tearDown(self):
+        self.patcher.stop()
+        save_archive.new_save_format = "files"
+        save_archive._open_archives.clear()
+        SaveSession.active = None
+        shutil.rmtree(self.dir)
+
+    def read(self, path):
+        return ujson.loads(read_save_file(path))
+
+    def test_round_trip(self):
+        files = {"a": SaveArchive.compress(b"first"), "b/c": SaveArchive.compress("second \u00e9".encode("utf-8"))}
+        SaveArchive.write(self.archive_path, files)
+        archive = SaveArchive(self.archive_path)
+        self.assertEqual(archive.names(), ["a", "b/c"])
+        self.assertEqual(archive.read("b/c"), "second \u00e9")
+        self.assertEqual(archive.read("a"), "first")
+        self.assertEqual(archive.folders, {"b/"})
+
+    def test_pack_and_unpack(self):
+        self.assertEqual(pack_clan("Test"), 4)
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, "clan_cats.json")))
+        self.assertTrue(os.path.exists(os.path.join(self.clan_dir, "clan_settings.json")))
+
+        self.assertEqual(self.read(os.path.join(self.save_dir, "Testclan.json")), {"clanname": "Test"})
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "clan_cats.json"))[1], {"ID": "2"})
+        self.assertTrue(save_file_exists(os.path.join(self.clan_dir, "relationships")))
+        self.assertFalse(save_file_exists(os.path.join(self.clan_dir, "history")))
+        self.assertEqual(sorted(list_save_dir(os.path.join(self.clan_dir, "relationships"))),
+                         ["1_relations.json", "2_relations.json"])
+
+        self.assertEqual(unpack_clan("Test"), 4)
+        self.assertFalse(os.path.exists(self.archive_path))
+        with open(os.path.join(self.clan_dir, "clan_cats.json"), 'r') as read_file:
+            self.assertEqual(ujson.loads(read_file.read())[0], {"ID": "1"})
+
+    def test_session_saves_into_archive(self):
+        pack_clan("Test")
+        with SaveSession(self.staging):
+            Game.safe_save(os.path.join(self.clan_dir, "clan_cats.json"), [{"ID": "3"}])
+            Game.safe_remove(os.path.join(self.clan_dir, "relationships", "2_relations.json"))
+            Game.safe_save(os.path.join(self.clan_dir, "clan_settings.json"), {"new": True})
+
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "clan_cats.json")), [{"ID": "3"}])
+        self.assertEqual(list_save_dir(os.path.join(self.clan_dir, "relationships")), ["1_relations.json"])
+        self.assertEqual(self.read(os.path.join(self.save_dir, "Testclan.json")), {"clanname": "Test"})
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, "clan_cats.json")))
+        # Files that don't go in the archive are still saved as they were.
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "clan_settings.json")), {"new": True})
+
+    def test_folder_save_converted(self):
+        save_archive.new_save_format = "archive"
+        Game.safe_save(os.path.join(self.clan_dir, "history", "1_history.json"), {"beginning": {}})
+
+        self.assertTrue(os.path.exists(self.archive_path))
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, "relationships", "1_relations.json")))
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "history", "1_history.json")), {"beginning": {}})
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "relationships", "2_relations.json")), [])
@@ -0,0 +1,125 @@
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.game_structure import save_archive
+from scripts.game_structure.game_essentials import Game
+from scripts.game_structure.save_archive import DATABASE_NAME, get_archive, list_save_dir, pack_clan, \
+    read_save_file, save_file_exists, unpack_clan
+from scripts.game_structure.save_database import SaveDatabase
+from scripts.game_structure.save_session import SaveSession
+
+
+class TestSaveDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.save_dir = os.path.join(self.dir, "saves")
+        self.staging = os.path.join(self.dir, "staging")
+        self.clan_dir = os.path.join(self.save_dir, "Test")
+        self.patcher = patch("scripts.game_structure.save_archive.get_save_dir", return_value=self.save_dir)
+        self.patcher.start()
+
+        Game.safe_save(os.path.join(self.save_dir, "Testclan.json"), {"clanname": "Test"})
+        Game.safe_save(os.path.join(self.clan_dir, "clan_cats.json"), [{"ID": "2"}, {"ID": "1"}])
+        Game.safe_save(os.path.join(self.clan_dir, "conditions.json"), {"1": {"injuries": {}}})
+        Game.safe_save(os.path.join(self.clan_dir, "relationships", "1_relations.json"), [])
+        Game.safe_save(os.path.join(self.clan_dir, "faded_cats", "3.json"), {"ID": "3"})
+
+    def tearDown(self):
+        self.patcher.stop()
+        save_archive.new_save_format = "files"
+        for clan_dir in list(save_archive._open_archives):
+            save_archive.forget_archive(clan_dir)
+        SaveSession.active = None
+        shutil.rmtree(self.dir)
+
+    def read(self, path):
+        return ujson.loads(read_save_file(path))
+
+    def test_pack_and_unpack(self):
+        self.assertEqual(pack_clan("Test", "database"), 5)
+        self.assertIsInstance(get_archive(self.clan_dir), SaveDatabase)
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, "faded_cats")))
+
+        # The cats keep their order.
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "clan_cats.json")), [{"ID": "2"}, {"ID": "1"}])
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "conditions.json")), {"1": {"injuries": {}}})
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "faded_cats", "3.json")), {"ID": "3"})
+        self.assertEqual(self.read(os.path.join(self.save_dir, "Testclan.json")), {"clanname": "Test"})
+        self.assertTrue(save_file_exists(os.path.join(self.clan_dir, "relationships")))
+        self.assertFalse(save_file_exists(os.path.join(self.clan_dir, "history")))
+        self.assertFalse(save_file_exists(os.path.join(self.clan_dir, "faded_cats", "4.json")))
+        self.assertEqual(list_save_dir(os.path.join(self.clan_dir, "relationships")), ["1_relations.json"])
+
+        self.assertEqual(unpack_clan("Test"), 5)
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, DATABASE_NAME)))
+        with open(os.path.join(self.clan_dir, "faded_cats", "3.json"), 'r') as read_file:
+            self.assertEqual(ujson.loads(read_file.read()), {"ID": "3"})
+
+    def test_session_saves_into_database(self):
+        pack_clan("Test", "database")
+        with SaveSession(self.staging):
+            Game.safe_save(os.path.join(self.clan_dir, "clan_cats.json"), [{"ID": "1"}])
+            Game.safe_remove(os.path.join(self.clan_dir, "relationships", "1_relations.json"))
+            Game.safe_save(os.path.join(self.clan_dir, "history", "1_history.json"), {"beginning": {}})
+            # Not written until the session is committed.
+            self.assertEqual(len(self.read(os.path.join(self.clan_dir, "clan_cats.json"))), 2)
+
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "clan_cats.json")), [{"ID": "1"}])
+        self.assertEqual(list_save_dir(os.path.join(self.clan_dir, "relationships")), [])
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "history", "1_history.json")), {"beginning": {}})
+
+    def test_failed_save_keeps_old_save(self):
+        pack_clan("Test", "database")
+        database = get_archive(self.clan_dir)
+        with self.assertRaises(sqlite3.IntegrityError):
+            # The same cat twice, so the transaction fails halfway through.
+            database.write({"faded_cats/3.json": '{"ID": "4"}', "clan_cats.json": '[{"ID": "5"}, {"ID": "5"}]'})
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "faded_cats", "3.json")), {"ID": "3"})
+        self.assertEqual(len(self.read(os.path.join(self.clan_dir, "clan_cats.json"))), 2)
+
+    def test_failed_database_write_keeps_old_save(self):
+        pack_clan("Test", "database")
+        other_file = os.path.join(self.dir, "other.json")
+        with self.assertRaises(sqlite3.IntegrityError):
+            with SaveSession(self.staging):
+                Game.safe_save(other_file, {})
+                Game.safe_save(os.path.join(self.clan_dir, "clan_cats.json"), [{"ID": "5"}, {"ID": "5"}])
+        self.assertFalse(os.path.exists(other_file))
+        self.assertFalse(os.path.exists(self.staging))
+        self.assertEqual(len(self.read(os.path.join(self.clan_dir, "clan_cats.json"))), 2)
+
+    def test_recover_database_write(self):
+        pack_clan("Test", "database")
+        session = SaveSession(self.staging)
+        session.__enter__()
+        Game.safe_save(os.path.join(self.clan_dir, "clan_cats.json"), [{"ID": "1"}])
+        SaveSession.active = None
+        session.pack_archives()
+        # Pretend the game was closed right after the journal was written.
+        journal = {"files": [], "removed": [], "databases": session.database_writes}
+        with open(os.path.join(self.staging, SaveSession.JOURNAL_FILE), 'w') as write_file:
+            write_file.write(ujson.dumps(journal))
+        self.assertEqual(len(self.read(os.path.join(self.clan_dir, "clan_cats.json"))), 2)
+
+        self.assertTrue(SaveSession.recover(self.staging))
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "clan_cats.json")), [{"ID": "1"}])
+        self.assertFalse(os.path.exists(self.staging))
+
+    def test_folder_save_converted(self):
+        save_archive.new_save_format = "database"
+        Game.safe_save(os.path.join(self.clan_dir, "faded_cats", "4.json"), {"ID": "4"})
+
+        self.assertTrue(os.path.exists(os.path.join(self.clan_dir, DATABASE_NAME)))
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, "clan_cats.json")))
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "faded_cats", "4.json")), {"ID": "4"})
+        self.assertEqual(self.read(os.path.join(self.clan_dir, "clan_cats.json"))[0], {"ID": "2"})
@@ -0,0 +1,125 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.game_structure.game_essentials import Game
+from scripts.game_structure.save_session import SaveSession
+
+
+class TestSaveSession(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.staging = os.path.join(self.dir, "staging")
+        self.save_dir = os.path.join(self.dir, "saves")
+        os.makedirs(self.save_dir)
+        self.old_file = os.path.join(self.save_dir, "old.json")
+        Game.safe_save(self.old_file, {"old": True})
+
+    def tearDown(self):
+        SaveSession.active = None
+        shutil.rmtree(self.dir)
+
+    def read(self, path):
+        with open(path, 'r') as read_file:
+            return ujson.loads(read_file.read())
+
+    def write_journal(self, session):
+        # Pretend the game was closed right after the journal was written.
+        journal = {"files": [[name, path, checksum] for path, (name, checksum) in session.files.items()],
+                   "removed": []}
+        with open(os.path.join(self.staging, SaveSession.JOURNAL_FILE), 'w') as write_file:
+            write_file.write(ujson.dumps(journal))
+
+    def test_files_are_written_on_commit(self):
+        new_file = os.path.join(self.save_dir, "cats", "1.json")
+        with SaveSession(self.staging) as session:
+            Game.safe_save(new_file, {"ID": "1"})
+            Game.safe_save(self.old_file, {"old": False})
+            Game.safe_save(new_file, {"ID": "2"})
+            self.assertFalse(os.path.exists(new_file))
+            self.assertTrue(self.read(self.old_file)["old"])
+            self.assertEqual(self.read(session.staged_path(new_file)), {"ID": "2"})
+
+        self.assertEqual(self.read(new_file), {"ID": "2"})
+        self.assertFalse(self.read(self.old_file)["old"])
+        self.assertFalse(os.path.exists(self.staging))
+
+    def test_remove(self):
+        with SaveSession(self.staging):
+            Game.safe_remove(self.old_file)
+            self.assertTrue(os.path.exists(self.old_file))
+        self.assertFalse(os.path.exists(self.old_file))
+
+    def test_failed_save_keeps_old_save(self):
+        with self.assertRaises(KeyError):
+            with SaveSession(self.staging):
+                Game.safe_save(self.old_file, {"old": False})
+                Game.safe_remove(os.path.join(self.save_dir, "old.json"))
+                raise KeyError("something broke")
+
+        self.assertTrue(self.read(self.old_file)["old"])
+        self.assertIsNone(SaveSession.active)
+        self.assertFalse(os.path.exists(self.staging))
+
+    def test_sessions_join(self):
+        with SaveSession(self.staging) as outer:
+            with SaveSession(self.staging) as inner:
+                self.assertIs(inner, outer)
+                Game.safe_save(self.old_file, {"old": False})
+            self.assertTrue(self.read(self.old_file)["old"])
+        self.assertFalse(self.read(self.old_file)["old"])
+
+    def test_recover_committed_save(self):
+        session = SaveSession(self.staging)
+        session.__enter__()
+        Game.safe_save(self.old_file, {"old": False})
+        SaveSession.active = None
+        self.write_journal(session)
+
+        self.assertTrue(SaveSession.recover(self.staging))
+        self.assertFalse(self.read(self.old_file)["old"])
+        self.assertFalse(os.path.exists(self.staging))
+
+    def test_recover_broken_staged_file(self):
+        session = SaveSession(self.staging)
+        session.__enter__()
+        Game.safe_save(self.old_file, {"old": False})
+        SaveSession.active = None
+        # The journal made it to the disk, but the staged file didn't.
+        self.write_journal(session)
+        with open(session.staged_path(self.old_file), 'w') as write_file:
+            write_file.write("")
+
+        self.assertFalse(SaveSession.recover(self.staging))
+        self.assertTrue(self.read(self.old_file)["old"])
+        self.assertFalse(os.path.exists(self.staging))
+
+    def test_commit_does_not_read_back(self):
+        real_open = open
+
+        def checked_open(file, mode="r", *args, **kwargs):
+            self.assertFalse(file.startswith(self.staging) and "w" not in mode, f"read back {file}")
+            return real_open(file, mode, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=checked_open):
+            with SaveSession(self.staging):
+                Game.safe_save(self.old_file, {"old": False})
+        self.assertFalse(self.read(self.old_file)["old"])
+
+    def test_recover_uncommitted_save(self):
+        session = SaveSession(self.staging)
+        session.__enter__()
+        Game.safe_save(self.old_file, {"old": False})
+        SaveSession.active = None
+
+        self.assertFalse(SaveSession.recover(self.staging))
+        self.assertTrue(self.read(self.old_file)["old"])
+        self.assertFalse(os.path.exists(self.staging))
@@ -0,0 +1,85 @@
+import unittest
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.sorting import CatSortIndex
+from scripts.game_structure.game_essentials import game
+
+
+class TestCatSortIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CatSortIndex()
+        self.cats = [Cat(status="warrior", moons=30), Cat(status="kitten", moons=3),
+                     Cat(status="elder", moons=130), Cat(status="apprentice", moons=8)]
+        for cat in self.cats:
+            self.index.add(cat)
+
+    def tearDown(self):
+        for cat in self.cats:
+            Cat.all_cats.pop(cat.ID, None)
+
+    def test_sorted_by_age(self):
+        warrior, kitten, elder, apprentice = self.cats
+        self.assertEqual(self.index.get_sorted("age"), [kitten, apprentice, warrior, elder])
+        self.assertEqual(self.index.get_sorted("reverse_age"), [elder, warrior, apprentice, kitten])
+
+    def test_sorted_by_rank(self):
+        warrior, kitten, elder, apprentice = self.cats
+        self.assertEqual(self.index.get_sorted("rank"), [warrior, apprentice, elder, kitten])
+
+    def test_changed_cats_move(self):
+        # The cats only tell the game's own sort index when they change, so this one is told by hand.
+        warrior, kitten, elder, apprentice = self.cats
+        self.index.get_sorted("age")
+
+        # One cat changing is moved on its own
+        kitten.moons = 200
+        self.index.mark_dirty(kitten.ID)
+        self.assertEqual(self.index.get_sorted("age"), [apprentice, warrior, elder, kitten])
+
+        # and every cat changing sorts the whole order again.
+        for cat in self.cats:
+            cat.moons = 300 - cat.moons
+            self.index.mark_dirty(cat.ID)
+        self.assertEqual(self.index.get_sorted("age"), [kitten, elder, warrior, apprentice])
+
+    def test_ties_stay_in_added_order(self):
+        # As strings, "900010" comes before "90009"
+        first = Cat(ID="90009", status="warrior", moons=30)
+        second = Cat(ID="900010", status="warrior", moons=30)
+        self.cats += [first, second]
+        self.index.add(first)
+        self.index.add(second)
+        self.assertEqual(self.index.get_sorted("age"), [self.cats[1], self.cats[3], self.cats[0], first, second,
+                                                        self.cats[2]])
+
+    def test_added_and_removed_cats(self):
+        warrior, kitten, elder, apprentice = self.cats
+        self.index.get_sorted("age")
+        young_warrior = Cat(status="warrior", moons=15)
+        self.cats.append(young_warrior)
+
+        self.assertEqual(self.index.add(young_warrior, "age"), 2)
+        self.assertEqual(self.index.get_sorted("age"), [kitten, apprentice, young_warrior, warrior, elder])
+        self.index.remove(apprentice.ID)
+        self.assertEqual(self.index.get_sorted("age"), [kitten, young_warrior, warrior, elder])
+
+    def test_sort_cats_keeps_all_cats_list_sorted(self):
+        old_sort_type = game.sort_type
+        game.sort_type = "age"
+        try:
+            Cat.sort_cats()
+            self.cats[1].moons = 250
+            Cat.sort_cats()
+            ages = [Cat.get_adjusted_age(cat) for cat in Cat.all_cats_list]
+            self.assertEqual(ages, sorted(ages))
+        finally:
+            game.sort_type = old_sort_type
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import os
+import threading
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure.state_lock import StateLock, state_lock
+
+
+class TestStateLock(unittest.TestCase):
+
+    def test_reader_waits_for_writer(self):
+        lock = StateLock()
+        order = []
+        started = threading.Event()
+        finish = threading.Event()
+
+        def write():
+            with lock.writing():
+                started.set()
+                finish.wait()
+                order.append("write")
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        started.wait()
+        self.assertTrue(lock.is_changing())
+        finish.set()
+        with lock.reading():
+            order.append("read")
+        thread.join()
+        self.assertEqual(order, ["write", "read"])
+        self.assertFalse(lock.is_changing())
+
+    def test_writer_can_read_and_write_again(self):
+        lock = StateLock()
+        with lock.writing():
+            with lock.reading():
+                with lock.writing():
+                    self.assertFalse(lock.is_changing())
+        self.assertIsNone(lock.writer)
+
+
+class TestRoster(unittest.TestCase):
+
+    def test_roster_is_kept_while_changing(self):
+        cat = Cat()
+        started = threading.Event()
+        finish = threading.Event()
+
+        def timeskip():
+            with state_lock.writing():
+                Cat.all_cats_list.remove(cat)
+                started.set()
+                finish.wait()
+                Cat.all_cats_list.append(cat)
+
+        thread = threading.Thread(target=timeskip)
+        thread.start()
+        started.wait()
+        try:
+            self.assertIn(cat, Cat.get_roster())
+            self.assertEqual(Cat.get_roster_cats([cat.ID, "no such cat"]), [cat])
+        finally:
+            finish.set()
+            thread.join()
+        self.assertEqual(Cat.get_roster(), tuple(Cat.all_cats_list))
+        # The copy isn't kept once the work is done
+        self.assertIsNone(Cat.roster_snapshot)
+
+    def test_screen_switch_waits_for_work(self):
+        started = threading.Event()
+        finish = threading.Event()
+
+        def timeskip():
+            with state_lock.writing():
+                started.set()
+                finish.wait()
+
+        old_screen, old_switch = game.current_screen, game.switches['cur_screen']
+        thread = threading.Thread(target=timeskip)
+        thread.start()
+        started.wait()
+        try:
+            game.switches['cur_screen'] = "list screen"
+            game.update_game()
+            self.assertNotEqual(game.current_screen, "list screen")
+        finally:
+            finish.set()
+            thread.join()
+        game.update_game()
+        self.assertEqual(game.current_screen, "list screen")
+        game.current_screen, game.switches['cur_screen'] = old_screen, old_switch
+        game.switch_screens = False
@@ -0,0 +1,103 @@
+import unittest
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.cat.cats import Cat
+from scripts.cat.names import name_index
+from scripts.cat.sorting import sort_index
+from scripts.clan import clan_class
+from scripts.conditions import condition_store
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure.load_cat import load_cats
+from scripts.game_structure.synthetic_clan import SyntheticClan, clear_cats, preserved_game_state
+
+
+class TestSyntheticClan(unittest.TestCase):
+
+    def setUp(self):
+        # Making a Clan replaces the loaded cats, so they're put back afterwards.
+        state = preserved_game_state()
+        self.dir = state.__enter__()
+        self.addCleanup(state.__exit__, None, None, None)
+
+    def read(self, path):
+        with open(os.path.join(self.dir, path), 'r') as read_file:
+            return ujson.loads(read_file.read())
+
+    def test_make(self):
+        clan = SyntheticClan(100, name="Test", seed=1).make()
+        cats = self.read("Test/clan_cats.json")
+        faded = os.listdir(os.path.join(self.dir, "Test", "faded_cats"))
+
+        self.assertEqual(len(cats) + len(faded), 100)
+        self.assertEqual(len(faded), 10)
+        self.assertEqual(len(clan.faded_ids), 10)
+        # The instructor is dead too
+        self.assertEqual(len([cat for cat in cats if cat["dead"]]), 21)
+        self.assertEqual(len([cat for cat in cats if cat["outside"]]), 10)
+        self.assertTrue(any(cat["parent1"] for cat in cats))
+        self.assertTrue(any(cat["mate"] for cat in cats))
+
+        living = [cat for cat in cats if not cat["dead"]]
+        self.assertEqual(len(os.listdir(os.path.join(self.dir, "Test", "relationships"))), len(living))
+        self.assertTrue(self.read("Test/conditions.json"))
+        self.assertEqual(self.read("Testclan.json")["leader"], clan.leader.ID)
+        self.assertEqual(self.read("Test/history/" + clan.leader.ID + "_history.json")["beginning"]["moon"],
+                         clan.age)
+
+    def test_same_seed_makes_same_clan(self):
+        SyntheticClan(40, name="Test", seed=3).make()
+        cats = self.read("Test/clan_cats.json")
+        with self.assertRaises(FileExistsError):
+            SyntheticClan(40, name="Test", seed=3).make()
+        SyntheticClan(40, name="Test", seed=3, overwrite=True).make()
+        self.assertEqual(self.read("Test/clan_cats.json"), cats)
+
+    def test_load(self):
+        clan = SyntheticClan(40, name="Test", seed=2).make()
+        saved = {cat.ID: cat for cat in Cat.all_cats.values()}
+        clear_cats()
+
+        load_cats()
+        clan_class.load_clan()
+        self.assertEqual(set(Cat.all_cats), set(saved))
+        self.assertEqual(game.clan.leader.ID, clan.leader.ID)
+        self.assertEqual(set(game.clan.faded_ids), set(clan.faded_ids))
+        for cat in Cat.all_cats.values():
+            self.assertEqual(cat.dead, saved[cat.ID].dead)
+            self.assertEqual(set(cat.relationships), set(saved[cat.ID].relationships))
+
+
+class TestPreservedGameState(unittest.TestCase):
+
+    def setUp(self):
+        # The outer one takes the test's own cat back out afterwards.
+        state = preserved_game_state()
+        state.__enter__()
+        self.addCleanup(state.__exit__, None, None, None)
+
+    def test_state_restored(self):
+        cat = Cat(moons=20)
+        name_index.search([cat], "")
+        sort_index.get_sorted("age")
+        cat.illnesses["greencough"] = {}
+        before = list(Cat.all_cats_list)
+
+        with preserved_game_state():
+            SyntheticClan(20, name="Test", seed=1).make()
+            # The made-up cats' IDs start from 1 again, so they're checked by identity
+            self.assertIsNot(Cat.all_cats.get(cat.ID), cat)
+            self.assertFalse(any(ill_cat is cat for ill_cat in condition_store.get_cats("illnesses")))
+
+        self.assertIs(Cat.all_cats[cat.ID], cat)
+        self.assertEqual(Cat.all_cats_list, before)
+        self.assertIn(cat.ID, name_index.names)
+        self.assertEqual(sort_index.get_sorted("age"), before)
+        self.assertTrue(any(ill_cat is cat for ill_cat in condition_store.get_cats("illnesses")))
+        # The cat's conditions still keep the index up to date
+        cat.illnesses.clear()
+        self.assertNotIn(cat.ID, condition_store.index["illnesses"])
@@ -10,7 +10,9 @@ from scripts.utility import (
     get_highest_romantic_relation, 
     get_personality_compatibility, 
     get_amount_of_cats_with_relation_value_towards,
-    get_alive_clan_queens
+    get_alive_clan_queens,
+    get_font,
+    shorten_text_to_fit
 )
 
 class TestPersonalityCompatibility(unittest.TestCase):
@@ -331,3 +333,20 @@ class TestGetQueens(unittest.TestCase):
         # then
         living_cats = [self.test_cat1, self.test_cat2, self.test_cat3, self.test_cat4, self.test_cat5, self.test_cat6]
         self.assertEqual([self.test_cat2.ID], list(get_alive_clan_queens(living_cats)[0].keys()))
+
+
+class TestShortenTextToFit(unittest.TestCase):
+
+    def test_short_names_kept(self):
+        self.assertEqual(shorten_text_to_fit("Firestar", 1000, 30), "Firestar")
+
+    def test_long_names_shortened(self):
+        short_name = shorten_text_to_fit("Firestar" * 10, 200, 30)
+        self.assertTrue(short_name.endswith("..."))
+        self.assertLess(len(short_name), 80)
+        # The same name is shortened the same way the next time.
+        self.assertEqual(shorten_text_to_fit("Firestar" * 10, 200, 30), short_name)
+
+    def test_fonts_opened_once(self):
+        font_type = "resources/fonts/NotoSans-Medium.ttf"
+        self.assertIs(get_font(font_type, 15), get_font(font_type, 15))